@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark A/B Orchestrator
+Runs the Python and Go monitors interleaved on one machine for a fair comparison
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Randomized interleaved rounds feeding BenchmarkLogParser
+
+Cron runs Python at :00 and Go at :30, so the two never see the same
+network or load. Here every round runs each implementation ("arm") once,
+in a freshly shuffled order, optionally pinned to the same CPUs and with a
+cooldown between runs. Runs of one round share their conditions, so the
+comparison is made per round (paired t-test) instead of between two
+unrelated samples.
+
+Each run is started through rusage_launcher.py, a small fork/exec helper,
+and measured with its wait4() rusage. Spawned straight from this process,
+every run's max RSS would include the orchestrator's own RSS (Linux keeps
+the high-water mark across exec), so the launcher's floor is measured with
+a trivial run first and arms at that floor are flagged. The result is
+written as a time -v block to raw-logs/ab-<session>.log
+and parsed with BenchmarkLogParser, so the rows have the same columns as
+golang_metrics.csv. The log name does not match bench_*, so parse_logs.py
+leaves A/B sessions out of the cron dataset.
+
+With --perf, hardware counters (instructions, cycles, cache and branch
+misses) are opened on each run via perf_counters.py and appended to its
+block as perf stat -x, lines; IPC and miss rates are then compared too.
+Hosts without counters run the session without them.
+
+Examples:
+    python ab_benchmark.py --rounds 20 --cooldown 30 --cpus 0
+    python ab_benchmark.py --rounds 20 --perf
+    python ab_benchmark.py --arm python="python3 ../legacy-python/monitor_server.py --log" \\
+                           --arm golang="../modern-golang/monitor-app --log" --seed 7
+"""
+
+import argparse
+import csv
+import os
+import random
+import resource
+import shlex
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+from benchmark_summary import paired_difference
+from log_formats import PERF_COLUMNS, TimeVerboseFormat
+from parse_logs import BASELINE_APPLICATION, METRIC_COLUMNS, BenchmarkLogParser
+from perf_counters import DEFAULT_EVENTS, EVENTS, format_perf_csv, probe, scale_count
+
+# Same commands and working directories as infrastructure/crontab_setup.txt
+DEFAULT_ARMS = {
+    'python': '/opt/monitoring/env/bin/python3 /opt/monitoring/monitor_server.py --log',
+    'golang': './monitor-app --log',
+}
+DEFAULT_WORKDIRS = {'python': '/opt/monitoring', 'golang': '/opt/monitoring-go'}
+
+RUN_COLUMNS = METRIC_COLUMNS[:4] + ['round', 'position'] + METRIC_COLUMNS[4:] + PERF_COLUMNS
+COMPARE_METRICS = ['elapsed_sec', 'max_rss_kb', 'cpu_percent', 'user_time_sec', 'system_time_sec']
+# Compared only when every run of the session has them
+PERF_COMPARE_METRICS = ['instructions', 'cycles', 'ipc', 'cache_miss_percent', 'branch_miss_percent']
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+LAUNCHER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rusage_launcher.py')
+# Trivial run for the RSS floor check; it must come out far below the orchestrator
+FLOOR_COMMAND = 'sleep 0'
+
+
+def format_elapsed(seconds: float) -> str:
+    """GNU time's %E: h:mm:ss above an hour, otherwise m:ss.hh"""
+    if seconds >= 3600:
+        hours, rest = divmod(int(seconds), 3600)
+        return f"{hours}:{rest // 60:02d}:{rest % 60:02d}"
+    minutes, rest = divmod(seconds, 60)
+    return f"{int(minutes)}:{rest:05.2f}"
+
+
+def time_v_block(command: str, elapsed: float, usage, exit_status: int) -> str:
+    """A run's rusage in /usr/bin/time -v layout (the fields parse_logs.py reads)"""
+    cpu = usage.ru_utime + usage.ru_stime
+    percent = f"{int(cpu * 100 / elapsed)}%" if elapsed > 0 else '?%'
+    lines = [
+        f'Command being timed: "{command}"',
+        f"User time (seconds): {usage.ru_utime:.2f}",
+        f"System time (seconds): {usage.ru_stime:.2f}",
+        f"Percent of CPU this job got: {percent}",
+        f"Elapsed (wall clock) time (h:mm:ss or m:ss): {format_elapsed(elapsed)}",
+        f"Maximum resident set size (kbytes): {usage.ru_maxrss}",
+        f"Major (requiring I/O) page faults: {usage.ru_majflt}",
+        f"Minor (reclaiming a frame) page faults: {usage.ru_minflt}",
+        f"Voluntary context switches: {usage.ru_nvcsw}",
+        f"Involuntary context switches: {usage.ru_nivcsw}",
+        f"Swaps: {usage.ru_nswap}",
+        f"File system inputs: {usage.ru_inblock}",
+        f"File system outputs: {usage.ru_oublock}",
+        f"Socket messages sent: {usage.ru_msgsnd}",
+        f"Socket messages received: {usage.ru_msgrcv}",
+        f"Signals delivered: {usage.ru_nsignals}",
+        f"Page size (bytes): {PAGE_SIZE}",
+        f"Exit status: {exit_status}",
+    ]
+    return '\t' + '\n\t'.join(lines) + '\n'
+
+
+class ABBenchmark:
+    def __init__(self, arms: Dict[str, str], workdirs: Dict[str, str], rounds: int,
+                 seed: int, cpus: Optional[List[int]] = None, cooldown: float = 0.0,
+                 warmup: int = 0, timeout: Optional[float] = None, perf_events: Optional[List[str]] = None):
+        self.parser = BenchmarkLogParser()
+        self.arms = arms
+        self.workdirs = workdirs
+        self.rounds = rounds
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.cpus = cpus
+        self.cooldown = cooldown
+        self.warmup = warmup
+        self.timeout = timeout
+        self.perf_events = perf_events
+        self.session = datetime.now().strftime('ab-%Y%m%d-%H%M%S')
+        self.log_path = self.parser.raw_logs_dir / f'{self.session}.log'
+        self.rows: List[Dict] = []
+        self.rss_floor_kb = 0
+
+    def _pin(self) -> None:
+        # Runs in the launcher between fork and exec; the run inherits the affinity
+        os.sched_setaffinity(0, self.cpus)
+
+    def check_perf(self) -> None:
+        """Keep only the counters this host has; run without them if there are none"""
+        if not self.perf_events:
+            return
+        available, errors = probe(self.perf_events)
+        for name, error in errors.items():
+            print(f"⚠️  Counter {name} unavailable: {error}")
+        if not available:
+            print("⚠️  No hardware counters on this host, continuing without --perf")
+        self.perf_events = available or None
+
+    def check_rss_floor(self) -> None:
+        """Max RSS a trivial run reports through the launcher; below it max_rss_kb is not measurable"""
+        self.rss_floor_kb = max(self.launch(FLOOR_COMMAND)[2].ru_maxrss for _ in range(3))
+        own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"📏 RSS floor ({FLOOR_COMMAND!r} through the launcher): {self.rss_floor_kb} KB, orchestrator {own} KB")
+        # Inherited from this process the floor would equal its own RSS
+        if self.rss_floor_kb > own * 0.75:
+            raise SystemExit("❌ A trivial run reports nearly the orchestrator's RSS; max_rss_kb would be meaningless")
+
+    def launch(self, command: str, workdir: Optional[str] = None) -> Tuple[float, int, SimpleNamespace, Dict]:
+        """Run command through rusage_launcher.py: (elapsed, wait status, rusage, perf counts)"""
+        read_fd, write_fd = os.pipe()
+        try:
+            proc = subprocess.Popen([sys.executable, '-I', '-S', LAUNCHER, str(write_fd),
+                                     ','.join(self.perf_events or []) or '-'] + shlex.split(command),
+                                    cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                    pass_fds=(write_fd,), preexec_fn=self._pin if self.cpus else None)
+        finally:
+            os.close(write_fd)
+        with os.fdopen(read_fd, 'r') as result:
+            first = result.readline().split()
+            if first[:1] != ['pid']:
+                proc.wait()
+                raise SystemExit(f"❌ {LAUNCHER} failed to start {command!r}")
+            try:
+                proc.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                # Kill the run itself; the launcher still reaps it and reports its rusage
+                os.kill(int(first[1]), signal.SIGKILL)
+                proc.wait()
+            fields, counts = {}, {}
+            for line in result:
+                key, *values = line.split()
+                if key == 'counter':
+                    counts[values[0]] = scale_count(*(int(v) for v in values[1:]))
+                else:
+                    fields[key] = float(values[0]) if '.' in values[0] else int(values[0])
+        status = fields.pop('status')
+        return fields.pop('elapsed'), status, SimpleNamespace(**fields), counts
+
+    def run_once(self, label: str) -> Tuple[str, float, object, int]:
+        """Run one arm to completion and return its time -v block"""
+        command = self.arms[label]
+        started = time.time()
+        elapsed, status, usage, counts = self.launch(command, self.workdirs.get(label) or None)
+        returncode = os.waitstatus_to_exitcode(status)
+        exit_status = returncode if returncode >= 0 else 128 - returncode
+        block = time_v_block(command, elapsed, usage, exit_status)
+        if counts:
+            # Same lines perf stat -x, prints, so the raw log re-parses with the counters
+            block += format_perf_csv(counts)
+        return block, started, usage, exit_status
+
+    def flag_rss_floor(self) -> None:
+        for label in self.arms:
+            rss = [row['max_rss_kb'] for row in self.rows if row['application'] == label]
+            if rss and statistics.median(rss) <= self.rss_floor_kb * 1.1:
+                print(f"⚠️  {label}: max RSS {statistics.median(rss):.0f} KB is at the launcher floor "
+                      f"({self.rss_floor_kb} KB); its max_rss_kb is an upper bound")
+
+    def run(self) -> None:
+        labels = list(self.arms)
+        total = self.rounds * len(labels)
+        print(f"🎲 Session {self.session}: {self.rounds} rounds x {len(labels)} arms, seed {self.seed}"
+              + (f", pinned to CPUs {self.cpus}" if self.cpus else '')
+              + (f", {self.cooldown:g}s cooldown" if self.cooldown else '')
+              + (f", counting {','.join(self.perf_events)}" if self.perf_events else ''))
+
+        for i in range(self.warmup):
+            for label in labels:
+                self.run_once(label)
+                time.sleep(self.cooldown)
+            print(f"🔥 Warm-up round {i + 1}/{self.warmup} done (not recorded)")
+
+        done = 0
+        with open(self.log_path, 'a', encoding='utf-8') as log:
+            for round_no in range(1, self.rounds + 1):
+                order = labels[:]
+                self.rng.shuffle(order)
+                for position, label in enumerate(order, 1):
+                    if done:
+                        time.sleep(self.cooldown)
+                    block, started, usage, exit_status = self.run_once(label)
+                    stamp = datetime.fromtimestamp(started)
+                    # The trailing line carries the start time (parse_logs.py takes the first one in a block)
+                    log.write(block + f"{stamp:%Y/%m/%d %H:%M:%S} ab {self.session} round {round_no} "
+                                      f"position {position} arm {label}\n")
+                    log.flush()
+
+                    record = TimeVerboseFormat.parse_block(block)
+                    record['timestamp'] = stamp.strftime('%Y-%m-%d %H:%M:%S')
+                    row = self.parser.normalize_record(record, round_no, label, self.session)
+                    row.update(round=round_no, position=position)
+                    self.rows.append(row)
+                    done += 1
+                    print(f"   [{done:3d}/{total}] round {round_no} #{position} {label:8s} "
+                          f"{row['elapsed_sec']:7.2f}s {row['max_rss_kb']:>8} KB "
+                          f"{row['cpu_percent']:3d}% CPU exit {exit_status}"
+                          + (f" IPC {row['ipc']:.2f}" if 'ipc' in row else ''))
+        print(f"📝 Raw time -v log: {self.log_path}")
+        self.flag_rss_floor()
+
+    def compare(self) -> List[Dict]:
+        """Paired per-round comparison of every arm against the baseline"""
+        labels = list(self.arms)
+        baseline = BASELINE_APPLICATION if BASELINE_APPLICATION in self.arms else labels[0]
+        by_round: Dict[int, Dict[str, Dict]] = {}
+        for row in self.rows:
+            by_round.setdefault(row['round'], {})[row['application']] = row
+
+        metrics = COMPARE_METRICS + [m for m in PERF_COMPARE_METRICS
+                                     if self.rows and all(m in row for row in self.rows)]
+        results = []
+        for label in labels:
+            if label == baseline:
+                continue
+            rounds = [r for r in by_round.values() if label in r and baseline in r]
+            for metric in metrics:
+                base = [r[baseline][metric] for r in rounds]
+                cand = [r[label][metric] for r in rounds]
+                test = paired_difference(base, cand)
+                base_mean = sum(base) / len(base) if base else 0
+                scale = 100 / base_mean if base_mean else 0
+                results.append({
+                    'session': self.session,
+                    'seed': self.seed,
+                    'baseline': baseline,
+                    'candidate': label,
+                    'metric': metric,
+                    'rounds': test['n'],
+                    'baseline_mean': round(base_mean, 4),
+                    'candidate_mean': round(sum(cand) / len(cand), 4) if cand else 0,
+                    # Same sign convention as combined_summary.csv: positive = candidate is lower
+                    'improvement_percent': round(test['mean_diff'] * scale, 2),
+                    'ci_low_percent': round(test['ci_low'] * scale, 2),
+                    'ci_high_percent': round(test['ci_high'] * scale, 2),
+                    'p_value': round(test['p_value'], 6),
+                    'candidate_first_rounds': sum(1 for row in self.rows
+                                                  if row['application'] == label and row['position'] == 1),
+                })
+        return results
+
+    def write_results(self, comparison: List[Dict]) -> None:
+        self.parser.score_measurements(self.rows)
+        runs_path = self.parser.analysis_dir / 'ab_runs.csv'
+        new_file = not runs_path.exists()
+        columns = RUN_COLUMNS
+        if not new_file:
+            # Keep the header of an existing file (written before the counter columns existed)
+            with open(runs_path, 'r', newline='', encoding='utf-8') as csvfile:
+                columns = next(csv.reader(csvfile), None) or RUN_COLUMNS
+        # Sessions accumulate; the session id is in the day column
+        with open(runs_path, 'a', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=columns, extrasaction='ignore')
+            if new_file:
+                writer.writeheader()
+            writer.writerows(self.rows)
+        print(f"✅ A/B runs: {len(self.rows)} rows -> {runs_path}")
+
+        if not comparison:
+            return
+        summary_path = self.parser.analysis_dir / 'ab_summary.csv'
+        new_file = not summary_path.exists()
+        with open(summary_path, 'a', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=list(comparison[0]))
+            if new_file:
+                writer.writeheader()
+            writer.writerows(comparison)
+        print(f"✅ A/B summary: {len(comparison)} rows -> {summary_path}")
+
+    def print_report(self, comparison: List[Dict]) -> None:
+        print(f"\n⚖️  Paired comparison ({self.session}, positive = candidate lower than baseline)")
+        print("Candidate vs baseline │ Metric          │ Improvement │ 95% CI             │ p-value")
+        print("──────────────────────┼─────────────────┼─────────────┼────────────────────┼────────")
+        for row in comparison:
+            pair = f"{row['candidate']} vs {row['baseline']}"
+            ci = f"{row['ci_low_percent']:+.1f} .. {row['ci_high_percent']:+.1f}%"
+            print(f"{pair:21s} │ {row['metric']:15s} │ {row['improvement_percent']:+10.1f}% │ {ci:18s} │ {row['p_value']:.4f}")
+
+
+def _pairs(items: List[str], option: str) -> Dict[str, str]:
+    pairs = {}
+    for item in items or []:
+        label, sep, value = item.partition('=')
+        if not sep or not label:
+            raise SystemExit(f"❌ {option} expects LABEL=VALUE, got {item!r}")
+        pairs[label.strip()] = value.strip()
+    return pairs
+
+
+def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--arm', action='append', metavar='LABEL=COMMAND',
+                        help='Implementation to run (repeatable; default: the two cron commands)')
+    parser.add_argument('--workdir', action='append', metavar='LABEL=DIR',
+                        help='Working directory of an arm (default: the cron directories for the default arms)')
+    parser.add_argument('--rounds', type=int, default=10, help='Rounds; every arm runs once per round')
+    parser.add_argument('--seed', type=int, help='Shuffle seed (printed and stored, so a session can be repeated)')
+    parser.add_argument('--cpus', help='Pin every run to these CPUs, e.g. "0" or "2,3"')
+    parser.add_argument('--cooldown', type=float, default=0.0, help='Seconds to sleep between runs')
+    parser.add_argument('--warmup', type=int, default=0, help='Unrecorded rounds before measuring')
+    parser.add_argument('--timeout', type=float, help='Kill a run after this many seconds')
+    parser.add_argument('--perf', nargs='?', const=','.join(DEFAULT_EVENTS), metavar='EVENTS',
+                        help='Count hardware events per run (default: instructions, cycles, cache and branch misses)')
+    args = parser.parse_args()
+
+    arms = _pairs(args.arm, '--arm') or dict(DEFAULT_ARMS)
+    workdirs = {label: path for label, path in DEFAULT_WORKDIRS.items() if label in arms and not args.arm}
+    workdirs.update(_pairs(args.workdir, '--workdir'))
+    if len(arms) < 2:
+        parser.error('need at least two arms to compare')
+    cpus = [int(cpu) for cpu in args.cpus.split(',')] if args.cpus else None
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2 ** 32)
+
+    perf_events = [e.strip() for e in args.perf.split(',') if e.strip()] if args.perf else None
+    unknown = [e for e in perf_events or [] if e not in EVENTS]
+    if unknown:
+        parser.error(f"unknown --perf event(s): {', '.join(unknown)}")
+    bench = ABBenchmark(arms, workdirs, args.rounds, seed, cpus, args.cooldown, args.warmup, args.timeout,
+                        perf_events)
+    bench.check_perf()
+    bench.check_rss_floor()
+    bench.run()
+    comparison = bench.compare()
+    bench.print_report(comparison)
+    bench.write_results(comparison)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Downsampling Benchmark
+Shows chart render time staying flat as the input grows from 10^3 to 10^8 points
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - LTTB + min/max envelope vs raw ax.plot
+
+Example:
+    python bench_downsample.py                  # 10^3 .. 10^7
+    python bench_downsample.py --max-exp 8      # needs ~2 GB RAM
+    python bench_downsample.py --naive-max-exp 6
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from downsample import plot_series
+
+
+def make_series(n: int, seed: int = 0):
+    """Random-walk memory series around 180 MB with a few spikes, float32 to fit 10^8"""
+    rng = np.random.default_rng(seed)
+    y = rng.standard_normal(n, dtype=np.float32)
+    np.cumsum(y, out=y)
+    y *= 0.01
+    y += 180
+    y[rng.integers(0, n, size=max(1, n // 100000))] += 25  # spikes the envelope must keep
+    return np.arange(n), y
+
+
+def render(x, y, dpi: int, downsample: bool):
+    """Returns (seconds in plot call, seconds in savefig, plotted line points)"""
+    fig, ax = plt.subplots(figsize=(14, 5))
+    started = time.perf_counter()
+    if downsample:
+        lines = plot_series(ax, x, y, dpi, color='#3776AB', linewidth=1)
+    else:
+        lines = ax.plot(x, y, color='#3776AB', linewidth=1)
+    plotted = time.perf_counter()
+    fig.savefig(io.BytesIO(), format='png', dpi=dpi)
+    saved = time.perf_counter()
+    plt.close(fig)
+    return plotted - started, saved - plotted, len(lines[0].get_xdata())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--min-exp', type=int, default=3)
+    parser.add_argument('--max-exp', type=int, default=7)
+    parser.add_argument('--naive-max-exp', type=int, default=6, help='Largest size for the raw ax.plot baseline')
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+
+    render(*make_series(1000), args.dpi, True)  # warm up font cache / Agg
+
+    print(f"📊 Render benchmark at {args.dpi} dpi (14x5 in figure)")
+    print("Points   │ Downsample (s) │ Draw+save (s) │ Peak extra MB │ Line pts │ Raw ax.plot total (s)")
+    print("─────────┼────────────────┼───────────────┼───────────────┼──────────┼──────────────────────")
+    for exp in range(args.min_exp, args.max_exp + 1):
+        n = 10 ** exp
+        x, y = make_series(n)
+
+        prepare, draw, points = render(x, y, args.dpi, True)
+        # Separate pass for memory: tracemalloc itself slows allocation-heavy code
+        tracemalloc.start()
+        render(x, y, args.dpi, True)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+
+        naive = f"{sum(render(x, y, args.dpi, False)[:2]):21.2f}" if exp <= args.naive_max_exp else '              skipped'
+        print(f"10^{exp:<5d} │ {prepare:14.3f} │ {draw:13.3f} │ {peak_mb:13.1f} │ {points:8d} │ {naive}")
+        del x, y
+
+
+if __name__ == "__main__":
+    main()
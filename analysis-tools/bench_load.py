@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Load Benchmark
+Compares peak memory and time of the metric CSV loading strategies
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Default read_csv vs typed/projected vs Parquet cache
+
+Each strategy runs in a fresh interpreter so peak RSS is not shared.
+
+Example:
+    python bench_load.py --rows 2000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import visualize_data
+from visualize_data import CHART_JOBS, load_metrics, metric_columns
+
+STRATEGIES = ['default', 'typed', 'parquet-cold', 'parquet-warm']
+
+
+def make_metrics_csv(path: Path, rows: int, seed: int = 0) -> None:
+    """Resample the real golang_metrics.csv to the requested size with fresh timestamps"""
+    source = Path(visualize_data.__file__).parent.parent / 'benchmark-results' / 'analysis' / 'golang_metrics.csv'
+    base = pd.read_csv(source)
+    rng = np.random.default_rng(seed)
+    df = base.iloc[rng.integers(0, len(base), rows)].reset_index(drop=True)
+    df['execution_id'] = np.arange(1, rows + 1)
+    df['timestamp'] = pd.date_range('2026-01-01', periods=rows, freq='10s').strftime('%Y-%m-%d %H:%M:%S')
+    df.to_csv(path, index=False)
+
+
+def _status_mb(field: str) -> float:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _reset_peak_rss() -> None:
+    # "5" resets VmHWM so import-time peaks do not hide the load itself
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def worker(strategy: str, path: Path) -> dict:
+    """Runs inside the child interpreter"""
+    columns = metric_columns(CHART_JOBS)
+    _reset_peak_rss()
+    baseline = _status_mb('VmRSS')
+    started = time.perf_counter()
+    if strategy == 'default':
+        # Previous load_data(): every column, default dtypes, timestamps parsed afterwards
+        df = pd.read_csv(path)
+        df['datetime'] = pd.to_datetime(df['timestamp'], format='mixed')
+    else:
+        visualize_data.HAS_ARROW = strategy.startswith('parquet')
+        df = load_metrics(path, columns)
+    elapsed = time.perf_counter() - started
+    return {
+        'seconds': elapsed,
+        'peak_mb': _status_mb('VmHWM') - baseline,
+        'frame_mb': df.memory_usage(deep=True).sum() / 1e6,
+        'columns': len(df.columns),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--worker', nargs=2, metavar=('STRATEGY', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker[0], Path(args.worker[1]))))
+        return
+
+    workdir = Path(tempfile.mkdtemp(prefix='bench_load_'))
+    try:
+        path = workdir / 'golang_metrics.csv'
+        print(f"📝 Generating {args.rows:,} rows...")
+        make_metrics_csv(path, args.rows)
+        print(f"📁 {path.stat().st_size / 1e6:.0f} MB CSV, pyarrow {'available' if visualize_data.HAS_ARROW else 'not installed'}")
+        print()
+        print("Strategy      │ Load (s) │ Peak RSS (MB) │ DataFrame (MB) │ Columns")
+        print("──────────────┼──────────┼───────────────┼────────────────┼────────")
+        for strategy in STRATEGIES:
+            if strategy.startswith('parquet') and not visualize_data.HAS_ARROW:
+                print(f"{strategy:13s} │  skipped (pip install pyarrow)")
+                continue
+            out = subprocess.run([sys.executable, __file__, '--worker', strategy, str(path)],
+                                 check=True, capture_output=True, text=True, cwd=os.path.dirname(__file__) or '.')
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{strategy:13s} │ {result['seconds']:8.2f} │ {result['peak_mb']:13.0f} │ "
+                  f"{result['frame_mb']:14.1f} │ {result['columns']:7d}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
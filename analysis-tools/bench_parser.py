@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Parser Scaling Benchmark
+Measures BenchmarkLogParser throughput and peak memory on large synthetic time -v corpora
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Per-file parse and full run_parser passes over GB-scale logs
+
+The corpus comes from time_v_corpus.py (generated, or reused with
+--corpus). Each mode runs in a fresh interpreter so peak RSS is its own:
+  parse  process_log_file() over every file, rows dropped after each file
+  full   run_parser() end to end (scoring and CSV writing included),
+         output redirected to a scratch directory
+Record counts are checked against corpus_manifest.json, and every run is
+appended to parser_benchmark.csv.
+
+Example:
+    python bench_parser.py                          # 1 GB corpus, both modes
+    python bench_parser.py --size 200M --modes parse
+    python bench_parser.py --corpus /data/corpus --keep
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from time_v_corpus import TimeVCorpusGenerator, parse_size
+
+MODES = ['parse', 'full']
+RESULTS_COLUMNS = ['timestamp', 'mode', 'files', 'corpus_mb', 'records', 'expected_records',
+                   'seconds', 'mb_per_sec', 'records_per_sec', 'peak_rss_mb', 'python']
+
+
+def worker(mode: str, corpus: Path) -> dict:
+    """Runs inside the child interpreter"""
+    from parse_logs import BenchmarkLogParser
+
+    parser = BenchmarkLogParser()
+    counts = {}
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as quiet, contextlib.redirect_stdout(quiet):
+        if mode == 'parse':
+            for path in sorted(corpus.glob('bench_*.log')):
+                rows, _ = parser.process_log_file(path)
+                for row in rows:
+                    counts[row['application']] = counts.get(row['application'], 0) + 1
+                del rows
+        else:
+            output = Path(tempfile.mkdtemp(prefix='bench_parser_out_'))
+            try:
+                from scoring import MODEL_FILENAME
+                if (parser.analysis_dir / MODEL_FILENAME).exists():
+                    # Score with the configured model, not the default one
+                    shutil.copy(parser.analysis_dir / MODEL_FILENAME, output)
+                parser.raw_logs_dir = corpus
+                parser.analysis_dir = output
+                parser.run_parser()
+                for path in output.glob('*_metrics.csv'):
+                    with open(path) as f:
+                        counts[path.name[:-len('_metrics.csv')]] = sum(1 for _ in f) - 1
+            finally:
+                shutil.rmtree(output, ignore_errors=True)
+    return {
+        'seconds': time.perf_counter() - started,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'counts': counts,
+    }
+
+
+def append_results(path: Path, rows: list) -> None:
+    new_file = not path.exists()
+    with open(path, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULTS_COLUMNS)
+        if new_file:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', type=Path, help='Existing time_v_corpus.py output (default: generate one)')
+    parser.add_argument('--size', default='1G', help='Size of the generated corpus')
+    parser.add_argument('--files', type=int, default=8)
+    parser.add_argument('--interleave', action='store_true', help='Generate files mixing both applications')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--modes', nargs='+', default=MODES, choices=MODES)
+    parser.add_argument('--results', type=Path,
+                        default=Path(__file__).parent.parent / 'benchmark-results' / 'analysis' / 'parser_benchmark.csv',
+                        help='CSV the results are appended to')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated corpus')
+    parser.add_argument('--worker', nargs=2, metavar=('MODE', 'CORPUS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker[0], Path(args.worker[1]))))
+        return 0
+
+    corpus = args.corpus
+    generated = corpus is None
+    if generated:
+        corpus = Path(tempfile.mkdtemp(prefix='bench_parser_corpus_'))
+        print(f"📝 Generating {parse_size(args.size) / 1e6:,.0f} MB corpus in {corpus}...")
+        TimeVCorpusGenerator(['golang', 'python'], seed=args.seed).generate(
+            corpus, parse_size(args.size), args.files, args.interleave)
+
+    try:
+        manifest_path = corpus / 'corpus_manifest.json'
+        if not manifest_path.exists():
+            print(f"❌ {manifest_path} not found (create the corpus with time_v_corpus.py)")
+            return 1
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        expected = manifest['expected_records']
+        corpus_mb = manifest['total_bytes'] / 1e6
+        total_expected = sum(expected.values())
+        print(f"📁 {len(manifest['files'])} files, {corpus_mb:,.0f} MB, {total_expected:,} runs expected")
+        print()
+        print("Mode  │ Time (s) │   MB/s │  Records/s │ Peak RSS (MB) │ Records")
+        print("──────┼──────────┼────────┼────────────┼───────────────┼────────")
+
+        rows, mismatches = [], []
+        for mode in args.modes:
+            out = subprocess.run([sys.executable, __file__, '--worker', mode, str(corpus)],
+                                 check=True, capture_output=True, text=True, cwd=os.path.dirname(__file__) or '.')
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            records = sum(result['counts'].values())
+            status = '✅' if result['counts'] == expected else '❌'
+            if result['counts'] != expected:
+                mismatches.append((mode, result['counts']))
+            print(f"{mode:5s} │ {result['seconds']:8.2f} │ {corpus_mb / result['seconds']:6.1f} │ "
+                  f"{records / result['seconds']:10,.0f} │ {result['peak_rss_mb']:13.0f} │ {records:,} {status}")
+            rows.append({
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'mode': mode,
+                'files': len(manifest['files']),
+                'corpus_mb': round(corpus_mb, 1),
+                'records': records,
+                'expected_records': total_expected,
+                'seconds': round(result['seconds'], 3),
+                'mb_per_sec': round(corpus_mb / result['seconds'], 2),
+                'records_per_sec': round(records / result['seconds']),
+                'peak_rss_mb': round(result['peak_rss_mb'], 1),
+                'python': platform.python_version(),
+            })
+
+        append_results(args.results, rows)
+        print(f"\n💾 Results appended to {args.results}")
+        for mode, counts in mismatches:
+            print(f"⚠️  {mode}: parsed {counts}, manifest expects {expected}")
+        return 1 if mismatches else 0
+    finally:
+        if generated and not args.keep:
+            shutil.rmtree(corpus, ignore_errors=True)
+        elif generated:
+            print(f"📁 Corpus kept in {corpus}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
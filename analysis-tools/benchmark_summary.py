@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Summary Layer
+Derives every headline figure, threshold line and verdict from the parsed CSVs
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Shared by visualize_data.py and visualize_data_simple.py
+"""
+
+import csv
+import json
+import math
+import random
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+SUMMARY_VERSION = 2
+CACHE_FILENAME = '.benchmark_summary.json'
+
+# Baseline is the legacy implementation, candidate is the rewrite
+BASELINE_APP = 'python'
+CANDIDATE_APP = 'golang'
+METRIC_FILES = {'golang': 'golang_metrics.csv', 'python': 'python_metrics.csv'}
+SUMMARY_METRICS = ['max_rss_kb', 'max_rss_mb', 'elapsed_sec', 'cpu_percent', 'performance_score']
+
+Z_95 = 1.959963984540054
+
+# Bounded memory for any CSV size: medians come from a uniform reservoir
+# (exact up to this many rows) and the ASCII timeline keeps only its head
+RESERVOIR_SIZE = 10_000
+TIMELINE_POINTS = 24
+
+# In-process cache so several charts in one run share a single scan
+_MEMO: Dict[str, Dict] = {}
+
+
+class Reservoir:
+    """Uniform random sample of a stream (Algorithm R), fixed size"""
+    __slots__ = ('size', 'seen', 'values', '_rng')
+
+    def __init__(self, size: int = RESERVOIR_SIZE, seed: int = 0):
+        self.size = size
+        self.seen = 0
+        self.values: List[float] = []
+        self._rng = random.Random(seed)
+
+    def add(self, value: float) -> None:
+        self.seen += 1
+        if len(self.values) < self.size:
+            self.values.append(value)
+        else:
+            slot = self._rng.randrange(self.seen)
+            if slot < self.size:
+                self.values[slot] = value
+
+    def percentile(self, pct: float) -> float:
+        if not self.values:
+            return 0.0
+        if pct == 50:
+            return statistics.median(self.values)
+        ordered = sorted(self.values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class RunningStats:
+    """One-pass count/mean/std/min/max (Welford) plus a reservoir for the median"""
+    __slots__ = ('count', 'total', '_mean', '_m2', 'min', 'max', 'reservoir')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.reservoir = Reservoir()
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.reservoir.add(value)
+
+    def describe(self) -> Dict:
+        """Basic descriptive statistics for one metric"""
+        if not self.count:
+            return {'count': 0, 'mean': 0.0, 'median': 0.0, 'std': 0.0, 'min': 0.0, 'max': 0.0, 'cv': 0.0}
+        mean = self.total / self.count
+        std = math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+        return {
+            'count': self.count,
+            'mean': mean,
+            'median': self.reservoir.percentile(50),
+            'std': std,
+            'min': self.min,
+            'max': self.max,
+            'cv': std / mean if mean else 0.0,
+        }
+
+
+class RunningTrend:
+    """One-pass least squares of y over x using Welford co-moments"""
+    __slots__ = ('n', '_mx', '_my', '_cxx', '_cxy', '_cyy')
+
+    def __init__(self):
+        self.n = 0
+        self._mx = self._my = 0.0
+        self._cxx = self._cxy = self._cyy = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        self.n += 1
+        dx = x - self._mx
+        dy = y - self._my
+        self._mx += dx / self.n
+        self._my += dy / self.n
+        self._cxx += dx * (x - self._mx)
+        self._cxy += dx * (y - self._my)
+        self._cyy += dy * (y - self._my)
+
+    def result(self) -> Dict:
+        """OLS slope of values over time with a t-test on the slope"""
+        n = self.n
+        result = {'n': n, 'slope_per_hour': 0.0, 'stderr': 0.0, 't': 0.0, 'p_value': 1.0}
+        if n < 3 or self._cxx == 0:
+            return result
+        slope = self._cxy / self._cxx
+        sse = max(0.0, self._cyy - slope * self._cxy)
+        stderr = math.sqrt(sse / (n - 2) / self._cxx)
+        if stderr > 0:
+            t = slope / stderr
+        else:
+            t = math.inf if slope else 0.0
+        result.update(slope_per_hour=slope, stderr=stderr, t=t,
+                      p_value=student_t_two_sided_p(t, n - 2))
+        return result
+
+
+def describe(values: Iterable[float]) -> Dict:
+    """Basic descriptive statistics for one metric"""
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    return stats.describe()
+
+
+def ratio_ci(numerator: Dict, denominator: Dict, z: float = Z_95) -> Dict:
+    """Ratio of two means with a log-scale (delta method) confidence interval"""
+    if numerator['mean'] <= 0 or denominator['mean'] <= 0:
+        return {'value': 0.0, 'ci_low': 0.0, 'ci_high': 0.0}
+    ratio = numerator['mean'] / denominator['mean']
+    var = 0.0
+    for stats in (numerator, denominator):
+        if stats['count'] > 0:
+            var += (stats['std'] / stats['mean']) ** 2 / stats['count']
+    se = math.sqrt(var)
+    return {
+        'value': ratio,
+        'ci_low': ratio * math.exp(-z * se),
+        'ci_high': ratio * math.exp(z * se),
+    }
+
+
+def reduction_percent(ratio: Dict) -> Dict:
+    """Convert candidate/baseline ratio into a '% reduction' with its interval"""
+    return {
+        'value': (1 - ratio['value']) * 100,
+        'ci_low': (1 - ratio['ci_high']) * 100,
+        'ci_high': (1 - ratio['ci_low']) * 100,
+    }
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta function"""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c if abs(1 + aa / c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c if abs(1 + aa / c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return h
+
+
+def student_t_two_sided_p(t: float, df: int) -> float:
+    """Two-sided p-value of Student's t without scipy"""
+    if df <= 0 or math.isnan(t):
+        return 1.0
+    if math.isinf(t):
+        return 0.0
+    x = df / (df + t * t)
+    a, b = df / 2, 0.5
+    log_bt = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+              + a * math.log(x) + b * math.log1p(-x)) if 0 < x < 1 else None
+    if log_bt is None:
+        return 1.0 if x >= 1 else 0.0
+    bt = math.exp(log_bt)
+    if x < (a + 1) / (a + b + 2):
+        return min(1.0, bt * _betacf(a, b, x) / a)
+    return min(1.0, 1 - bt * _betacf(b, a, 1 - x) / b)
+
+
+def student_t_critical(df: int, alpha: float = 0.05) -> float:
+    """Two-sided critical value of Student's t (bisection on the p-value)"""
+    if df <= 0:
+        return math.inf
+    low, high = 0.0, 1000.0
+    for _ in range(100):
+        mid = (low + high) / 2
+        if student_t_two_sided_p(mid, df) > alpha:
+            low = mid
+        else:
+            high = mid
+    return high
+
+
+def paired_difference(baseline: List[float], candidate: List[float]) -> Dict:
+    """Paired t-test of baseline - candidate (e.g. runs from the same A/B round)"""
+    diffs = [b - c for b, c in zip(baseline, candidate)]
+    n = len(diffs)
+    result = {'n': n, 'mean_diff': 0.0, 'ci_low': 0.0, 'ci_high': 0.0, 't': 0.0, 'p_value': 1.0}
+    if n == 0:
+        return result
+    mean = sum(diffs) / n
+    result.update(mean_diff=mean, ci_low=mean, ci_high=mean)
+    if n < 2:
+        return result
+    sd = statistics.stdev(diffs)
+    if sd == 0:
+        result.update(t=math.copysign(math.inf, mean) if mean else 0.0, p_value=0.0 if mean else 1.0)
+        return result
+    se = sd / math.sqrt(n)
+    margin = student_t_critical(n - 1) * se
+    t = mean / se
+    result.update(ci_low=mean - margin, ci_high=mean + margin, t=t, p_value=student_t_two_sided_p(t, n - 1))
+    return result
+
+
+def trend_test(hours: Iterable[float], values: Iterable[float]) -> Dict:
+    """OLS slope of values over time with a t-test on the slope"""
+    trend = RunningTrend()
+    for x, y in zip(hours, values):
+        trend.add(x, y)
+    return trend.result()
+
+
+def leak_verdict(trend: Dict, mean_value: float, alpha: float = 0.01,
+                 min_daily_growth: float = 0.01) -> Dict:
+    """Leak = significant positive RSS slope that is also practically relevant"""
+    daily_growth = trend['slope_per_hour'] * 24
+    relative = daily_growth / mean_value if mean_value else 0.0
+    suspected = trend['slope_per_hour'] > 0 and trend['p_value'] < alpha and relative >= min_daily_growth
+    return dict(trend, growth_per_day=daily_growth, relative_growth_per_day=relative,
+                leak_suspected=suspected)
+
+
+def stability_label(cv: float) -> str:
+    if cv < 0.02:
+        return 'Excellent'
+    if cv < 0.05:
+        return 'Good'
+    return 'Variable'
+
+
+def _signature(analysis_dir: Path) -> List:
+    signature = [SUMMARY_VERSION]
+    for name in sorted(METRIC_FILES.values()):
+        path = analysis_dir / name
+        if path.exists():
+            stat = path.stat()
+            signature.append([name, stat.st_size, stat.st_mtime_ns])
+        else:
+            signature.append([name, None, None])
+    return signature
+
+
+def parse_timestamp(text: str) -> datetime:
+    """parse_logs.py writes either the raw log stamp or a generated one"""
+    for fmt in ('%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S'):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized timestamp: {text}")
+
+
+def stream_metrics(path: Path) -> Iterator[Tuple[float, List[float]]]:
+    """Yield (epoch, SUMMARY_METRICS values) per row without holding the file"""
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        ts_idx = header.index('timestamp')
+        idx = [header.index(name) if name in header else None for name in SUMMARY_METRICS]
+        for row in reader:
+            if not row:
+                continue
+            values = [float(row[i] or 0) if i is not None else 0.0 for i in idx]
+            yield parse_timestamp(row[ts_idx]).timestamp(), values
+
+
+def summarize_app(path: Path) -> Tuple[Dict, float, float]:
+    """Single pass over one metrics CSV in constant memory"""
+    stats = [RunningStats() for _ in SUMMARY_METRICS]
+    trend = RunningTrend()
+    rss_idx = SUMMARY_METRICS.index('max_rss_kb')
+    timeline: List[float] = []
+    first = start = end = None
+    for epoch, values in stream_metrics(path):
+        if first is None:
+            first = start = end = epoch
+        start, end = min(start, epoch), max(end, epoch)
+        for acc, value in zip(stats, values):
+            acc.add(value)
+        # OLS slope is shift invariant, so hours can count from the first row
+        trend.add((epoch - first) / 3600, values[rss_idx])
+        if len(timeline) < TIMELINE_POINTS:
+            timeline.append(values[rss_idx])
+
+    app = {name: acc.describe() for name, acc in zip(SUMMARY_METRICS, stats)}
+    app['leak'] = leak_verdict(trend.result(), app['max_rss_kb']['mean'])
+    app['stability'] = stability_label(app['max_rss_kb']['cv'])
+    app['count'] = trend.n
+    app['timeline_rss_kb'] = timeline
+    return app, start, end
+
+
+def compute_summary(analysis_dir: Path) -> Dict:
+    """Scan the metric CSVs once and derive all headline numbers"""
+    apps: Dict[str, Dict] = {}
+    starts, ends = [], []
+
+    for app, filename in METRIC_FILES.items():
+        path = analysis_dir / filename
+        if not path.exists():
+            continue
+        stats, start, end = summarize_app(path)
+        if not stats['count']:
+            continue
+        apps[app] = stats
+        starts.append(start)
+        ends.append(end)
+
+    summary: Dict = {
+        'signature': _signature(analysis_dir),
+        'apps': apps,
+        'total_measurements': sum(app['count'] for app in apps.values()),
+        'duration_hours': (max(ends) - min(starts)) / 3600 if starts else 0.0,
+    }
+
+    base, cand = apps.get(BASELINE_APP), apps.get(CANDIDATE_APP)
+    if base and cand:
+        memory = ratio_ci(base['max_rss_kb'], cand['max_rss_kb'])
+        speed = reduction_percent(ratio_ci(cand['elapsed_sec'], base['elapsed_sec']))
+        cpu = reduction_percent(ratio_ci(cand['cpu_percent'], base['cpu_percent']))
+        summary.update(memory_ratio=memory, speed_reduction_percent=speed, cpu_reduction_percent=cpu)
+
+        # Winner only when the intervals clearly favour one side
+        if memory['ci_low'] > 1 and speed['ci_low'] >= 0:
+            winner = CANDIDATE_APP
+        elif memory['ci_high'] < 1 and speed['ci_high'] <= 0:
+            winner = BASELINE_APP
+        else:
+            winner = None
+        summary['winner'] = winner
+
+    summary['leak_detected'] = any(app['leak']['leak_suspected'] for app in apps.values())
+    return summary
+
+
+def load_summary(analysis_dir: Path, use_cache: bool = True) -> Dict:
+    """Return the summary, recomputing only when the input CSVs changed"""
+    analysis_dir = Path(analysis_dir)
+    signature = _signature(analysis_dir)
+    key = str(analysis_dir.resolve())
+
+    cached = _MEMO.get(key)
+    if use_cache and cached and cached['signature'] == signature:
+        return cached
+
+    cache_path = analysis_dir / CACHE_FILENAME
+    if use_cache and cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('signature') == signature:
+                _MEMO[key] = cached
+                return cached
+        except (OSError, ValueError):
+            pass
+
+    summary = compute_summary(analysis_dir)
+    # Round-trip through JSON so memo and disk cache have identical shapes
+    summary = json.loads(json.dumps(summary))
+    _MEMO[key] = summary
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+    except OSError:
+        pass
+    return summary
+
+
+def format_interval(stat: Dict, fmt: str = '{:.1f}', suffix: str = '') -> str:
+    """'14.5x (95% CI 14.4-14.6x)' style label"""
+    value = fmt.format(stat['value']) + suffix
+    low = fmt.format(stat['ci_low'])
+    high = fmt.format(stat['ci_high']) + suffix
+    return f"{value} (95% CI {low}-{high})"
+
+
+def app_name(app: str) -> str:
+    return 'Golang' if app == 'golang' else 'Python'
+
+
+def recommendation(summary: Dict) -> str:
+    winner = summary.get('winner')
+    if winner is None:
+        return 'NO CLEAR WINNER: Differences are within the confidence intervals'
+    name = app_name(winner)
+    if summary.get('leak_detected'):
+        return f'CONDITIONAL: {name} Implementation, pending memory-leak investigation'
+    return f'APPROVED: {name} Implementation for Production Use'
+
+
+def memory_verdict(summary: Dict) -> Tuple[Optional[str], str]:
+    """(app using less memory, or None when the ratio CI includes 1; wording)"""
+    memory = summary['memory_ratio']  # baseline RSS / candidate RSS
+    if memory['ci_low'] > 1:
+        return CANDIDATE_APP, f"{app_name(CANDIDATE_APP)} uses {format_interval(memory, suffix='x')} less memory"
+    if 0 < memory['ci_high'] < 1:
+        inverse = {'value': 1 / memory['value'], 'ci_low': 1 / memory['ci_high'], 'ci_high': 1 / memory['ci_low']}
+        return BASELINE_APP, f"{app_name(BASELINE_APP)} uses {format_interval(inverse, suffix='x')} less memory"
+    return None, f"No significant memory difference: ratio {format_interval(memory, suffix='x')}"
+
+
+def speed_verdict(summary: Dict) -> Tuple[Optional[str], str]:
+    """(faster app, or None when the reduction CI includes 0; wording)"""
+    speed = summary['speed_reduction_percent']  # candidate time reduction vs. baseline
+    if speed['ci_low'] > 0:
+        return CANDIDATE_APP, f"{app_name(CANDIDATE_APP)} runs {format_interval(speed, fmt='{:.0f}', suffix='%')} faster"
+    if speed['ci_high'] < 0:
+        slower = {'value': -speed['value'], 'ci_low': -speed['ci_high'], 'ci_high': -speed['ci_low']}
+        return BASELINE_APP, (f"{app_name(BASELINE_APP)} runs faster: {app_name(CANDIDATE_APP)} takes "
+                              f"{format_interval(slower, fmt='{:.0f}', suffix='%')} longer")
+    return None, f"No significant speed difference: time reduction {format_interval(speed, fmt='{:.0f}', suffix='%')}"
+
+
+def verdict_mark(summary: Dict, app: Optional[str]) -> str:
+    """✅ when a difference backs the recommendation, ⚠️ when it goes against it, ➖ when there is none"""
+    if app is None:
+        return '➖'
+    return '✅' if app == summary.get('winner') else '⚠️'
+
+
+def deployment_verdict(summary: Dict) -> str:
+    """Edge / resource-constrained deployment line matching recommendation()"""
+    winner = summary.get('winner')
+    if winner is None:
+        return '➖ Neither implementation is clearly leaner and faster; decide on other criteria'
+    if summary.get('leak_detected'):
+        return f'⚠️ Investigate the RSS growth before deploying {app_name(winner)} to resource-constrained hosts'
+    return f'✅ {app_name(winner)} fits edge and resource-constrained hosts: less memory and faster at 95% confidence'
+
+
+def leak_label(summary: Dict) -> str:
+    leaking = [app for app, stats in summary['apps'].items() if stats['leak']['leak_suspected']]
+    if leaking:
+        return '⚠️ POSSIBLE LEAK: ' + ', '.join(leaking)
+    return '✅ NO LEAKS DETECTED'
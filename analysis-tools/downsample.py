@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Downsampling Helpers
+Keeps chart render time bounded by output pixels instead of input rows
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - LTTB line series, min/max envelopes, pixel-deduplicated scatter
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def axis_pixels(ax, dpi: float) -> Tuple[int, int]:
+    """Width/height in output pixels of an axes when saved at dpi"""
+    box = ax.get_position()
+    fig = ax.get_figure()
+    return (max(1, int(box.width * fig.get_figwidth() * dpi)),
+            max(1, int(box.height * fig.get_figheight() * dpi)))
+
+
+def _numeric(x: np.ndarray) -> np.ndarray:
+    """datetime64 -> int64 so arithmetic works; other dtypes unchanged"""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.view('int64')
+    return x
+
+
+def bucket_edges(n: int, buckets: int, first: int = 0, last: Optional[int] = None) -> np.ndarray:
+    """buckets+1 monotonic edges splitting [first, last) into near-equal runs"""
+    last = n if last is None else last
+    return np.floor(np.linspace(first, last, buckets + 1)).astype(np.int64)
+
+
+def lttb_indices(y: np.ndarray, n_out: int, x: Optional[np.ndarray] = None) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the visual shape
+
+    x=None means evenly spaced samples, which avoids materializing an index
+    array for very long series. The loop runs once per output point and
+    each step is a NumPy reduction over one bucket, so the total work is
+    O(n) with only O(n_out) Python iterations.
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    if x is not None:
+        x = _numeric(np.asarray(x))
+        x0 = x[0]
+
+        def xs(s, e):
+            # Relative float64 per bucket: keeps ns timestamps precise without a full copy
+            return (x[s:e] - x0).astype(np.float64)
+    else:
+        def xs(s, e):
+            return np.arange(s, e, dtype=np.float64)
+
+    edges = bucket_edges(n, n_out - 2, 1, n - 1)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    ax_, ay_ = 0.0, float(y[0])
+    for i in range(n_out - 2):
+        s, e = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            # Average of the next bucket; accumulating in float64 per slice
+            # avoids an up-front float64 copy of a float32 series
+            ns, ne = e, edges[i + 2]
+            cx, cy = xs(ns, ne).mean(), float(y[ns:ne].mean(dtype=np.float64))
+        else:
+            cx, cy = float(xs(n - 1, n)[0]), float(y[n - 1])
+        bx = xs(s, e)
+        area = np.abs((ax_ - cx) * (y[s:e] - ay_) - (ax_ - bx) * (cy - ay_))
+        j = int(np.argmax(area))
+        a = s + j
+        ax_, ay_ = float(bx[j]), float(y[a])
+        out[i + 1] = a
+    return out
+
+
+def minmax_envelope(y: np.ndarray, buckets: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-bucket (first index, min, max) so spikes between LTTB points stay visible"""
+    y = np.asarray(y)
+    edges = bucket_edges(len(y), min(buckets, len(y)))
+    starts = np.unique(edges[:-1])
+    return starts, np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)
+
+
+def plot_series(ax, x, y, dpi: float, envelope: bool = True, **kwargs):
+    """ax.plot() replacement that draws at most ~2 points per output pixel
+
+    Short series are plotted unchanged. Longer ones get a shaded min/max
+    band per pixel column plus an LTTB line through the same range.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    width, _ = axis_pixels(ax, dpi)
+    if len(y) <= 2 * width:
+        return ax.plot(x, y, **kwargs)
+
+    if envelope:
+        starts, low, high = minmax_envelope(y, width)
+        ax.fill_between(x[starts], low, high, color=kwargs.get('color'),
+                        alpha=0.2 * kwargs.get('alpha', 1.0), linewidth=0, step='post')
+    idx = lttb_indices(y, 2 * width, x if not _is_uniform_index(x) else None)
+    return ax.plot(x[idx], y[idx], **kwargs)
+
+
+def _is_uniform_index(x: np.ndarray) -> bool:
+    # 0..n-1 x-axis (e.g. measurement number): let LTTB skip the x array
+    return np.issubdtype(x.dtype, np.integer) and len(x) > 1 and x[0] == 0 and x[-1] == len(x) - 1
+
+
+def pixel_unique(x, y, width: int, height: int) -> np.ndarray:
+    """Indices of one point per occupied pixel cell; a scatter of these looks identical"""
+    x = _numeric(np.asarray(x)).astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) <= width:
+        return np.arange(len(x))
+    span_x = (x.max() - x.min()) or 1.0
+    span_y = (y.max() - y.min()) or 1.0
+    cx = np.minimum(((x - x.min()) / span_x * width).astype(np.int64), width - 1)
+    cy = np.minimum(((y - y.min()) / span_y * height).astype(np.int64), height - 1)
+    _, idx = np.unique(cx * height + cy, return_index=True)
+    return np.sort(idx)
+
+
+def scatter_points(ax, x, y, dpi: float, **kwargs):
+    """ax.scatter() replacement bounded by the number of pixels in the axes"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    width, height = axis_pixels(ax, dpi)
+    idx = pixel_unique(x, y, width, height)
+    return ax.scatter(x[idx], y[idx], **kwargs)
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark HTML Dashboard
+Builds one self-contained, zoomable HTML file from the parsed metric CSVs
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Multi-resolution binary chunks, no server required
+
+Every numeric metric of golang_metrics.csv / python_metrics.csv becomes a
+zoomable panel. Samples are pre-aggregated into a pyramid of time bins
+(each level 4x wider, min/mean/max per bin) and split into fixed-size
+chunks of little-endian typed arrays, base64 encoded in inert <script>
+tags. The page decodes only the chunks that intersect the visible range
+at the level matching the canvas width, so a year of samples opens
+instantly. Levels finer than --max-bins are left out to bound the file
+size; chunks are streamed to the file one app at a time.
+
+Example:
+    python html_dashboard.py
+    python html_dashboard.py --metrics max_rss_kb,elapsed_sec --min-width 60
+    python html_dashboard.py --max-bins 0        # embed every raw sample
+"""
+
+import argparse
+import base64
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+import numpy as np
+
+from benchmark_summary import format_interval, leak_label, load_summary, recommendation
+from visualize_data import METRIC_DTYPES, load_metrics
+
+APPS = {'golang': ('golang_metrics.csv', '#00ADD8'), 'python': ('python_metrics.csv', '#3776AB')}
+METRICS = [name for name in METRIC_DTYPES if name not in ('execution_id', 'day', 'application')]
+
+CHUNK_BINS = 16384      # bins per embedded chunk
+LEVEL_FACTOR = 4        # each level's bins are this many times wider
+TOP_LEVEL_BINS = 1024   # stop building levels once a whole series fits in this
+MAX_LEVEL_BINS = 65536  # finer levels are left out so the file stays small
+
+
+def sample_interval(seconds: np.ndarray) -> int:
+    """Median spacing of the series, the base width of the aggregated levels"""
+    if len(seconds) < 2:
+        return 1
+    return max(1, int(np.median(np.diff(seconds))))
+
+
+def bin_starts(seconds: np.ndarray, width: int) -> np.ndarray:
+    """Index of the first sample of each non-empty time bin"""
+    bins = seconds // width
+    return np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+
+
+def aggregate(values: np.ndarray, starts: np.ndarray) -> List[np.ndarray]:
+    """[mean, min, max] per bin, ignoring NaN samples"""
+    finite = np.isfinite(values)
+    sums = np.add.reduceat(np.where(finite, values, 0), starts, dtype=np.float64)
+    counts = np.add.reduceat(finite, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = (sums / counts).astype(np.float32)
+    return [mean, np.fmin.reduceat(values, starts), np.fmax.reduceat(values, starts)]
+
+
+class DashboardWriter:
+    def __init__(self, out: TextIO, chunk_bins: int = CHUNK_BINS, min_width: int = 0, max_bins: int = MAX_LEVEL_BINS):
+        """Streams base64 chunks to out and keeps only their index in memory"""
+        self.out = out
+        self.chunk_bins = chunk_bins
+        self.min_width = min_width
+        self.max_bins = max_bins
+        self.chunks = 0
+
+    def chunk(self, arrays: List[np.ndarray]) -> int:
+        payload = b''.join(np.ascontiguousarray(a, dtype=a.dtype.newbyteorder('<')).tobytes() for a in arrays)
+        self.out.write(f'<script type="application/octet-stream" id="c{self.chunks}">')
+        self.out.write(base64.b64encode(payload).decode('ascii'))
+        self.out.write('</script>\n')
+        self.chunks += 1
+        return self.chunks - 1
+
+    def level(self, times: np.ndarray, columns: Dict[str, List[np.ndarray]], width: int) -> Dict:
+        """One time axis per level, shared by every metric column"""
+        level = {'width': width, 'raw': width == 0, 'times': [], 'series': {m: [] for m in columns}}
+        for start in range(0, len(times), self.chunk_bins):
+            part = slice(start, start + self.chunk_bins)
+            t = times[part]
+            level['times'].append({'id': self.chunk([t]), 'n': int(len(t)), 't0': int(t[0]), 't1': int(t[-1]) + width})
+            for metric, arrays in columns.items():
+                level['series'][metric].append(self.chunk([a[part] for a in arrays]))
+        return level
+
+    def _fits(self, bins: int) -> bool:
+        return self.max_bins == 0 or bins <= self.max_bins
+
+    def add_app(self, df, metrics: List[str]) -> Dict:
+        """Raw samples plus a 4x pyramid of min/mean/max bins, minus levels over the budget"""
+        # Naive wall-clock timestamps; the page formats them as UTC so they read the same
+        absolute = df['timestamp'].to_numpy(dtype='datetime64[s]').astype(np.int64)
+        epoch = int(absolute[0])
+        seconds = (absolute - epoch).astype(np.uint32)
+        del absolute
+        values = {m: df[m].to_numpy(dtype=np.float32) for m in metrics}
+
+        levels = []
+        count = len(seconds)
+        if self.min_width == 0 and self._fits(count):
+            levels.append(self.level(seconds, {m: [v] for m, v in values.items()}, 0))
+        else:
+            count += 1  # the first aggregated level is always a candidate
+        width = max(sample_interval(seconds) * LEVEL_FACTOR, self.min_width)
+        while count > TOP_LEVEL_BINS or not levels:
+            starts = bin_starts(seconds, width)
+            # Sparse data: skip widths that merge nothing new
+            if len(starts) < count and (self._fits(len(starts)) or len(starts) <= TOP_LEVEL_BINS):
+                times = (seconds[starts] // width * width).astype(np.uint32)
+                levels.append(self.level(times, {m: aggregate(v, starts) for m, v in values.items()}, width))
+                count = len(starts)
+            width *= LEVEL_FACTOR
+        return {'epoch': epoch, 'rows': int(len(df)), 'levels': levels}
+
+
+def summary_cards(summary: Dict) -> str:
+    memory = summary.get('memory_ratio')
+    speed = summary.get('speed_reduction_percent')
+    cards = [
+        ('Memory Efficiency', format_interval(memory, suffix='x') if memory else 'n/a'),
+        ('Execution Time Reduction', format_interval(speed, suffix='%') if speed else 'n/a'),
+        ('Measurements', f"{summary['total_measurements']:,}"),
+        ('Duration', f"{summary['duration_hours']:.1f} hours"),
+        ('Memory Leaks', leak_label(summary)),
+    ]
+    return ''.join(f'<div class="card"><div class="v">{_esc(v)}</div><div class="k">{_esc(k)}</div></div>'
+                   for k, v in cards)
+
+
+def build_dashboard(analysis_dir: Path, output: Path, metrics: Optional[List[str]] = None,
+                    chunk_bins: int = CHUNK_BINS, min_width: int = 0, max_bins: int = MAX_LEVEL_BINS) -> Dict:
+    """Write the dashboard and return its manifest"""
+    metrics = metrics or METRICS
+    summary = load_summary(analysis_dir)
+    manifest = {'metrics': metrics, 'apps': {}}
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + '.tmp')
+    with tmp.open('w', encoding='utf-8') as out:
+        out.write(HEAD
+                  .replace('<!--CARDS-->', summary_cards(summary))
+                  .replace('<!--RECOMMENDATION-->', _esc(recommendation(summary)))
+                  .replace('<!--GENERATED-->', time.strftime('%Y-%m-%d %H:%M')))
+        writer = DashboardWriter(out, chunk_bins, min_width, max_bins)
+        for app, (filename, color) in APPS.items():
+            path = analysis_dir / filename
+            if not path.exists():
+                continue
+            df = load_metrics(path, ['timestamp'] + metrics).sort_values('timestamp', kind='stable')
+            if len(df):
+                manifest['apps'][app] = dict(writer.add_app(df, metrics), color=color)
+            del df
+
+        # Chunk times are relative to each app's first sample; rebase them onto a shared epoch
+        epoch0 = min((app['epoch'] for app in manifest['apps'].values()), default=0)
+        manifest['epoch0'] = epoch0
+        for app in manifest['apps'].values():
+            app['offset'] = app['epoch'] - epoch0
+            for level in app['levels']:
+                for c in level['times']:
+                    c['t0'] += app['offset']
+                    c['t1'] += app['offset']
+        manifest['chunks'] = writer.chunks
+
+        out.write('<script type="application/json" id="manifest">')
+        out.write(json.dumps(manifest, separators=(',', ':')).replace('</', '<\\/'))
+        out.write('</script>\n')
+        out.write(TAIL)
+    tmp.replace(output)
+    return manifest
+
+
+def _esc(text: str) -> str:
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+HEAD = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Server Monitoring Benchmark Dashboard</title>
+<style>
+body{font-family:system-ui,-apple-system,Segoe UI,Roboto,sans-serif;margin:0;background:#f6f8fa;color:#1f2328}
+header{padding:16px 24px;background:#fff;border-bottom:1px solid #d0d7de}
+h1{font-size:20px;margin:0 0 12px}
+.cards{display:flex;flex-wrap:wrap;gap:12px}
+.card{background:#f6f8fa;border:1px solid #d0d7de;border-radius:6px;padding:8px 14px}
+.card .v{font-size:16px;font-weight:600}.card .k{font-size:12px;color:#59636e}
+.rec{margin-top:10px;font-weight:600;color:#1a7f37}
+.hint{font-size:12px;color:#59636e;margin-top:6px}
+main{display:grid;grid-template-columns:repeat(auto-fill,minmax(560px,1fr));gap:12px;padding:12px 24px}
+.panel{background:#fff;border:1px solid #d0d7de;border-radius:6px;padding:8px}
+.panel h2{font-size:14px;margin:0 0 4px;display:flex;justify-content:space-between}
+.panel h2 span{font-weight:400;color:#59636e;font-size:12px}
+canvas{width:100%;height:180px;display:block;cursor:crosshair}
+.legend{font-size:12px;padding:8px 24px 0}.legend b{display:inline-block;width:10px;height:10px;margin:0 4px 0 12px}
+</style>
+</head>
+<body>
+<header>
+<h1>Server Monitoring Benchmark Dashboard</h1>
+<div class="cards"><!--CARDS--></div>
+<div class="rec"><!--RECOMMENDATION--></div>
+<div class="hint">Scroll to zoom, drag to pan, double-click to reset. All panels share the time axis. Generated <!--GENERATED-->.</div>
+</header>
+<div class="legend" id="legend"></div>
+<main id="panels"></main>
+"""
+
+TAIL = r"""<script>
+const M = JSON.parse(document.getElementById('manifest').textContent);
+const MAX_DECODED = 4000;
+const cache = new Map();
+
+function decode(id, build) {
+  // Chunks are decoded on first use and kept in a small LRU
+  let v = cache.get(id);
+  if (v) { cache.delete(id); cache.set(id, v); return v; }
+  const bin = atob(document.getElementById('c' + id).textContent);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  v = build(bytes.buffer);
+  cache.set(id, v);
+  if (cache.size > MAX_DECODED) cache.delete(cache.keys().next().value);
+  return v;
+}
+function times(app, c) {
+  return decode(c.id, buf => {
+    const u = new Uint32Array(buf, 0, c.n), t = new Float64Array(c.n);
+    for (let i = 0; i < c.n; i++) t[i] = u[i] + app.offset;
+    return t;
+  });
+}
+function values(id, raw, n) {
+  return decode(id, buf => {
+    const mean = new Float32Array(buf, 0, n);
+    return raw ? {mean, min: mean, max: mean}
+               : {mean, min: new Float32Array(buf, 4 * n, n), max: new Float32Array(buf, 8 * n, n)};
+  });
+}
+
+function pickLevel(app, t0, t1, px) {
+  // Finest level with at most ~2 points per pixel in view
+  for (const level of app.levels) {
+    let count = 0;
+    for (const c of level.times) {
+      if (c.t1 < t0 || c.t0 > t1) continue;
+      count += c.n * (Math.min(t1, c.t1) - Math.max(t0, c.t0)) / Math.max(1, c.t1 - c.t0);
+    }
+    if (count <= 2 * px) return level;
+  }
+  return app.levels[app.levels.length - 1];
+}
+function visible(app, metric, t0, t1, px) {
+  const level = pickLevel(app, t0, t1, px);
+  const parts = [];
+  level.times.forEach((c, k) => {
+    if (c.t1 < t0 || c.t0 > t1) return;
+    parts.push(Object.assign({t: times(app, c)}, values(level.series[metric][k], level.raw, c.n)));
+  });
+  return {level, parts};
+}
+
+let full = [Infinity, -Infinity];
+for (const app of Object.values(M.apps))
+  for (const c of app.levels[0].times) { full[0] = Math.min(full[0], c.t0); full[1] = Math.max(full[1], c.t1); }
+if (!isFinite(full[0])) full = [0, 1];
+if (full[1] <= full[0]) full[1] = full[0] + 1;
+let view = full.slice();
+let hoverT = null;
+const panels = [];
+const L = 52, R = 8, T = 6, B = 18;
+
+const legend = document.getElementById('legend');
+for (const [name, app] of Object.entries(M.apps))
+  legend.insertAdjacentHTML('beforeend', `<b style="background:${app.color}"></b>${name} (${app.rows.toLocaleString()} rows)`);
+
+function fmtTime(t, span) {
+  const iso = new Date((M.epoch0 + t) * 1000).toISOString();
+  return span > 3 * 86400 ? iso.slice(0, 10) : span > 600 ? iso.slice(5, 16).replace('T', ' ') : iso.slice(0, 19).replace('T', ' ');
+}
+function fmtVal(v) {
+  const a = Math.abs(v);
+  return a >= 1e6 ? (v / 1e6).toFixed(2) + 'M' : a >= 1e4 ? (v / 1e3).toFixed(1) + 'k' : a >= 100 ? v.toFixed(0) : v.toFixed(2);
+}
+
+function draw(p) {
+  const cv = p.canvas, dpr = window.devicePixelRatio || 1;
+  const W = cv.clientWidth, H = cv.clientHeight, pw = W - L - R, ph = H - T - B;
+  if (cv.width !== Math.round(W * dpr)) { cv.width = Math.round(W * dpr); cv.height = Math.round(H * dpr); }
+  const g = cv.getContext('2d');
+  g.setTransform(dpr, 0, 0, dpr, 0, 0);
+  g.clearRect(0, 0, W, H);
+  const [t0, t1] = view;
+  const data = [];
+  let lo = Infinity, hi = -Infinity;
+  for (const app of Object.values(M.apps)) {
+    const v = visible(app, p.metric, t0, t1, pw);
+    data.push([app, v]);
+    for (const c of v.parts) for (let i = 0; i < c.t.length; i++) {
+      if (c.t[i] + v.level.width < t0 || c.t[i] > t1) continue;
+      if (c.min[i] < lo) lo = c.min[i];
+      if (c.max[i] > hi) hi = c.max[i];
+    }
+  }
+  if (!isFinite(lo)) { lo = 0; hi = 1; }
+  if (hi === lo) { hi += 1; lo -= 1; }
+  const pad = (hi - lo) * 0.05; lo -= pad; hi += pad;
+  const X = t => L + (t - t0) / (t1 - t0) * pw, Y = v => T + (hi - v) / (hi - lo) * ph;
+
+  g.strokeStyle = '#d0d7de'; g.fillStyle = '#59636e'; g.font = '10px system-ui'; g.lineWidth = 1;
+  for (let k = 0; k <= 4; k++) {
+    const v = lo + (hi - lo) * k / 4, y = Y(v);
+    g.beginPath(); g.moveTo(L, y); g.lineTo(L + pw, y); g.stroke();
+    g.fillText(fmtVal(v), 2, y + 3);
+  }
+  for (let k = 0; k <= 3; k++) {
+    const t = t0 + (t1 - t0) * k / 3;
+    g.fillText(fmtTime(t, t1 - t0), Math.max(L, Math.min(L + pw - 90, X(t) - 30)), H - 4);
+  }
+
+  g.save(); g.beginPath(); g.rect(L, T, pw, ph); g.clip();
+  const readout = [];
+  for (const [app, v] of data) {
+    const w = v.level.width;
+    if (!v.level.raw) {
+      // min/max band so spikes inside a bin stay visible at every zoom level
+      g.fillStyle = app.color + '33';
+      for (const c of v.parts) for (let i = 0; i < c.t.length; i++) {
+        const x0 = X(c.t[i]), x1 = Math.max(x0 + 1, X(c.t[i] + w));
+        if (x1 < L || x0 > L + pw || !isFinite(c.max[i])) continue;
+        g.fillRect(x0, Y(c.max[i]), x1 - x0, Math.max(1, Y(c.min[i]) - Y(c.max[i])));
+      }
+    }
+    g.strokeStyle = app.color; g.lineWidth = 1.5; g.beginPath();
+    let started = false, best = null;
+    for (const c of v.parts) for (let i = 0; i < c.t.length; i++) {
+      const t = c.t[i] + w / 2, m = c.mean[i];
+      if (!isFinite(m)) { started = false; continue; }
+      if (started) g.lineTo(X(t), Y(m)); else { g.moveTo(X(t), Y(m)); started = true; }
+      if (hoverT !== null && (best === null || Math.abs(t - hoverT) < Math.abs(best[0] - hoverT))) best = [t, m];
+    }
+    g.stroke();
+    if (best) readout.push(`<span style="color:${app.color}">${fmtVal(best[1])}</span>`);
+  }
+  g.restore();
+  if (hoverT !== null) {
+    g.strokeStyle = '#59636e'; g.beginPath(); g.moveTo(X(hoverT), T); g.lineTo(X(hoverT), T + ph); g.stroke();
+  }
+  p.info.innerHTML = hoverT === null ? '' : fmtTime(hoverT, 0) + ' ' + readout.join(' / ');
+}
+
+let pending = false;
+function redraw() {
+  if (pending) return;
+  pending = true;
+  requestAnimationFrame(() => { pending = false; panels.forEach(draw); });
+}
+function timeAt(p, clientX) {
+  const r = p.canvas.getBoundingClientRect();
+  const f = Math.min(1, Math.max(0, (clientX - r.left - L) / (r.width - L - R)));
+  return view[0] + f * (view[1] - view[0]);
+}
+
+const main = document.getElementById('panels');
+let drag = null;
+window.addEventListener('mouseup', () => { drag = null; });
+for (const metric of M.metrics) {
+  const el = document.createElement('div');
+  el.className = 'panel';
+  el.innerHTML = `<h2>${metric}<span></span></h2><canvas></canvas>`;
+  main.appendChild(el);
+  const p = {metric, canvas: el.querySelector('canvas'), info: el.querySelector('span')};
+  panels.push(p);
+  p.canvas.addEventListener('wheel', e => {
+    e.preventDefault();
+    const t = timeAt(p, e.clientX), f = (t - view[0]) / (view[1] - view[0]);
+    const span = Math.max(60, (view[1] - view[0]) * Math.exp(e.deltaY * 0.002));
+    view = [t - f * span, t + (1 - f) * span];
+    redraw();
+  }, {passive: false});
+  p.canvas.addEventListener('mousedown', e => { drag = [p, e.clientX, view.slice()]; });
+  p.canvas.addEventListener('mousemove', e => {
+    if (drag && drag[0] === p) {
+      const r = p.canvas.getBoundingClientRect();
+      const dt = (e.clientX - drag[1]) / (r.width - L - R) * (drag[2][1] - drag[2][0]);
+      view = [drag[2][0] - dt, drag[2][1] - dt];
+    }
+    hoverT = timeAt(p, e.clientX);
+    redraw();
+  });
+  p.canvas.addEventListener('mouseleave', () => { hoverT = null; redraw(); });
+  p.canvas.addEventListener('dblclick', () => { view = full.slice(); redraw(); });
+}
+window.addEventListener('resize', redraw);
+redraw();
+</script>
+</body>
+</html>
+"""
+
+
+def main():
+    """Main entry point"""
+    base_dir = Path(__file__).parent.parent / 'benchmark-results'
+    parser = argparse.ArgumentParser(description='Build a self-contained HTML benchmark dashboard')
+    parser.add_argument('--analysis-dir', type=Path, default=base_dir / 'analysis')
+    parser.add_argument('--output', type=Path, default=base_dir / 'visualizations' / 'dashboard.html')
+    parser.add_argument('--metrics', type=lambda v: v.split(','), default=None,
+                        help=f"Comma-separated subset of: {', '.join(METRICS)}")
+    parser.add_argument('--chunk-bins', type=int, default=CHUNK_BINS, help='Bins per embedded chunk')
+    parser.add_argument('--min-width', type=int, default=0,
+                        help='Finest bin width in seconds to embed (0 keeps raw samples when they fit)')
+    parser.add_argument('--max-bins', type=int, default=MAX_LEVEL_BINS,
+                        help='Largest zoom level to embed per app; finer ones are dropped (0 = no limit)')
+    args = parser.parse_args()
+
+    unknown = [m for m in args.metrics or [] if m not in METRICS]
+    if unknown:
+        parser.error(f"unknown metric(s): {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    manifest = build_dashboard(args.analysis_dir, args.output, args.metrics, args.chunk_bins,
+                               args.min_width, args.max_bins)
+    rows = sum(app['rows'] for app in manifest['apps'].values())
+    levels = max((len(app['levels']) for app in manifest['apps'].values()), default=0)
+    print(f"✅ Dashboard: {rows:,} rows, {len(manifest['metrics'])} metrics, {levels} zoom levels, "
+          f"{manifest['chunks']} chunks, {args.output.stat().st_size / 1e6:.1f} MB -> {args.output}")
+    print(f"🕒 Built in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
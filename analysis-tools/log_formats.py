@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Log Format Plugins
+Registry of streaming parsers that turn benchmark output into measurement records
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - time -v, perf stat CSV, hyperfine JSON, monitor spans
+
+Each format is a LogFormat subclass registered with @register. The format
+of a file is detected once from its first bytes, then its parse() reads
+the file line by line and yields partial records keyed by the
+parse_logs.py column names (max_rss_kb, elapsed_sec, cpu_percent, ...).
+BenchmarkLogParser.normalize_record() fills defaults and derived fields,
+so every format ends up in the same CSV schema.
+
+Adding a format:
+    @register
+    class MyFormat(LogFormat):
+        name = 'my-format'
+        def sniff(self, head): ...
+        def parse(self, lines, source=None): yield {...}
+"""
+
+import json
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+SNIFF_BYTES = 64 * 1024
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+FORMATS: List['LogFormat'] = []
+
+
+def register(cls):
+    """Class decorator: add a format to the registry (detection runs in registration order)"""
+    FORMATS.append(cls())
+    return cls
+
+
+def get_format(name: str) -> 'LogFormat':
+    for fmt in FORMATS:
+        if fmt.name == name:
+            return fmt
+    raise KeyError(f"unknown log format {name!r}; known: {', '.join(f.name for f in FORMATS)}")
+
+
+def detect_format(path: Path) -> Optional['LogFormat']:
+    """First registered format whose sniff() accepts the start of the file"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        head = f.read(SNIFF_BYTES)
+    for fmt in FORMATS:
+        if fmt.sniff(head):
+            return fmt
+    return None
+
+
+class LogFormat:
+    """Base class for format plugins"""
+    name = ''
+    description = ''
+
+    def sniff(self, head: str) -> bool:
+        """True if the first SNIFF_BYTES of a file look like this format"""
+        raise NotImplementedError
+
+    def parse(self, lines: Iterable[str], source: Optional[Path] = None) -> Iterator[Dict]:
+        """Yield one partial record per measured run, reading lines lazily"""
+        raise NotImplementedError
+
+
+def _cpu_percent(user: float, system: float, elapsed: float) -> int:
+    # Same truncation as "Percent of CPU this job got"
+    return int((user + system) / elapsed * 100) if elapsed > 0 else 0
+
+
+@register
+class HyperfineJsonFormat(LogFormat):
+    name = 'hyperfine-json'
+    description = 'hyperfine --export-json results'
+
+    def sniff(self, head: str) -> bool:
+        return head.lstrip().startswith('{') and '"results"' in head and '"command"' in head
+
+    def parse(self, lines, source=None):
+        # An export is one JSON document with a summary per command, so it is
+        # loaded whole; runs are still yielded one at a time
+        doc = json.loads(''.join(lines))
+        results = doc.get('results', [])
+        # No timestamps in the export: lay the runs out back to back, ending at the file's mtime
+        ended = source.stat().st_mtime if source else time.time()
+        clock = ended - sum(sum(r.get('times') or [r.get('mean', 0)]) for r in results)
+
+        for result in results:
+            times = result.get('times') or [result.get('mean', 0)]
+            exit_codes = result.get('exit_codes') or [0] * len(times)
+            memory = result.get('memory_usage_byte') or []
+            user, system = result.get('user', 0.0), result.get('system', 0.0)
+            for i, elapsed in enumerate(times):
+                record = {
+                    'command': result.get('command', ''),
+                    'timestamp': datetime.fromtimestamp(clock).strftime(TIMESTAMP_FORMAT),
+                    'elapsed_sec': round(elapsed, 4),
+                    # hyperfine only reports mean user/system time per command
+                    'user_time_sec': round(user, 4),
+                    'system_time_sec': round(system, 4),
+                    'cpu_percent': _cpu_percent(user, system, result.get('mean', elapsed)),
+                    'exit_status': exit_codes[i] if i < len(exit_codes) else 0,
+                }
+                if i < len(memory):
+                    record['max_rss_kb'] = int(memory[i] // 1024)
+                clock += elapsed
+                yield record
+
+
+@register
+class MonitorSpanFormat(LogFormat):
+    name = 'monitor-spans'
+    description = 'MONITOR_SPAN_LOG JSON lines from monitor_server.py / monitor-app --log'
+
+    def sniff(self, head: str) -> bool:
+        for line in head.splitlines():
+            if line.strip():
+                try:
+                    span = json.loads(line)
+                except ValueError:
+                    return False
+                return isinstance(span, dict) and 'span' in span and 'dur_ms' in span
+        return False
+
+    def parse(self, lines, source=None):
+        # Child spans are written as each phase ends and the root ("log") last,
+        # so only runs still in progress are held in memory
+        phases: Dict[str, Dict[str, float]] = {}
+        for line in lines:
+            try:
+                span = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(span, dict) or 'span' not in span:
+                continue
+            trace = span.get('trace', '')
+            seconds = span.get('dur_ms', 0) / 1000
+            if span.get('parent'):
+                run = phases.setdefault(trace, {})
+                run[span['span']] = run.get(span['span'], 0.0) + seconds
+                continue
+            if span['span'] != 'log':
+                # Other roots (e.g. "report") trace the data path, not a benchmarked --log run
+                phases.pop(trace, None)
+                continue
+
+            usage = span.get('rusage', {})
+            record = dict(usage)
+            record.update({
+                'application': span.get('app', ''),
+                'command': span.get('cmd', ''),
+                'timestamp': span.get('ts', ''),
+                'elapsed_sec': round(seconds, 4),
+                'cpu_percent': _cpu_percent(usage.get('user_time_sec', 0), usage.get('system_time_sec', 0), seconds),
+                'exit_status': span.get('exit_status', 0),
+                'phases': phases.pop(trace, {}),
+            })
+            yield record
+
+
+# Units perf stat -x prints, in seconds
+PERF_TIME_UNITS = {'ns': 1e-9, 'us': 1e-6, 'usec': 1e-6, 'msec': 1e-3, 'ms': 1e-3, 's': 1.0, 'sec': 1.0}
+PERF_EVENTS = {'task-clock', 'cpu-clock', 'duration_time', 'user_time', 'system_time', 'cycles',
+               'instructions', 'context-switches', 'cs', 'page-faults', 'faults', 'cpu-migrations'}
+
+
+# Columns derived from raw counters; only written when a run carries counters
+PERF_COLUMNS = ['instructions', 'cycles', 'ipc', 'cache_references', 'cache_misses', 'cache_miss_percent',
+                'branches', 'branch_misses', 'branch_miss_percent']
+
+
+def counter_metrics(counters: Dict[str, float]) -> Dict:
+    """IPC and miss rates from a run's raw counters (perf stat -x, event names)
+
+    Events that were not counted (no PMU, perf_event_paranoid, a VM) are
+    simply absent, so their columns stay empty instead of turning into 0.
+    """
+    counts = {event.split(':')[0]: value for event, value in counters.items()}
+    counts.setdefault('branches', counts.get('branch-instructions'))
+    metrics = {}
+    for event in ('instructions', 'cycles', 'cache-references', 'cache-misses', 'branches', 'branch-misses'):
+        if counts.get(event) is not None:
+            metrics[event.replace('-', '_')] = int(counts[event])
+    for column, numerator, denominator, scale, digits in (
+            ('ipc', 'instructions', 'cycles', 1, 3),
+            ('cache_miss_percent', 'cache_misses', 'cache_references', 100, 2),
+            ('branch_miss_percent', 'branch_misses', 'branches', 100, 3)):
+        if metrics.get(denominator) and numerator in metrics:
+            metrics[column] = round(metrics[numerator] / metrics[denominator] * scale, digits)
+    return metrics
+
+
+@register
+class PerfStatCsvFormat(LogFormat):
+    name = 'perf-stat-csv'
+    description = 'perf stat -x, output (one run per "# started on" header)'
+
+    @staticmethod
+    def _fields(line: str) -> Optional[List[str]]:
+        parts = line.strip().split(',')
+        if len(parts) < 3 or not parts[2]:
+            return None
+        value = parts[0]
+        if not (value[:1].isdigit() or value.startswith('<')):
+            return None  # the benchmarked program's own output on stderr
+        return parts
+
+    def sniff(self, head: str) -> bool:
+        if TIME_V_MARKER in head:
+            return False  # time -v blocks with perf stat lines appended: time-v reads both
+        for line in head.splitlines()[:50]:
+            if line.startswith('# started on'):
+                return True
+            parts = self._fields(line)
+            if parts and parts[2].split(':')[0] in PERF_EVENTS:
+                return True
+        return False
+
+    def parse(self, lines, source=None):
+        counters: Dict[str, tuple] = {}
+        started = ''
+        for line in lines:
+            if line.startswith('# started on'):
+                if counters:
+                    yield self._record(counters, started)
+                counters = {}
+                started = self._started(line)
+                continue
+            parts = self._fields(line)
+            if parts is None:
+                continue
+            event = parts[2].split(':')[0]
+            if event in counters:  # no header between runs: a repeated event starts the next one
+                yield self._record(counters, started)
+                counters, started = {}, ''
+            try:
+                value = float(parts[0])
+            except ValueError:
+                continue  # <not counted> / <not supported>
+            metric = parts[5] if len(parts) > 6 and parts[6] == 'CPUs utilized' else ''
+            counters[event] = (value, parts[1], metric)
+        if counters:
+            yield self._record(counters, started)
+
+    @staticmethod
+    def _started(line: str) -> str:
+        text = ' '.join(line[len('# started on'):].split())
+        try:
+            return datetime.strptime(text, '%a %b %d %H:%M:%S %Y').strftime(TIMESTAMP_FORMAT)
+        except ValueError:
+            return ''
+
+    @staticmethod
+    def _seconds(counters, event: str, default_unit: str = 'ns') -> float:
+        value, unit, _ = counters[event]
+        return value * PERF_TIME_UNITS.get(unit or default_unit, 1.0)
+
+    def _record(self, counters, started: str) -> Dict:
+        record = {'timestamp': started, 'counters': {event: c[0] for event, c in counters.items()}}
+        clock = 'task-clock' if 'task-clock' in counters else 'cpu-clock' if 'cpu-clock' in counters else None
+        cpu_sec = self._seconds(counters, clock, 'msec') if clock else 0.0
+
+        if 'duration_time' in counters:
+            record['elapsed_sec'] = round(self._seconds(counters, 'duration_time'), 4)
+        elif clock and counters[clock][2]:
+            record['elapsed_sec'] = round(cpu_sec / float(counters[clock][2]), 4)
+        if 'user_time' in counters:
+            record['user_time_sec'] = round(self._seconds(counters, 'user_time'), 4)
+        if 'system_time' in counters:
+            record['system_time_sec'] = round(self._seconds(counters, 'system_time'), 4)
+        if cpu_sec and record.get('elapsed_sec'):
+            record['cpu_percent'] = int(cpu_sec / record['elapsed_sec'] * 100)
+
+        # perf counts every switch; time -v's voluntary column is the closest match
+        for events, column in ((('context-switches', 'cs'), 'voluntary_context_switches'),
+                               (('minor-faults', 'page-faults', 'faults'), 'minor_page_faults'),
+                               (('major-faults',), 'major_page_faults')):
+            for event in events:
+                if event in counters:
+                    record[column] = int(counters[event][0])
+                    break
+        return record
+
+
+# time -v label -> (column, converter); elapsed stays text until normalize_record()
+TIME_V_FIELDS = {
+    'Maximum resident set size (kbytes)': ('max_rss_kb', int),
+    'User time (seconds)': ('user_time_sec', float),
+    'System time (seconds)': ('system_time_sec', float),
+    'Percent of CPU this job got': ('cpu_percent', lambda v: int(v.rstrip('%'))),
+    'Elapsed (wall clock) time (h:mm:ss or m:ss)': ('elapsed_time', str),
+    'Minor (reclaiming a frame) page faults': ('minor_page_faults', int),
+    'Major (requiring I/O) page faults': ('major_page_faults', int),
+    'Voluntary context switches': ('voluntary_context_switches', int),
+    'Involuntary context switches': ('involuntary_context_switches', int),
+    'File system inputs': ('file_system_inputs', int),
+    'File system outputs': ('file_system_outputs', int),
+    'Socket messages sent': ('socket_messages_sent', int),
+    'Socket messages received': ('socket_messages_received', int),
+    'Signals delivered': ('signals_delivered', int),
+    'Page size (bytes)': ('page_size_bytes', int),
+    'Exit status': ('exit_status', int),
+}
+TIME_V_MARKER = 'Command being timed:'
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})')
+MIN_BLOCK_LINES = 6
+
+
+@register
+class TimeVerboseFormat(LogFormat):
+    name = 'time-v'
+    description = 'GNU /usr/bin/time -v output, one block per "Command being timed:"'
+
+    def sniff(self, head: str) -> bool:
+        return TIME_V_MARKER in head or 'Maximum resident set size (kbytes)' in head
+
+    @staticmethod
+    def blocks(lines: Iterable[str]) -> Iterator[str]:
+        """Text from each "Command being timed:" up to the next one
+
+        Whatever the program printed between two runs (e.g. Go's log lines)
+        stays with the run before it, as the original split() did.
+        """
+        block = None
+        for line in lines:
+            pos = line.find(TIME_V_MARKER)
+            if pos < 0:
+                if block is not None:
+                    block.append(line)
+                continue
+            if block is not None:
+                block.append(line[:pos])
+                yield ''.join(block)
+            block = [line[pos:]]
+        if block is not None:
+            yield ''.join(block)
+
+    @staticmethod
+    def parse_block(block: str) -> Dict:
+        """Partial record from one block; the first value of each label wins
+
+        perf stat -x, lines after the block (perf_counters.py, or perf stat
+        wrapped around /usr/bin/time) are kept as raw counters.
+        """
+        record = {}
+        for line in block.split('\n'):
+            label, sep, value = line.strip().partition(': ')
+            if 'timestamp' not in record:
+                match = TIMESTAMP_PATTERN.search(line)
+                if match:
+                    record['timestamp'] = match.group(1)
+            if not sep:
+                parts = PerfStatCsvFormat._fields(line) if ',' in line else None
+                if parts and ' ' not in parts[2]:
+                    try:
+                        record.setdefault('counters', {})[parts[2]] = float(parts[0])
+                    except ValueError:
+                        pass  # <not counted> / <not supported>
+                continue
+            if label == TIME_V_MARKER[:-1]:
+                record.setdefault('command', value.strip().strip('"'))
+                continue
+            field = TIME_V_FIELDS.get(label)
+            if field is None or field[0] in record:
+                continue
+            column, convert = field
+            try:
+                record[column] = convert(value.strip())
+            except ValueError:
+                record[column] = 0
+        return record
+
+    @classmethod
+    def execution_blocks(cls, lines: Iterable[str]) -> Iterator[str]:
+        """blocks() long enough to be a timed run"""
+        for block in cls.blocks(lines):
+            if len(block.strip().split('\n')) >= MIN_BLOCK_LINES:
+                yield block
+
+    def parse(self, lines, source=None):
+        for block in self.execution_blocks(lines):
+            yield self.parse_block(block)
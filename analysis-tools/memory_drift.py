@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Memory Drift Analyzer
+Samples RSS, USS and Python heap of a long-running process and tests for leaks
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Drift benchmark mode on top of parse_logs.py
+
+Modes:
+    --pid / --name      sample an external process from /proc (RSS, PSS, USS)
+    --callable F:FUNC   call FUNC from file F in-process every interval and
+                        also track the Python heap with tracemalloc, so growth
+                        can be attributed to allocation sites
+    --segments DIR      analyze samples already written by
+                        monitor_server.py --watch (process-segments)
+"""
+
+import argparse
+import csv
+import importlib.util
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmark_summary import Z_95, leak_verdict
+from parse_logs import BenchmarkLogParser
+
+# Theil-Sen is O(n^2) in pairs; evenly thin longer series to this many points
+MAX_TREND_POINTS = 600
+
+# Leading columns of legacy-python/process_watch.py PROCESS_COLUMNS
+SEGMENT_COLUMNS = ['timestamp', 'pid', 'name', 'max_rss_kb', 'rss_kb']
+
+SAMPLE_COLUMNS = [
+    'execution_id', 'timestamp', 'day', 'application',
+    'max_rss_kb', 'max_rss_mb', 'rss_kb', 'pss_kb', 'uss_kb', 'heap_kb'
+]
+SITE_COLUMNS = ['rank', 'site', 'size_diff_kb', 'count_diff', 'growth_kb_per_hour', 'checkpoints_growing']
+
+
+def _thin(xs: List[float], ys: List[float], limit: int = MAX_TREND_POINTS) -> Tuple[List[float], List[float]]:
+    if len(xs) <= limit:
+        return xs, ys
+    step = (len(xs) - 1) / (limit - 1)
+    idx = [round(i * step) for i in range(limit)]
+    return [xs[i] for i in idx], [ys[i] for i in idx]
+
+
+def _normal_two_sided_p(z: float) -> float:
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def robust_trend(hours: List[float], values: List[float]) -> Dict:
+    """Theil-Sen slope with Mann-Kendall significance and Sen's confidence interval
+
+    Both are rank based, so a single GC pause or a one-off allocation spike
+    cannot fake (or hide) a trend the way it can with least squares.
+    """
+    hours, values = _thin(hours, values)
+    n = len(values)
+    result = {'n': n, 'slope_per_hour': 0.0, 'ci_low': 0.0, 'ci_high': 0.0, 'z': 0.0, 'p_value': 1.0}
+    if n < 3:
+        return result
+
+    slopes = []
+    s = 0
+    for i in range(n - 1):
+        xi, yi = hours[i], values[i]
+        for j in range(i + 1, n):
+            dy = values[j] - yi
+            s += (dy > 0) - (dy < 0)
+            dx = hours[j] - xi
+            if dx != 0:
+                slopes.append(dy / dx)
+    if not slopes:
+        return result
+    slopes.sort()
+
+    ties: Dict[float, int] = {}
+    for v in values:
+        ties[v] = ties.get(v, 0) + 1
+    var_s = (n * (n - 1) * (2 * n + 5)
+             - sum(t * (t - 1) * (2 * t + 5) for t in ties.values() if t > 1)) / 18
+    if var_s > 0:
+        z = (s - 1) / math.sqrt(var_s) if s > 0 else (s + 1) / math.sqrt(var_s) if s < 0 else 0.0
+    else:
+        z = 0.0
+
+    # Sen (1968): rank bounds of the slope CI from the Mann-Kendall variance
+    m = len(slopes)
+    c = Z_95 * math.sqrt(var_s)
+    lower = max(0, min(m - 1, int(round((m - c) / 2)) - 1))
+    upper = max(0, min(m - 1, int(round((m + c) / 2))))
+
+    result.update(slope_per_hour=statistics.median(slopes), ci_low=slopes[lower], ci_high=slopes[upper],
+                  z=z, p_value=_normal_two_sided_p(z))
+    return result
+
+
+def read_proc_memory(pid: int, proc: str = '/proc') -> Dict[str, Optional[int]]:
+    """RSS/HWM from status, PSS/USS from smaps_rollup (all in KB)"""
+    base = os.path.join(proc, str(pid))
+    out: Dict[str, Optional[int]] = {'max_rss_kb': None, 'rss_kb': None, 'pss_kb': None, 'uss_kb': None}
+    with open(os.path.join(base, 'status'), 'rb') as f:
+        for line in f:
+            if line.startswith(b'VmHWM:'):
+                out['max_rss_kb'] = int(line.split()[1])
+            elif line.startswith(b'VmRSS:'):
+                out['rss_kb'] = int(line.split()[1])
+
+    try:
+        with open(os.path.join(base, 'smaps_rollup'), 'rb') as f:
+            private = 0
+            for line in f:
+                if line.startswith(b'Pss:'):
+                    out['pss_kb'] = int(line.split()[1])
+                elif line.startswith((b'Private_Clean:', b'Private_Dirty:')):
+                    private += int(line.split()[1])
+            out['uss_kb'] = private
+    except OSError:
+        pass  # smaps_rollup needs ptrace access (or kernel >= 4.14)
+    return out
+
+
+def find_pid(name: str, proc: str = '/proc') -> Optional[int]:
+    """Oldest process whose comm or argv basename matches name"""
+    own = os.getpid()
+    matches = []
+    for entry in os.listdir(proc):
+        if not entry.isdigit() or int(entry) == own:
+            continue
+        try:
+            with open(os.path.join(proc, entry, 'comm'), 'rb') as f:
+                comm = f.read().strip().decode('utf-8', 'replace')
+            with open(os.path.join(proc, entry, 'cmdline'), 'rb') as f:
+                argv = [os.path.basename(a.decode('utf-8', 'replace')) for a in f.read().split(b'\0')[:3] if a]
+        except OSError:
+            continue
+        if name == comm or name in argv:
+            matches.append(int(entry))
+    return min(matches) if matches else None
+
+
+def load_callable(spec: str) -> Callable[[], object]:
+    """'path/to/file.py:func' -> func"""
+    path, _, func = spec.rpartition(':')
+    if not path or not func:
+        raise ValueError(f"Expected FILE:FUNCTION, got {spec!r}")
+    path = os.path.abspath(path)
+    sys.path.insert(0, os.path.dirname(path))
+    module_spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return getattr(module, func)
+
+
+class MemoryDriftAnalyzer(BenchmarkLogParser):
+    def __init__(self, label: str, top: int = 10):
+        """Samples share parse_logs.py's row layout and analysis directory"""
+        super().__init__()
+        self.label = label
+        self.top = top
+        self.samples: List[Dict] = []
+        self.epochs: List[float] = []
+        self.checkpoints: List[Tuple[float, Dict[str, Tuple[int, int]]]] = []
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.last_snapshot: Optional[tracemalloc.Snapshot] = None
+        # Series that decide the verdict; in-process RSS also carries tracemalloc's own overhead
+        self.judged = {'rss_kb', 'pss_kb', 'uss_kb', 'heap_kb'}
+
+    def record(self, now: float, memory: Dict[str, Optional[int]], heap_kb: Optional[float] = None) -> None:
+        stamp = datetime.fromtimestamp(now)
+        max_rss_kb = memory.get('max_rss_kb') or 0
+        self.epochs.append(now)
+        self.samples.append({
+            'execution_id': len(self.samples) + 1,
+            'timestamp': stamp.strftime('%Y-%m-%d %H:%M:%S'),
+            'day': stamp.strftime('%Y-%m-%d'),
+            'application': self.label,
+            'max_rss_kb': max_rss_kb,
+            'max_rss_mb': round(max_rss_kb / 1024, 2),
+            'rss_kb': memory.get('rss_kb'),
+            'pss_kb': memory.get('pss_kb'),
+            'uss_kb': memory.get('uss_kb'),
+            'heap_kb': round(heap_kb, 1) if heap_kb is not None else None,
+        })
+
+    def sample_pid(self, pid: int, duration: float, interval: float) -> None:
+        print(f"🔍 Sampling PID {pid} every {interval:g}s for {duration:g}s")
+        deadline = time.time() + duration
+        while True:
+            now = time.time()
+            try:
+                self.record(now, read_proc_memory(pid))
+            except OSError:
+                print(f"⚠️  PID {pid} exited after {len(self.samples)} samples")
+                return
+            if now + interval > deadline:
+                return
+            time.sleep(max(0.0, interval - (time.time() - now)))
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        # Hide the profiler's and this analyzer's own bookkeeping
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    def _checkpoint(self, now: float, snapshot: tracemalloc.Snapshot) -> None:
+        sites = {str(stat.traceback): (stat.size, stat.count) for stat in snapshot.statistics('lineno')}
+        self.checkpoints.append((now, sites))
+        self.last_snapshot = snapshot
+
+    def sample_callable(self, func: Callable[[], object], duration: float, interval: float,
+                        warmup: int = 3, checkpoints: int = 8) -> None:
+        """Call func every interval under tracemalloc; the first calls fill caches and are not judged"""
+        print(f"🔍 Calling {getattr(func, '__qualname__', func)} every {interval:g}s for {duration:g}s "
+              f"(tracemalloc, {warmup} warm-up calls)")
+        self.judged = {'heap_kb'}
+        tracemalloc.start(1)
+        for _ in range(warmup):
+            func()
+        self.baseline = self._snapshot()
+        pid = os.getpid()
+
+        started = time.time()
+        deadline = started + duration
+        checkpoint_every = max(duration / checkpoints, interval)
+        next_checkpoint = started
+        while True:
+            now = time.time()
+            func()
+            # Heap from a filtered snapshot, get_traced_memory() would count our own sample list
+            snapshot = self._snapshot()
+            heap_bytes = sum(trace.size for trace in snapshot.traces)
+            self.record(now, read_proc_memory(pid), heap_bytes / 1024)
+            if now >= next_checkpoint:
+                self._checkpoint(now, snapshot)
+                next_checkpoint += checkpoint_every
+            if now + interval > deadline:
+                break
+            time.sleep(max(0.0, interval - (time.time() - now)))
+        self._checkpoint(time.time(), self._snapshot())
+        tracemalloc.stop()
+
+    def load_segments(self, segment_dir: Path, target: str) -> None:
+        """Read monitor_server.py --watch segments for one PID or process name"""
+        paths = sorted(Path(segment_dir).rglob('segment-*.csv'))
+        rows = []
+        for path in paths:
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                for row in csv.reader(f):
+                    if len(row) < len(SEGMENT_COLUMNS) or row[0] == 'timestamp':
+                        continue
+                    record = dict(zip(SEGMENT_COLUMNS, row))
+                    if target in (record['pid'], record['name']):
+                        rows.append(record)
+
+        # A restarted process is a new series: keep the PID seen in the latest sample
+        if rows and not target.isdigit():
+            latest_pid = max(rows, key=lambda r: r['timestamp'])['pid']
+            rows = [r for r in rows if r['pid'] == latest_pid]
+        for record in sorted(rows, key=lambda r: r['timestamp']):
+            now = datetime.strptime(record['timestamp'], '%Y-%m-%d %H:%M:%S').timestamp()
+            self.record(now, {'max_rss_kb': int(record['max_rss_kb'] or 0),
+                              'rss_kb': int(record['rss_kb']) if record['rss_kb'] else None})
+        print(f"✅ {len(self.samples)} samples for {target} from {len(paths)} segments")
+
+    def metric_trends(self) -> Dict[str, Dict]:
+        """Robust trend + leak verdict per memory series, slopes in bytes per hour"""
+        if not self.epochs:
+            return {}
+        start = self.epochs[0]
+        trends = {}
+        for metric in ('rss_kb', 'pss_kb', 'uss_kb', 'heap_kb'):
+            pairs = [((t - start) / 3600, s[metric] * 1024)
+                     for t, s in zip(self.epochs, self.samples) if s[metric] is not None]
+            if len(pairs) < 3:
+                continue
+            hours, values = [p[0] for p in pairs], [p[1] for p in pairs]
+            trend = robust_trend(hours, values)
+            verdict = leak_verdict(trend, statistics.fmean(values))
+            # Practical growth alone is not enough, the interval must exclude zero too
+            verdict['leak_suspected'] = verdict['leak_suspected'] and trend['ci_low'] > 0
+            verdict['judged'] = metric in self.judged
+            trends[metric] = verdict
+        return trends
+
+    def site_growth(self) -> List[Dict]:
+        """Top-N allocation sites by growth since warm-up, with their own trend"""
+        if self.baseline is None or self.last_snapshot is None:
+            return []
+        span = (self.checkpoints[-1][0] - self.checkpoints[0][0]) / 3600 if len(self.checkpoints) > 1 else 0
+        start = self.checkpoints[0][0] if self.checkpoints else 0
+        sites = []
+        for rank, stat in enumerate(self.last_snapshot.compare_to(self.baseline, 'lineno')[:self.top], 1):
+            key = str(stat.traceback)
+            series = [site.get(key, (0, 0))[0] for _, site in self.checkpoints]
+            growing = sum(1 for a, b in zip(series, series[1:]) if b > a)
+            slope = 0.0
+            if span > 0:
+                hours = [(t - start) / 3600 for t, _ in self.checkpoints]
+                slope = robust_trend(hours, series)['slope_per_hour']
+            sites.append({
+                'rank': rank,
+                'site': key,
+                'size_diff_kb': round(stat.size_diff / 1024, 1),
+                'count_diff': stat.count_diff,
+                'growth_kb_per_hour': round(slope / 1024, 1),
+                'checkpoints_growing': f"{growing}/{max(len(series) - 1, 0)}",
+            })
+        return sites
+
+    def write_results(self, trends: Dict[str, Dict], sites: List[Dict]) -> Path:
+        output_path = self.analysis_dir / f'drift_{self.label}.csv'
+        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=SAMPLE_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(self.samples)
+        print(f"✅ Drift samples: {len(self.samples)} rows -> {output_path}")
+
+        if sites:
+            sites_path = self.analysis_dir / f'drift_{self.label}_sites.csv'
+            with open(sites_path, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=SITE_COLUMNS)
+                writer.writeheader()
+                writer.writerows(sites)
+            print(f"✅ Allocation sites: {len(sites)} rows -> {sites_path}")
+        return output_path
+
+    def print_report(self, trends: Dict[str, Dict], sites: List[Dict]) -> None:
+        hours = (self.epochs[-1] - self.epochs[0]) / 3600 if len(self.epochs) > 1 else 0
+        print(f"\n📈 Memory drift for {self.label}: {len(self.samples)} samples over {hours:.2f} hours")
+        print("Metric   │   Growth (bytes/hour) │ 95% CI                            │ p-value │ Verdict")
+        print("─────────┼───────────────────────┼───────────────────────────────────┼─────────┼────────")
+        for metric, trend in trends.items():
+            verdict = '⚠️ LEAK' if trend['leak_suspected'] else '✅ stable'
+            if not trend['judged']:
+                verdict += ' (info only)'
+            ci = f"{trend['ci_low']:+,.0f} .. {trend['ci_high']:+,.0f}"
+            print(f"{metric:8s} │ {trend['slope_per_hour']:+21,.0f} │ {ci:33s} │ {trend['p_value']:7.4f} │ {verdict}")
+
+        if sites:
+            print(f"\n🧬 Top {len(sites)} allocation sites by growth since warm-up:")
+            for site in sites:
+                print(f"  {site['rank']:2d}. {site['size_diff_kb']:+10.1f} KB "
+                      f"({site['growth_kb_per_hour']:+.1f} KB/h, growing {site['checkpoints_growing']}) {site['site']}")
+
+    def run(self, args: argparse.Namespace) -> int:
+        if args.segments:
+            self.load_segments(args.segments, args.name or str(args.pid))
+        elif args.callable:
+            self.sample_callable(load_callable(args.callable), args.duration, args.interval, args.warmup)
+        else:
+            pid = args.pid or find_pid(args.name)
+            if pid is None:
+                print(f"❌ No running process matches {args.name!r}")
+                return 1
+            self.sample_pid(pid, args.duration, args.interval)
+
+        if len(self.samples) < 3:
+            print("❌ Need at least 3 samples for a trend")
+            return 1
+        trends = self.metric_trends()
+        sites = self.site_growth()
+        self.print_report(trends, sites)
+        self.write_results(trends, sites)
+        return 2 if any(t['leak_suspected'] and t['judged'] for t in trends.values()) else 0
+
+
+def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--pid', type=int, help='PID of the running monitor')
+    target.add_argument('--name', help='Process name (comm or script basename)')
+    target.add_argument('--callable', help='FILE.py:FUNCTION to run in-process with tracemalloc')
+    parser.add_argument('--segments', type=Path, help='Analyze process-segments written by --watch instead of sampling')
+    parser.add_argument('--duration', type=float, default=3600, help='Sampling duration in seconds')
+    parser.add_argument('--interval', type=float, default=10, help='Seconds between samples')
+    parser.add_argument('--warmup', type=int, default=3, help='Calls before the tracemalloc baseline')
+    parser.add_argument('--top', type=int, default=10, help='Allocation sites to report')
+    parser.add_argument('--label', help='Output name (default: derived from the target)')
+    args = parser.parse_args()
+    if args.segments and args.callable:
+        parser.error('--segments needs --pid or --name')
+
+    label = args.label or (args.name or (args.callable and Path(args.callable.rpartition(':')[0]).stem) or f'pid{args.pid}')
+    return MemoryDriftAnalyzer(label.replace(os.sep, '_'), top=args.top).run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
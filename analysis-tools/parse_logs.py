@@ -10,12 +10,41 @@ Version: 2.0 - Enhanced with multi-day processing
 
 import re
 import csv
+import json
 import os
 import datetime as dt
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+from log_formats import PERF_COLUMNS, TIMESTAMP_PATTERN, TimeVerboseFormat, counter_metrics, detect_format
+
+# Command regex -> application (and optional variant) of the run. The first
+# match wins; "Command being timed:" lines, hyperfine commands and span cmds
+# are all checked. Override with benchmark-results/analysis/applications.json
+# (same list format) to add implementations, e.g.
+#   {"pattern": "monitor-app-pgo --log", "application": "golang", "variant": "pgo"}
+# Each application/variant pair gets its own <label>_metrics.csv.
+APPLICATIONS_FILENAME = 'applications.json'
+DEFAULT_APPLICATIONS = [
+    {'pattern': r'monitor-app\b', 'application': 'golang'},
+    {'pattern': r'python[\d.]*\s.*monitor_server\.py', 'application': 'python'},
+]
+
+# N-way comparisons are relative to the legacy implementation
+BASELINE_APPLICATION = 'python'
+
+METRIC_COLUMNS = [
+    'execution_id', 'timestamp', 'day', 'application',
+    'max_rss_kb', 'max_rss_mb', 'elapsed_sec', 'user_time_sec', 
+    'system_time_sec', 'cpu_percent', 'minor_page_faults', 
+    'major_page_faults', 'voluntary_context_switches', 
+    'involuntary_context_switches', 'file_system_outputs', 
+    'file_system_inputs', 'socket_messages_sent', 
+    'socket_messages_received', 'exit_status', 'efficiency_ratio',
+    'memory_efficiency_score', 'performance_score'
+]
+
 class BenchmarkLogParser:
     def __init__(self):
         """Initialize parser with regex patterns and file paths"""
@@ -26,32 +55,21 @@ class BenchmarkLogParser:
         # Create analysis directory if it doesn't exist
         self.analysis_dir.mkdir(parents=True, exist_ok=True)
         
-        # Enhanced regex patterns for comprehensive data extraction
-        self.patterns = {
-            'max_rss_kb': r'Maximum resident set size \(kbytes\):\s+(\d+)',
-            'user_time_sec': r'User time \(seconds\):\s+([\d.]+)',
-            'system_time_sec': r'System time \(seconds\):\s+([\d.]+)',
-            'cpu_percent': r'Percent of CPU this job got:\s+(\d+)%',
-            'elapsed_time': r'Elapsed \(wall clock\) time \(h:mm:ss or m:ss\):\s+([\d:.]+)',
-            'minor_page_faults': r'Minor \(reclaiming a frame\) page faults:\s+(\d+)',
-            'major_page_faults': r'Major \(requiring I/O\) page faults:\s+(\d+)',
-            'voluntary_context_switches': r'Voluntary context switches:\s+(\d+)',
-            'involuntary_context_switches': r'Involuntary context switches:\s+(\d+)',
-            'file_system_inputs': r'File system inputs:\s+(\d+)',
-            'file_system_outputs': r'File system outputs:\s+(\d+)',
-            'socket_messages_sent': r'Socket messages sent:\s+(\d+)',
-            'socket_messages_received': r'Socket messages received:\s+(\d+)',
-            'signals_delivered': r'Signals delivered:\s+(\d+)',
-            'page_size_bytes': r'Page size \(bytes\):\s+(\d+)',
-            'exit_status': r'Exit status:\s+(\d+)'
+        # Metric columns every record gets (0 when a format does not report them)
+        self.metric_defaults = {
+            'max_rss_kb': 0, 'user_time_sec': 0, 'system_time_sec': 0, 'cpu_percent': 0,
+            'elapsed_time': 0, 'minor_page_faults': 0, 'major_page_faults': 0,
+            'voluntary_context_switches': 0, 'involuntary_context_switches': 0,
+            'file_system_inputs': 0, 'file_system_outputs': 0, 'socket_messages_sent': 0,
+            'socket_messages_received': 0, 'signals_delivered': 0, 'page_size_bytes': 0,
+            'exit_status': 0
         }
         
         # Timestamp pattern for log entries
-        self.timestamp_pattern = r'(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})'
+        self.timestamp_pattern = TIMESTAMP_PATTERN
         
         # Command patterns for application detection
-        self.go_command_pattern = r'"\.\/monitor-app --log"'
-        self.python_command_pattern = r'"\/opt\/monitoring\/env\/bin\/python3.*monitor_server\.py --log"'
+        self.applications = self.load_applications(self.analysis_dir / APPLICATIONS_FILENAME)
         
     def extract_timestamp(self, text: str, execution_id: int, day: str) -> str:
         """Extract timestamp from log block or generate one"""
@@ -81,12 +99,14 @@ class BenchmarkLogParser:
             return 0.0
             
         parts = elapsed_str.split(':')
-        if len(parts) == 2:  # mm:ss format
-            return int(parts[0]) * 60 + float(parts[1])
-        elif len(parts) == 3:  # h:mm:ss format
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-        else:
-            return 0.0
+        try:
+            if len(parts) == 2:  # mm:ss format
+                return int(parts[0]) * 60 + float(parts[1])
+            elif len(parts) == 3:  # h:mm:ss format
+                return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+        except ValueError:
+            pass  # Damaged line; like other unreadable values it counts as 0
+        return 0.0
     
     def determine_day_from_filename(self, filename: str) -> str:
         """Extract day information from filename"""
@@ -100,42 +120,29 @@ class BenchmarkLogParser:
             return 'day1'  # Default to day1
     
     def parse_execution_block(self, block: str, app_type: str, execution_id: int, day: str) -> Optional[Dict]:
-        """Parse a single execution block from log"""
+        """Parse a single /usr/bin/time -v execution block from log"""
+        return self.normalize_record(TimeVerboseFormat.parse_block(block), execution_id, app_type, day)
+    
+    def normalize_record(self, record: Dict, execution_id: int, app_type: str, day: str) -> Dict:
+        """Turn a partial record from any log format into a full CSV row"""
         data = {
             'execution_id': execution_id,
             'application': app_type,
             'day': day,
-            'timestamp': self.extract_timestamp(block, execution_id, day)
+            'timestamp': record.get('timestamp') or self.extract_timestamp('', execution_id, day)
         }
-        
-        # Extract all metrics using regex patterns
-        for metric, pattern in self.patterns.items():
-            match = re.search(pattern, block, re.MULTILINE)
-            if match:
-                value = match.group(1)
-                try:
-                    # Convert to appropriate type
-                    if metric == 'elapsed_time':
-                        data[metric] = value  # Keep as string for conversion
-                    elif 'time' in metric:
-                        data[metric] = float(value)
-                    elif 'percent' in metric:
-                        data[metric] = int(value)
-                    elif 'exit_status' in metric:
-                        data[metric] = int(value)
-                    else:
-                        data[metric] = int(value)
-                except ValueError:
-                    data[metric] = 0
+        data.update(self.metric_defaults)
+        for key, value in record.items():
+            if key not in ('application', 'timestamp'):
+                data[key] = value
+        
+        # Convert elapsed time to seconds (time -v only reports h:mm:ss)
+        if 'elapsed_sec' not in record:
+            elapsed_time_value = data.get('elapsed_time')
+            if elapsed_time_value:
+                data['elapsed_sec'] = self.convert_elapsed_to_seconds(elapsed_time_value)
             else:
-                data[metric] = 0
-        
-        # Convert elapsed time to seconds
-        elapsed_time_value = data.get('elapsed_time')
-        if elapsed_time_value:
-            data['elapsed_sec'] = self.convert_elapsed_to_seconds(elapsed_time_value)
-        else:
-            data['elapsed_sec'] = 0.0
+                data['elapsed_sec'] = 0.0
         
         # Calculate derived metrics
         memory_kb = data.get('max_rss_kb', 0)
@@ -143,88 +150,103 @@ class BenchmarkLogParser:
         
         if memory_kb > 0:
             data['max_rss_mb'] = round(memory_kb / 1024, 2)
-            data['memory_efficiency_score'] = round(1000000 / memory_kb, 2)  # Higher is better
         else:
             data['max_rss_mb'] = 0.0
-            data['memory_efficiency_score'] = 0
-        
+
         if memory_kb > 0 and elapsed_sec > 0:
             data['efficiency_ratio'] = round(memory_kb / elapsed_sec, 2)
         else:
             data['efficiency_ratio'] = 0
-        
-        # Calculate performance score (0-100, higher is better)
-        memory_kb = data.get('max_rss_kb', 0)
-        if memory_kb > 0:
-            memory_score = min(100, 100 * 1024 / memory_kb)  # Based on 1MB as baseline
-        else:
-            memory_score = 0
-            
-        cpu_score = max(0, 100 - data.get('cpu_percent', 100))
-        speed_score = max(0, 100 - min(data.get('elapsed_sec', 100), 60))
-        
-        data['performance_score'] = round(
-            memory_score * 0.4 + cpu_score * 0.3 + speed_score * 0.3, 2
-        )
-        
+
+        # Hardware counters (perf stat lines / perf_counters.py), when the run has them
+        if record.get('counters'):
+            data.update(counter_metrics(record['counters']))
+
+        # performance_score / memory_efficiency_score are filled by score_measurements()
         return data
+
+    def score_measurements(self, data: List[Dict]) -> None:
+        """Score all parsed rows at once with the model in analysis/scoring_model.json"""
+        # Imported here so the parsing helpers stay usable without numpy
+        from scoring import MODEL_FILENAME, ScoringModel
+
+        model = ScoringModel.load(self.analysis_dir / MODEL_FILENAME)
+        model.score_records(data)
+        print(f"🧮 Scored {len(data)} measurements: {model.describe()}")
+    
+    def load_applications(self, path: Path) -> List[Dict]:
+        """Command classification rules from applications.json, or the defaults"""
+        rules = DEFAULT_APPLICATIONS
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    rules = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring {path.name}: {e}")
+        return [dict(rule, regex=re.compile(rule['pattern'])) for rule in rules]
+    
+    def classify_command(self, command: str) -> Optional[str]:
+        """Output stream label ("golang", "golang-pgo", ...) of a benchmarked command"""
+        for rule in self.applications:
+            if rule['regex'].search(command):
+                variant = rule.get('variant')
+                return f"{rule['application']}-{variant}" if variant else rule['application']
+        return None
+    
+    def classify_record(self, record: Dict, app_type: str) -> str:
+        """Command first; then the application a record names itself (spans); then the filename"""
+        return self.classify_command(record.get('command', '')) or record.get('application') or app_type
     
     def split_into_execution_blocks(self, content: str, app_type: str) -> List[str]:
-        """Split log content into individual execution blocks"""
-        if app_type == 'golang':
-            command_pattern = self.go_command_pattern
-        else:
-            command_pattern = self.python_command_pattern
-        
-        # Split by "Command being timed:" pattern (more robust)
-        sections = re.split(r'Command being timed:', content)
-        blocks = []
-        
-        for section in sections:
-            section = section.strip()
-            if not section:
-                continue
-            
-            # Extract command line to identify valid blocks
-            lines = section.split('\n')
-            if len(lines) > 5:  # Minimum lines for a valid execution block
-                # Add back the "Command being timed:" prefix for consistency
-                block = "Command being timed:" + section
-                blocks.append(block)
-        
-        return blocks
+        """Execution blocks of content that classify_record() assigns to app_type"""
+        return [block for block in TimeVerboseFormat.execution_blocks(content.splitlines(keepends=True))
+                if self.classify_record(TimeVerboseFormat.parse_block(block), app_type) == app_type]
+    
+    def detect_application(self, file_path: Path) -> str:
+        """Application hint from the filename, used when the command is not recognized"""
+        name = file_path.name.lower()
+        if 'golang' in name or 'go_' in name:
+            return 'golang'
+        elif 'python' in name or 'py_' in name:
+            return 'python'
+        return 'unknown'
     
     def process_log_file(self, file_path: Path) -> Tuple[List[Dict], str]:
-        """Process a single log file and return parsed data with app type"""
+        """Process a single log file and return parsed data with app type
+
+        Rows are labelled per run from its command, so a log holding several
+        implementations is split while it is read; execution ids count per label.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            log_format = detect_format(file_path)
         except Exception as e:
             print(f"❌ Error reading {file_path}: {e}")
             return [], 'unknown'
         
-        # Determine application type
-        if 'golang' in file_path.name.lower() or 'go_' in file_path.name.lower():
-            app_type = 'golang'
-        elif 'python' in file_path.name.lower() or 'py_' in file_path.name.lower():
-            app_type = 'python'
-        else:
-            app_type = 'unknown'
+        if log_format is None:
+            print(f"⚠️  {file_path.name}: unrecognized log format, skipped")
+            return [], 'unknown'
         
-        # Determine day from filename
+        app_type = self.detect_application(file_path)
         day = self.determine_day_from_filename(file_path.name)
         
-        # Split into execution blocks
-        blocks = self.split_into_execution_blocks(content, app_type)
-        
-        # Parse each block
+        # Records are parsed while the file is read, so large logs are never held in memory whole
         parsed_data = []
-        for i, block in enumerate(blocks, 1):
-            parsed = self.parse_execution_block(block, app_type, i, day)
-            if parsed:
-                parsed_data.append(parsed)
+        counts: Dict[str, int] = {}
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                for record in log_format.parse(f, file_path):
+                    label = self.classify_record(record, app_type)
+                    counts[label] = counts.get(label, 0) + 1
+                    parsed = self.normalize_record(record, counts[label], label, day)
+                    parsed['format'] = log_format.name
+                    parsed_data.append(parsed)
+        except Exception as e:
+            print(f"❌ Error parsing {file_path} as {log_format.name}: {e}")
+            return [], 'unknown'
         
-        print(f"✅ {file_path.name}: {len(parsed_data)} measurements ({app_type})")
+        labels = ', '.join(f"{label}: {count}" for label, count in counts.items()) or app_type
+        print(f"✅ {file_path.name}: {len(parsed_data)} measurements ({labels}, {log_format.name})")
         return parsed_data, app_type
     
     def find_log_files(self) -> List[Path]:
@@ -233,31 +255,24 @@ class BenchmarkLogParser:
             print(f"❌ Directory not found: {self.raw_logs_dir}")
             return []
         
-        # Look for benchmark log files
+        # Look for benchmark log files (time -v logs, perf stat CSV, hyperfine JSON, monitor spans);
+        # rows are assigned by their command, so the filename is only a fallback
         log_files = []
-        for pattern in ['bench_go_day*.log', 'bench_py_day*.log', 'bench_go.log', 'bench_py.log']:
+        for pattern in ['bench_*.log', 'bench_*.csv', 'bench_*.json', 'bench_*.jsonl', 'spans*.jsonl']:
             log_files.extend(self.raw_logs_dir.glob(pattern))
         
-        return sorted(log_files)
+        return sorted(set(log_files))
     
-    def write_golang_csv(self, data: List[Dict]) -> None:
-        """Write Golang data to CSV"""
+    def write_metrics_csv(self, label: str, data: List[Dict]) -> None:
+        """Write one application's measurements to <label>_metrics.csv"""
+        title = {'golang': 'Golang', 'python': 'Python'}.get(label, label)
         if not data:
-            print("❌ No Golang data to write")
+            print(f"❌ No {title} data to write")
             return
         
-        columns = [
-            'execution_id', 'timestamp', 'day', 'application',
-            'max_rss_kb', 'max_rss_mb', 'elapsed_sec', 'user_time_sec', 
-            'system_time_sec', 'cpu_percent', 'minor_page_faults', 
-            'major_page_faults', 'voluntary_context_switches', 
-            'involuntary_context_switches', 'file_system_outputs', 
-            'file_system_inputs', 'socket_messages_sent', 
-            'socket_messages_received', 'exit_status', 'efficiency_ratio',
-            'memory_efficiency_score', 'performance_score'
-        ]
-        
-        output_path = self.analysis_dir / 'golang_metrics.csv'
+        output_path = self.analysis_dir / f'{label}_metrics.csv'
+        # Counter columns only when some run was captured with counters; runs without them stay empty
+        columns = METRIC_COLUMNS + PERF_COLUMNS if any(row.get('counters') for row in data) else METRIC_COLUMNS
         
         try:
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
@@ -265,41 +280,18 @@ class BenchmarkLogParser:
                 writer.writeheader()
                 writer.writerows(data)
             
-            print(f"✅ Golang CSV created: {len(data)} rows -> {output_path}")
+            print(f"✅ {title} CSV created: {len(data)} rows -> {output_path}")
             
         except Exception as e:
-            print(f"❌ Error writing Golang CSV: {e}")
+            print(f"❌ Error writing {title} CSV: {e}")
+    
+    def write_golang_csv(self, data: List[Dict]) -> None:
+        """Write Golang data to CSV"""
+        self.write_metrics_csv('golang', data)
     
     def write_python_csv(self, data: List[Dict]) -> None:
         """Write Python data to CSV"""
-        if not data:
-            print("❌ No Python data to write")
-            return
-        
-        # Same columns as Golang for consistency
-        columns = [
-            'execution_id', 'timestamp', 'day', 'application',
-            'max_rss_kb', 'max_rss_mb', 'elapsed_sec', 'user_time_sec', 
-            'system_time_sec', 'cpu_percent', 'minor_page_faults', 
-            'major_page_faults', 'voluntary_context_switches', 
-            'involuntary_context_switches', 'file_system_outputs', 
-            'file_system_inputs', 'socket_messages_sent', 
-            'socket_messages_received', 'exit_status', 'efficiency_ratio',
-            'memory_efficiency_score', 'performance_score'
-        ]
-        
-        output_path = self.analysis_dir / 'python_metrics.csv'
-        
-        try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=columns, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(data)
-            
-            print(f"✅ Python CSV created: {len(data)} rows -> {output_path}")
-            
-        except Exception as e:
-            print(f"❌ Error writing Python CSV: {e}")
+        self.write_metrics_csv('python', data)
     
     def write_combined_summary(self, go_data: List[Dict], py_data: List[Dict]) -> None:
         """Write combined summary CSV with daily statistics"""
@@ -388,6 +380,57 @@ class BenchmarkLogParser:
         except Exception as e:
             print(f"❌ Error writing combined summary: {e}")
     
+    def write_comparison_summary(self, streams: Dict[str, List[Dict]]) -> None:
+        """Write per-day statistics for every application/variant against the baseline"""
+        stats = {}
+        for label, rows in streams.items():
+            by_day = {}
+            for row in rows:
+                by_day.setdefault(row['day'], []).append(row)
+            stats[label] = {day: self.calculate_day_statistics(day_rows) for day, day_rows in by_day.items()}
+        
+        baseline = BASELINE_APPLICATION if BASELINE_APPLICATION in stats else sorted(stats)[0]
+        all_days = sorted({day for per_day in stats.values() for day in per_day})
+        
+        summary_data = []
+        for day in all_days:
+            base = stats[baseline].get(day, self.calculate_day_statistics([]))
+            for label in sorted(stats):
+                if day not in stats[label]:
+                    continue
+                day_stats = stats[label][day]
+                memory_ratio = base['avg_memory_kb'] / day_stats['avg_memory_kb'] if day_stats['avg_memory_kb'] > 0 else 0
+                cpu_improvement = ((base['avg_cpu_percent'] - day_stats['avg_cpu_percent']) / base['avg_cpu_percent'] * 100) if base['avg_cpu_percent'] > 0 else 0
+                speed_improvement = ((base['avg_elapsed_sec'] - day_stats['avg_elapsed_sec']) / base['avg_elapsed_sec'] * 100) if base['avg_elapsed_sec'] > 0 else 0
+                summary_data.append({
+                    'day': day,
+                    'application': label,
+                    'baseline': baseline,
+                    'measurements': day_stats['count'],
+                    'avg_memory_kb': round(day_stats['avg_memory_kb'], 2),
+                    'min_memory_kb': day_stats['min_memory_kb'],
+                    'max_memory_kb': day_stats['max_memory_kb'],
+                    'memory_variance_kb': day_stats['memory_variance_kb'],
+                    'avg_cpu_percent': round(day_stats['avg_cpu_percent'], 2),
+                    'avg_elapsed_sec': round(day_stats['avg_elapsed_sec'], 2),
+                    'memory_efficiency_ratio': round(memory_ratio, 2),
+                    'cpu_improvement_percent': round(cpu_improvement, 2),
+                    'speed_improvement_percent': round(speed_improvement, 2)
+                })
+        
+        output_path = self.analysis_dir / 'comparison_summary.csv'
+        
+        try:
+            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=list(summary_data[0]))
+                writer.writeheader()
+                writer.writerows(summary_data)
+            
+            print(f"✅ Comparison summary created: {len(stats)} applications vs {baseline} -> {output_path}")
+            
+        except Exception as e:
+            print(f"❌ Error writing comparison summary: {e}")
+    
     def calculate_day_statistics(self, data: List[Dict]) -> Dict:
         """Calculate statistics for a day's data"""
         if not data:
@@ -433,24 +476,37 @@ class BenchmarkLogParser:
             print(f"   - {file.name}")
         print()
         
-        # Process all files
-        all_go_data = []
-        all_py_data = []
+        # Process all files; each row goes to the stream its command was classified as
+        streams: Dict[str, List[Dict]] = {}
+        skipped = 0
         
         for file_path in log_files:
             print(f"🔄 Processing {file_path.name}...")
             data, app_type = self.process_log_file(file_path)
             
-            if app_type == 'golang':
-                all_go_data.extend(data)
-            elif app_type == 'python':
-                all_py_data.extend(data)
+            for row in data:
+                if row['application'] == 'unknown':
+                    skipped += 1
+                else:
+                    streams.setdefault(row['application'], []).append(row)
+        
+        all_go_data = streams.get('golang', [])
+        all_py_data = streams.get('python', [])
+        icons = {'golang': '🐹', 'python': '🐍'}
         
         print(f"\n📊 Total measurements found:")
         print(f"   🐹 Golang: {len(all_go_data)} measurements")
         print(f"   🐍 Python: {len(all_py_data)} measurements")
+        for label in sorted(set(streams) - set(icons)):
+            print(f"   🔹 {label}: {len(streams[label])} measurements")
+        if skipped:
+            print(f"   ⚠️  {skipped} measurements with an unrecognized command skipped (see {APPLICATIONS_FILENAME})")
         print()
-        
+
+        # Percentile models rank each run against the whole fleet, so score all apps together
+        self.score_measurements([row for rows in streams.values() for row in rows])
+        print()
+
         # Write CSV files
         print("📈 Writing CSV files...")
         
@@ -460,9 +516,17 @@ class BenchmarkLogParser:
         if all_py_data:
             self.write_python_csv(all_py_data)
         
+        extra_streams = sorted(set(streams) - set(icons))
+        for label in extra_streams:
+            self.write_metrics_csv(label, streams[label])
+        
         if all_go_data and all_py_data:
             self.write_combined_summary(all_go_data, all_py_data)
         
+        # combined_summary.csv is Go vs Python only; other variants get an N-way table
+        if extra_streams and len(streams) > 1:
+            self.write_comparison_summary(streams)
+        
         print(f"\n🎉 Parsing completed successfully!")
         print(f"📁 Output files created in: {self.analysis_dir}")
         print()
@@ -471,8 +535,12 @@ class BenchmarkLogParser:
             print("   ✅ golang_metrics.csv - Individual Go measurements")
         if all_py_data:
             print("   ✅ python_metrics.csv - Individual Python measurements")
+        for label in extra_streams:
+            print(f"   ✅ {label}_metrics.csv - Individual {label} measurements")
         if all_go_data and all_py_data:
             print("   ✅ combined_summary.csv - Daily statistics & comparisons")
+        if extra_streams and len(streams) > 1:
+            print("   ✅ comparison_summary.csv - Daily statistics for every application")
         print()
         print("🚀 Ready for visualization and analysis!")
 
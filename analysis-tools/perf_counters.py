@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Hardware Counter Capture
+Counts instructions, cycles, cache and branch misses of a benchmark run via perf_event_open
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - perf stat -x, compatible counters for time -v logs and A/B runs
+
+Wrap the cron command in front of /usr/bin/time -v; the counters are
+printed as perf stat -x, lines right after the time -v block, where
+parse_logs.py picks them up (ipc, cache_miss_percent, ... columns):
+
+    perf_counters.py -- /usr/bin/time -v ./monitor-app --log 2>> bench_go.log
+
+The counters are opened on the child with enable_on_exec and inherit, the
+same way perf stat counts a workload, so nothing else runs in the measured
+process tree and the perf binary is not needed. Events the host cannot
+count (no PMU in a VM, missing ARM PMU driver, perf_event_paranoid) are
+left out; without any, the command runs exactly as before. As non-root
+with perf_event_paranoid >= 2 only user space is counted (":u", like perf).
+
+Examples:
+    python perf_counters.py --check
+    python perf_counters.py -e instructions,cycles -- /usr/bin/time -v python3 monitor_server.py --log
+"""
+
+import argparse
+import ctypes
+import errno
+import json
+import os
+import platform
+import socket
+import struct
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# perf stat event name -> (perf_type_id, config)
+PERF_TYPE_HARDWARE = 0
+PERF_TYPE_SOFTWARE = 1
+EVENTS = {
+    'cycles': (PERF_TYPE_HARDWARE, 0),
+    'instructions': (PERF_TYPE_HARDWARE, 1),
+    'cache-references': (PERF_TYPE_HARDWARE, 2),
+    'cache-misses': (PERF_TYPE_HARDWARE, 3),
+    'branches': (PERF_TYPE_HARDWARE, 4),
+    'branch-misses': (PERF_TYPE_HARDWARE, 5),
+    'task-clock': (PERF_TYPE_SOFTWARE, 1),
+    'page-faults': (PERF_TYPE_SOFTWARE, 2),
+    'context-switches': (PERF_TYPE_SOFTWARE, 3),
+    'cpu-migrations': (PERF_TYPE_SOFTWARE, 4),
+}
+DEFAULT_EVENTS = ['instructions', 'cycles', 'cache-references', 'cache-misses', 'branches', 'branch-misses']
+
+# __NR_perf_event_open; 32-bit Raspberry Pi OS reports armv7l/armv6l
+SYSCALL_NUMBERS = {'x86_64': 298, 'aarch64': 241, 'armv7l': 364, 'armv6l': 364, 'i686': 336, 'i386': 336}
+
+ATTR_SIZE = 64  # PERF_ATTR_SIZE_VER0, accepted by every kernel with perf events
+READ_FORMAT = 1 | 2  # TOTAL_TIME_ENABLED | TOTAL_TIME_RUNNING, to scale multiplexed counters
+FLAG_DISABLED = 1 << 0
+FLAG_INHERIT = 1 << 1
+FLAG_EXCLUDE_KERNEL = 1 << 5
+FLAG_EXCLUDE_HV = 1 << 6
+FLAG_ENABLE_ON_EXEC = 1 << 12
+PERF_FLAG_FD_CLOEXEC = 1 << 3
+
+_libc = None
+
+
+def _syscall():
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(None, use_errno=True)
+    return _libc.syscall
+
+
+def open_event(name: str, enable_on_exec: bool = False) -> Tuple[int, str]:
+    """perf_event_open() for the calling process and its future children: (fd, perf stat name)"""
+    number = SYSCALL_NUMBERS.get(platform.machine())
+    if number is None:
+        raise OSError(errno.ENOSYS, f"perf_event_open number unknown for {platform.machine()}")
+    event_type, config = EVENTS[name]
+    flags = FLAG_DISABLED | FLAG_INHERIT | (FLAG_ENABLE_ON_EXEC if enable_on_exec else 0)
+    err = 0
+    for user_only in (False, True):
+        attr = ctypes.create_string_buffer(ATTR_SIZE)
+        struct.pack_into('IIQQQQQ', attr, 0, event_type, ATTR_SIZE, config, 0, 0, READ_FORMAT,
+                         flags | (FLAG_EXCLUDE_KERNEL | FLAG_EXCLUDE_HV if user_only else 0))
+        # pid 0, any CPU, no group
+        fd = _syscall()(ctypes.c_long(number), attr, ctypes.c_long(0), ctypes.c_long(-1), ctypes.c_long(-1),
+                        ctypes.c_ulong(PERF_FLAG_FD_CLOEXEC))
+        if fd >= 0:
+            return fd, f"{name}:u" if user_only else name
+        err = ctypes.get_errno()
+        # perf_event_paranoid >= 2 refuses kernel counting to non-root
+        if err not in (errno.EACCES, errno.EPERM):
+            break
+    raise OSError(err, os.strerror(err))
+
+
+def scale_count(value: int, enabled: int, running: int) -> Optional[Tuple[float, int, int]]:
+    """(count scaled for multiplexing, time enabled, time running); None if never scheduled"""
+    if not running:
+        return None
+    return (value * enabled / running if running < enabled else float(value), enabled, running)
+
+
+def probe(events: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Events this host can count, and why the others cannot"""
+    available, errors = [], {}
+    for name in events:
+        try:
+            fd, _ = open_event(name)
+        except OSError as e:
+            errors[name] = e.strerror or str(e)
+            continue
+        os.close(fd)
+        available.append(name)
+    return available, errors
+
+
+class PerfCounters:
+    """Counters of one child process, opened in the child before exec()
+
+    Pass attach() as preexec_fn and call collect() once Popen returns: the
+    child opens its counters (enable_on_exec, so the Python between fork
+    and exec is not counted) and hands the fds over a socketpair, so the
+    parent can read the totals after the child and its children exit.
+    """
+
+    def __init__(self, events: Optional[List[str]] = None):
+        self.events = list(events or DEFAULT_EVENTS)
+        self.fds: Dict[str, int] = {}
+        self.errors: Dict[str, str] = {}
+        self._parent, self._child = socket.socketpair()
+
+    def attach(self) -> None:
+        """preexec_fn: runs in the child between fork and exec"""
+        opened, errors = {}, {}
+        for name in self.events:
+            try:
+                fd, label = open_event(name, enable_on_exec=True)
+                opened[label] = fd
+            except OSError as e:
+                errors[name] = e.strerror or str(e)
+        payload = json.dumps({'events': list(opened), 'errors': errors}).encode()
+        socket.send_fds(self._child, [payload], list(opened.values()))
+        # The parent's copies keep the counters alive
+        for fd in opened.values():
+            os.close(fd)
+
+    def collect(self) -> None:
+        self._child.close()
+        data, fds, _, _ = socket.recv_fds(self._parent, 65536, len(self.events))
+        message = json.loads(data)
+        self.fds = dict(zip(message['events'], fds))
+        self.errors = message['errors']
+
+    def read(self) -> Dict[str, Optional[Tuple[float, int, int]]]:
+        """event -> (count scaled for multiplexing, time enabled, time running); None if never scheduled"""
+        return {name: scale_count(*struct.unpack('QQQ', os.read(fd, 24))) for name, fd in self.fds.items()}
+
+    def close(self) -> None:
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds = {}
+        self._parent.close()
+        self._child.close()
+
+
+def format_perf_csv(counts: Dict[str, Optional[Tuple[float, int, int]]]) -> str:
+    """perf stat -x, lines: value,unit,event,run time,% running,,"""
+    lines = []
+    for name, count in counts.items():
+        if count is None:
+            lines.append(f"<not counted>,,{name},0,0.00,,")
+        elif name.split(':')[0] == 'task-clock':
+            lines.append(f"{count[0] / 1e6:.2f},msec,{name},{count[2]},{count[2] / count[1] * 100:.2f},,")
+        else:
+            lines.append(f"{count[0]:.0f},,{name},{count[2]},{count[2] / count[1] * 100:.2f},,")
+    return ''.join(line + '\n' for line in lines)
+
+
+def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-e', '--events', default=','.join(DEFAULT_EVENTS),
+                        help=f"Comma-separated perf stat event names ({', '.join(EVENTS)})")
+    parser.add_argument('-o', '--output', help='Append the counter lines here instead of stderr')
+    parser.add_argument('--check', action='store_true', help='Show which events this host can count and exit')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='-- COMMAND [ARGS...]')
+    args = parser.parse_args()
+
+    events = [e.strip() for e in args.events.split(',') if e.strip()]
+    unknown = [e for e in events if e not in EVENTS]
+    if unknown:
+        parser.error(f"unknown event(s): {', '.join(unknown)}")
+    available, errors = probe(events)
+
+    if args.check:
+        for name in events:
+            print(f"{'✅' if name in available else '❌'} {name:18s} {errors.get(name, '')}")
+        return 0 if available else 1
+
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error('no command given')
+    counters = PerfCounters(available) if available else None
+    try:
+        proc = subprocess.Popen(command, preexec_fn=counters.attach if counters else None)
+    except OSError as e:
+        print(f"perf_counters.py: {command[0]}: {e.strerror}", file=sys.stderr)
+        return 127
+    if counters is None:
+        # Nothing to count on this host: behave like the bare command
+        return _exit_code(proc.wait())
+    counters.collect()
+    returncode = proc.wait()
+    text = format_perf_csv(counters.read())
+    counters.close()
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        sys.stderr.write(text)
+    return _exit_code(returncode)
+
+
+def _exit_code(returncode: int) -> int:
+    # Killed by a signal: the shell convention, as time -v's "Exit status"
+    return returncode if returncode >= 0 else 128 - returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
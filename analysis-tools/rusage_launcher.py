@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Run Launcher
+Forks and execs one benchmark run from a small process and reports its rusage
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Uninflated ru_maxrss for ab_benchmark.py runs
+
+Linux carries the RSS high-water mark of the process that calls exec()
+over into the new program's ru_maxrss. A run spawned straight from
+ab_benchmark.py therefore never reports less than the orchestrator's own
+RSS (18 MB or more), which hides the Go monitor's ~12 MB. /usr/bin/time
+avoids this by being a small C program; this launcher does the same with
+only os and time imported. What remains is the launcher's own footprint
+(about 7 MB, 10 MB with perf counters): a run's maximum RSS is exact
+whenever it is above that floor, and ab_benchmark.py measures the floor
+with a trivial run before every session.
+
+Counters are opened here before the fork with enable_on_exec, so they
+count the run from its exec() on and not the launcher.
+
+Started by ab_benchmark.py as
+    python -I -S rusage_launcher.py RESULT_FD EVENTS COMMAND [ARGS...]
+with EVENTS a comma-separated perf stat event list or "-". Writes
+"pid <child>" as soon as the run is started (so the caller can kill it on
+timeout), then one "<field> <value>" line per rusage field, the elapsed
+time, the wait status and "counter <event> <value> <enabled> <running>".
+"""
+
+import os
+import sys
+import time
+
+RUSAGE_FIELDS = ['ru_utime', 'ru_stime', 'ru_maxrss', 'ru_minflt', 'ru_majflt', 'ru_nswap', 'ru_inblock',
+                 'ru_oublock', 'ru_msgsnd', 'ru_msgrcv', 'ru_nsignals', 'ru_nvcsw', 'ru_nivcsw']
+
+
+def main() -> int:
+    """Main entry point"""
+    if len(sys.argv) < 4:
+        sys.stderr.write("usage: rusage_launcher.py RESULT_FD EVENTS COMMAND [ARGS...]\n")
+        return 2
+    result = os.fdopen(int(sys.argv[1]), 'w')
+    events = [e for e in sys.argv[2].split(',') if e and e != '-']
+    command = sys.argv[3:]
+
+    counters = {}
+    if events:
+        # -I drops the script directory from sys.path
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        import struct
+        from perf_counters import open_event
+        for name in events:
+            try:
+                fd, label = open_event(name, enable_on_exec=True)
+            except OSError:
+                continue  # ab_benchmark.py already reported what this host cannot count
+            counters[label] = fd
+
+    clock = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        result.close()
+        try:
+            os.execvp(command[0], command)
+        except OSError as e:
+            sys.stderr.write(f"rusage_launcher.py: {command[0]}: {e.strerror}\n")
+        os._exit(127)  # Same as the shell and time -v for a missing command
+
+    result.write(f"pid {pid}\n")
+    result.flush()
+    _, status, usage = os.wait4(pid, 0)
+    elapsed = time.perf_counter() - clock
+
+    lines = [f"elapsed {elapsed!r}", f"status {status}"]
+    lines += [f"{field} {getattr(usage, field)!r}" for field in RUSAGE_FIELDS]
+    for label, fd in counters.items():
+        value, enabled, running = struct.unpack('QQQ', os.read(fd, 24))
+        lines.append(f"counter {label} {value} {enabled} {running}")
+    result.write(''.join(line + '\n' for line in lines))
+    result.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Scoring Model
+Vectorized performance / memory-efficiency scores, separate from log parsing
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Configurable weights, baselines and fleet-percentile normalization
+
+parse_logs.py only extracts raw measurements; the two score columns are
+filled afterwards for every record at once. Re-scoring the stored CSVs
+with a different model only rewrites performance_score and
+memory_efficiency_score (plus the per-day averages in combined_summary.csv)
+and never touches the raw logs.
+
+The model in effect is kept in benchmark-results/analysis/scoring_model.json
+so the next parse_logs.py run scores the same way.
+
+Normalizations:
+    baseline    memory 100 * baseline_kb / rss (capped at 100), cpu 100 - %,
+                speed 100 - min(elapsed, cap); the original fixed formula
+    percentile  100 * (1 - mid-rank percentile) of each measurement across
+                the whole fleet (every app and day); lower raw value scores higher
+
+Example:
+    python scoring.py --normalization percentile
+    python scoring.py --model my_model.json
+    python scoring.py --weights memory=0.5,cpu=0.25,speed=0.25
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+MODEL_FILENAME = 'scoring_model.json'
+METRIC_FILES = {'golang': 'golang_metrics.csv', 'python': 'python_metrics.csv'}
+SUMMARY_FILE = 'combined_summary.csv'
+SUMMARY_SCORE_COLUMNS = {'golang': 'go_avg_performance_score', 'python': 'py_avg_performance_score'}
+INPUT_COLUMNS = ['max_rss_kb', 'cpu_percent', 'elapsed_sec']
+SCORE_COLUMNS = ['memory_efficiency_score', 'performance_score']
+NORMALIZATIONS = ['baseline', 'percentile']
+
+# Reproduces the scores parse_logs.py has always written
+DEFAULT_MODEL = {
+    'normalization': 'baseline',
+    'weights': {'memory': 0.4, 'cpu': 0.3, 'speed': 0.3},
+    'memory_baseline_kb': 1024,
+    'speed_cap_sec': 60,
+    'efficiency_scale': 1_000_000,
+}
+
+
+def fleet_percentile(values: np.ndarray) -> np.ndarray:
+    """Mid-rank percentile (0-1) of each value within the array; ties share a rank"""
+    if len(values) == 0:
+        return np.zeros(0)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    below = np.cumsum(counts) - counts
+    return (below + counts / 2)[inverse] / len(values)
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """round(x, 2) as the parser wrote it; np.round can land one cent off on .xx5 ties"""
+    rounded = np.round(values, 2)
+    # Only values within float error of a tie can differ; fix those with Python's round()
+    ties = np.flatnonzero(np.abs(values * 100 - np.floor(values * 100) - 0.5) < 1e-6)
+    for i in ties:
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+class ScoringModel:
+    def __init__(self, config: Optional[Dict] = None):
+        """Model parameters merged over DEFAULT_MODEL"""
+        config = dict(DEFAULT_MODEL, **(config or {}))
+        config['weights'] = dict(DEFAULT_MODEL['weights'], **config.get('weights', {}))
+        if config['normalization'] not in NORMALIZATIONS:
+            raise ValueError(f"normalization must be one of {NORMALIZATIONS}, got {config['normalization']!r}")
+        if any(w < 0 for w in config['weights'].values()) or set(config['weights']) != set(DEFAULT_MODEL['weights']):
+            raise ValueError(f"weights must be non-negative values for {sorted(DEFAULT_MODEL['weights'])}")
+        self.config = config
+
+    @classmethod
+    def load(cls, path: Path) -> 'ScoringModel':
+        """Model from a JSON file, or the default model if it does not exist"""
+        if not path.exists():
+            return cls()
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def save(self, path: Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.config, f, indent=2)
+            f.write('\n')
+
+    def components(self, memory_kb: np.ndarray, cpu_percent: np.ndarray, elapsed_sec: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-record 0-100 sub-scores, higher is better"""
+        measured = memory_kb > 0
+        if self.config['normalization'] == 'percentile':
+            memory = np.zeros(len(memory_kb))
+            memory[measured] = 100 * (1 - fleet_percentile(memory_kb[measured]))
+            return {
+                'memory': memory,
+                'cpu': 100 * (1 - fleet_percentile(cpu_percent)),
+                'speed': 100 * (1 - fleet_percentile(elapsed_sec)),
+            }
+
+        with np.errstate(divide='ignore'):
+            memory = np.where(measured, np.minimum(100, 100 * self.config['memory_baseline_kb'] / memory_kb), 0)
+        return {
+            'memory': memory,
+            'cpu': np.maximum(0, 100 - cpu_percent),
+            'speed': np.maximum(0, 100 - np.minimum(elapsed_sec, self.config['speed_cap_sec'])),
+        }
+
+    def score(self, memory_kb, cpu_percent, elapsed_sec) -> Dict[str, np.ndarray]:
+        """performance_score and memory_efficiency_score for whole columns at once"""
+        memory_kb = np.asarray(memory_kb, dtype=np.float64)
+        cpu_percent = np.asarray(cpu_percent, dtype=np.float64)
+        elapsed_sec = np.asarray(elapsed_sec, dtype=np.float64)
+        parts = self.components(memory_kb, cpu_percent, elapsed_sec)
+        weights = self.config['weights']
+        performance = parts['memory'] * weights['memory'] + parts['cpu'] * weights['cpu'] + parts['speed'] * weights['speed']
+
+        if self.config['normalization'] == 'percentile':
+            efficiency = parts['memory']
+        else:
+            with np.errstate(divide='ignore'):
+                efficiency = np.where(memory_kb > 0, self.config['efficiency_scale'] / memory_kb, 0)
+        return {'memory_efficiency_score': round2(efficiency), 'performance_score': round2(performance)}
+
+    def score_records(self, records: List[Dict]) -> None:
+        """Fill the score columns of parsed measurement dicts in place"""
+        columns = {c: np.fromiter((row.get(c, 0) for row in records), dtype=np.float64, count=len(records))
+                   for c in INPUT_COLUMNS}
+        scores = self.score(columns['max_rss_kb'], columns['cpu_percent'], columns['elapsed_sec'])
+        for column, values in scores.items():
+            for row, value in zip(records, values.tolist()):
+                row[column] = value
+
+    def describe(self) -> str:
+        w = self.config['weights']
+        text = f"{self.config['normalization']} (memory {w['memory']:g}, cpu {w['cpu']:g}, speed {w['speed']:g}"
+        if self.config['normalization'] == 'baseline':
+            text += f", {self.config['memory_baseline_kb']:g} KB memory baseline, {self.config['speed_cap_sec']:g}s speed cap"
+        return text + ')'
+
+
+def _write_csv(df, path: Path) -> None:
+    tmp = path.with_name(path.name + '.tmp')
+    df.to_csv(tmp, index=False, lineterminator='\r\n')  # same line endings as csv.DictWriter
+    os.replace(tmp, path)
+
+
+def _rewrite_scores(path: Path, scores: Dict[str, np.ndarray]) -> None:
+    """Replace the score columns of a metric CSV, leaving every other byte as it was
+
+    parse_logs.py writes the scores as the last two columns, so each line
+    only needs its tail swapped; that avoids re-parsing and re-formatting
+    the other twenty columns, which dominates the cost on large files.
+    """
+    with open(path, 'rb') as src:
+        header = src.readline()
+        names = header.rstrip(b'\r\n').split(b',')
+        if names[-len(SCORE_COLUMNS):] != [c.encode() for c in SCORE_COLUMNS]:
+            import pandas as pd
+            df = pd.read_csv(path, dtype=str, keep_default_na=False)
+            for column in SCORE_COLUMNS:
+                df[column] = scores[column]
+            _write_csv(df, path)
+            return
+
+        ending = header[len(header.rstrip(b'\r\n')):]
+        tails = (f',{e!r},{p!r}'.encode() + ending
+                 for e, p in zip(*(scores[c].tolist() for c in SCORE_COLUMNS)))
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as dst:
+            dst.write(header)
+            for line, tail in zip(src, tails):
+                cut = line.rindex(b',', 0, line.rindex(b','))
+                dst.write(line[:cut] + tail)
+    os.replace(tmp, path)
+
+
+def rescore_csvs(analysis_dir: Path, model: ScoringModel) -> Dict[str, int]:
+    """Re-score every <app>_metrics.csv in place; fleet percentiles span all of them"""
+    import pandas as pd
+
+    # golang/python first, then any extra application variants parse_logs.py wrote
+    files = dict(METRIC_FILES)
+    for path in sorted(analysis_dir.glob('*_metrics.csv')):
+        files.setdefault(path.name[:-len('_metrics.csv')], path.name)
+
+    inputs = {}
+    for app, filename in files.items():
+        path = analysis_dir / filename
+        if path.exists():
+            inputs[app] = pd.read_csv(path, usecols=INPUT_COLUMNS + ['day'], dtype={'day': 'category'})
+    if not inputs:
+        return {}
+
+    fleet = {c: np.concatenate([df[c].to_numpy(dtype=np.float64) for df in inputs.values()]) for c in INPUT_COLUMNS}
+    scores = model.score(fleet['max_rss_kb'], fleet['cpu_percent'], fleet['elapsed_sec'])
+
+    start = 0
+    daily = {}
+    for app, df in inputs.items():
+        part = slice(start, start + len(df))
+        start += len(df)
+        _rewrite_scores(analysis_dir / files[app], {c: scores[c][part] for c in SCORE_COLUMNS})
+        daily[app] = pd.Series(scores['performance_score'][part]).groupby(df['day'].to_numpy()).mean()
+
+    summary_path = analysis_dir / SUMMARY_FILE
+    if summary_path.exists():
+        summary = pd.read_csv(summary_path, dtype=str, keep_default_na=False)
+        for app, column in SUMMARY_SCORE_COLUMNS.items():
+            if app in daily and column in summary:
+                summary[column] = [round(float(daily[app][day]), 2) if day in daily[app].index else 0
+                                   for day in summary['day']]
+        _write_csv(summary, summary_path)
+
+    model.save(analysis_dir / MODEL_FILENAME)
+    return {app: len(df) for app, df in inputs.items()}
+
+
+def _weights(text: str) -> Dict[str, float]:
+    pairs = (item.split('=', 1) for item in text.split(','))
+    return {key.strip(): float(value) for key, value in pairs}
+
+
+def main():
+    """Main entry point"""
+    analysis_dir = Path(__file__).parent.parent / 'benchmark-results' / 'analysis'
+    parser = argparse.ArgumentParser(description='Re-score stored benchmark measurements without re-parsing raw logs')
+    parser.add_argument('--analysis-dir', type=Path, default=analysis_dir)
+    parser.add_argument('--model', type=Path, help=f'Scoring model JSON (default: <analysis-dir>/{MODEL_FILENAME})')
+    parser.add_argument('--normalization', choices=NORMALIZATIONS)
+    parser.add_argument('--weights', type=_weights, help='e.g. memory=0.5,cpu=0.25,speed=0.25')
+    parser.add_argument('--memory-baseline-kb', type=float)
+    parser.add_argument('--speed-cap-sec', type=float)
+    args = parser.parse_args()
+
+    model = ScoringModel.load(args.model or args.analysis_dir / MODEL_FILENAME)
+    overrides = {'normalization': args.normalization, 'weights': args.weights,
+                 'memory_baseline_kb': args.memory_baseline_kb, 'speed_cap_sec': args.speed_cap_sec}
+    try:
+        model = ScoringModel(dict(model.config, **{k: v for k, v in overrides.items() if v is not None}))
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"🧮 Scoring model: {model.describe()}")
+    started = time.perf_counter()
+    counts = rescore_csvs(args.analysis_dir, model)
+    if not counts:
+        print(f"❌ No metric CSVs found in {args.analysis_dir}")
+        return
+    for app, rows in counts.items():
+        print(f"✅ {app}_metrics.csv: {rows:,} rows re-scored")
+    print(f"🕒 Re-scored in {time.perf_counter() - started:.2f}s; model saved to {args.analysis_dir / MODEL_FILENAME}")
+
+
+if __name__ == "__main__":
+    main()
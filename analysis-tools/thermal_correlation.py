@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Thermal Correlation
+Joins benchmark runs with CPU frequency / throttling samples and measures the slowdown
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Frequency drops vs elapsed_sec and cpu_percent from parse_logs.py
+
+Thermal samples come from the thermal-segments written by
+legacy-python/monitor_server.py (long format, THERMAL_COLUMNS). Each
+sample's time-at-frequency histogram covers the interval since the
+previous sample, so a run is matched to the first sample at or after its
+start (within --tolerance). Runs are then grouped as:
+  full       average frequency >= 95% of cpuinfo_max_freq
+  reduced    below that, no throttle indicator set
+  throttled  firmware/cpufreq/x86 throttle indicator set in the interval
+
+Example:
+    python thermal_correlation.py --thermal-dir /opt/monitoring/thermal-segments
+    python thermal_correlation.py --thermal-dir ./thermal-segments --tolerance 3600
+"""
+
+import argparse
+import bisect
+import csv
+import statistics
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmark_summary import describe, format_interval, parse_timestamp, ratio_ci
+
+# Same threshold as legacy-python/thermal_stats.py FULL_FREQ_RATIO
+FULL_FREQ_RATIO = 0.95
+CONDITIONS = ['full', 'reduced', 'throttled']
+# Not a slowdown on their own: under-voltage only matters once the firmware caps the clock
+IGNORED_FLAGS = {'since_boot', 'under_voltage'}
+
+RUN_COLUMNS = ['application', 'execution_id', 'timestamp', 'elapsed_sec', 'cpu_percent',
+               'sample_timestamp', 'avg_mhz', 'max_mhz', 'temp_c', 'throttled', 'condition']
+SUMMARY_COLUMNS = ['application', 'condition', 'runs', 'mean_elapsed_sec', 'mean_cpu_percent',
+                   'mean_mhz', 'mean_temp_c', 'elapsed_vs_full_percent', 'ci_low', 'ci_high',
+                   'r_mhz_elapsed', 'r_temp_elapsed', 'r_mhz_cpu']
+
+
+def pearson(xs: List[float], ys: List[float]) -> Optional[float]:
+    """None for fewer than 3 points or a constant series"""
+    if len(xs) < 3:
+        return None
+    mx, my = statistics.mean(xs), statistics.mean(ys)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    return sxy / (sxx * syy) ** 0.5 if sxx and syy else None
+
+
+class ThermalCorrelator:
+    """Matches per-execution metrics to the thermal sample covering each run"""
+
+    def __init__(self, analysis_dir: Path, tolerance: float):
+        self.analysis_dir = analysis_dir
+        self.tolerance = tolerance
+        self.samples: List[Dict] = []
+        self.epochs: List[float] = []
+
+    def load_thermal(self, segment_dir: Path) -> None:
+        """Collapse the long-format rows into one record per sample timestamp"""
+        paths = sorted(Path(segment_dir).rglob('segment-*.csv'))
+        by_stamp: Dict[str, Dict] = {}
+        for path in paths:
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                for row in csv.reader(f):
+                    if len(row) < 5 or row[0] == 'timestamp' or row[4] == '':
+                        continue
+                    stamp, kind, _, key, value = row[:5]
+                    sample = by_stamp.setdefault(stamp, {'mhz': [], 'max_mhz': 0.0, 'temp_c': None, 'throttled': 0})
+                    try:
+                        number = float(value)
+                    except ValueError:
+                        continue
+                    if kind == 'freq' and key == 'avg_mhz':
+                        sample['mhz'].append(number)
+                    elif kind == 'freq' and key == 'max_mhz':
+                        sample['max_mhz'] = max(sample['max_mhz'], number)
+                    elif kind == 'zone':
+                        sample['temp_c'] = number if sample['temp_c'] is None else max(sample['temp_c'], number)
+                    elif kind == 'throttle' and key not in IGNORED_FLAGS and number > 0:
+                        sample['throttled'] = 1
+
+        for stamp, sample in by_stamp.items():
+            if not sample['mhz']:
+                continue  # Host without cpufreq: nothing to group on
+            try:
+                epoch = parse_timestamp(stamp).timestamp()
+            except ValueError:
+                continue
+            # Policies are averaged unweighted; one policy on Pi-class boards
+            avg = statistics.mean(sample['mhz'])
+            max_mhz = sample['max_mhz'] or avg
+            if sample['throttled']:
+                condition = 'throttled'
+            elif avg < FULL_FREQ_RATIO * max_mhz:
+                condition = 'reduced'
+            else:
+                condition = 'full'
+            self.samples.append({'epoch': epoch, 'sample_timestamp': stamp, 'avg_mhz': round(avg, 1),
+                                 'max_mhz': max_mhz, 'temp_c': sample['temp_c'],
+                                 'throttled': sample['throttled'], 'condition': condition})
+        self.samples.sort(key=lambda s: s['epoch'])
+        self.epochs = [s['epoch'] for s in self.samples]
+        print(f"✅ {len(self.samples)} thermal samples from {len(paths)} segments")
+
+    def match(self, epoch: float) -> Optional[Dict]:
+        """First sample at or after the run start, within the tolerance"""
+        idx = bisect.bisect_left(self.epochs, epoch)
+        if idx < len(self.samples) and self.samples[idx]['epoch'] - epoch <= self.tolerance:
+            return self.samples[idx]
+        return None
+
+    def join_runs(self) -> List[Dict]:
+        runs = []
+        for path in sorted(self.analysis_dir.glob('*_metrics.csv')):
+            application = path.name[:-len('_metrics.csv')]
+            total = 0
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                for record in csv.DictReader(f):
+                    total += 1
+                    try:
+                        sample = self.match(parse_timestamp(record['timestamp']).timestamp())
+                        elapsed, cpu = float(record['elapsed_sec']), float(record['cpu_percent'])
+                    except (KeyError, ValueError):
+                        continue
+                    if sample is None:
+                        continue
+                    run = {'application': application, 'execution_id': record.get('execution_id', ''),
+                           'timestamp': record['timestamp'], 'elapsed_sec': elapsed, 'cpu_percent': cpu}
+                    run.update({key: sample[key] for key in RUN_COLUMNS if key in sample})
+                    runs.append(run)
+            matched = sum(1 for r in runs if r['application'] == application)
+            print(f"📊 {application}: {matched}/{total} runs matched to a thermal sample")
+        return runs
+
+    def summarize(self, runs: List[Dict]) -> List[Dict]:
+        rows = []
+        for application in sorted({r['application'] for r in runs}):
+            app_runs = [r for r in runs if r['application'] == application]
+            temps = [r for r in app_runs if r['temp_c'] is not None]
+            correlations = {
+                'r_mhz_elapsed': pearson([r['avg_mhz'] for r in app_runs], [r['elapsed_sec'] for r in app_runs]),
+                'r_temp_elapsed': pearson([r['temp_c'] for r in temps], [r['elapsed_sec'] for r in temps]),
+                'r_mhz_cpu': pearson([r['avg_mhz'] for r in app_runs], [r['cpu_percent'] for r in app_runs]),
+            }
+            full = describe(r['elapsed_sec'] for r in app_runs if r['condition'] == 'full')
+            for condition in CONDITIONS:
+                group = [r for r in app_runs if r['condition'] == condition]
+                if not group:
+                    continue
+                elapsed = describe(r['elapsed_sec'] for r in group)
+                row = {
+                    'application': application, 'condition': condition, 'runs': len(group),
+                    'mean_elapsed_sec': round(elapsed['mean'], 2),
+                    'mean_cpu_percent': round(statistics.mean(r['cpu_percent'] for r in group), 2),
+                    'mean_mhz': round(statistics.mean(r['avg_mhz'] for r in group), 1),
+                    'mean_temp_c': round(statistics.mean(r['temp_c'] for r in group if r['temp_c'] is not None), 1)
+                    if any(r['temp_c'] is not None for r in group) else '',
+                    'elapsed_vs_full_percent': '', 'ci_low': '', 'ci_high': '',
+                }
+                if condition != 'full' and full['count']:
+                    # Slowdown relative to full-frequency runs of the same application
+                    ratio = ratio_ci(elapsed, full)
+                    row.update({'elapsed_vs_full_percent': round((ratio['value'] - 1) * 100, 1),
+                                'ci_low': round((ratio['ci_low'] - 1) * 100, 1),
+                                'ci_high': round((ratio['ci_high'] - 1) * 100, 1)})
+                row.update({key: round(value, 3) if value is not None else '' for key, value in correlations.items()})
+                rows.append(row)
+        return rows
+
+    def print_summary(self, rows: List[Dict]) -> None:
+        print()
+        print("Application │ Condition │ Runs │ Elapsed (s) │  CPU % │    MHz │ vs full")
+        print("────────────┼───────────┼──────┼─────────────┼────────┼────────┼──────────────────────────")
+        for row in rows:
+            versus = ''
+            if row['elapsed_vs_full_percent'] != '':
+                versus = format_interval({'value': row['elapsed_vs_full_percent'], 'ci_low': row['ci_low'],
+                                          'ci_high': row['ci_high']}, fmt='{:+.1f}', suffix='%')
+            print(f"{row['application']:11s} │ {row['condition']:9s} │ {row['runs']:4d} │ "
+                  f"{row['mean_elapsed_sec']:11.2f} │ {row['mean_cpu_percent']:6.2f} │ {row['mean_mhz']:6.0f} │ {versus}")
+        for application in sorted({row['application'] for row in rows}):
+            first = next(row for row in rows if row['application'] == application)
+            print(f"🔗 {application}: r(MHz, elapsed) = {first['r_mhz_elapsed'] or '-'}, "
+                  f"r(temp, elapsed) = {first['r_temp_elapsed'] or '-'}, r(MHz, CPU%) = {first['r_mhz_cpu'] or '-'}")
+
+    def write_csv(self, filename: str, columns: List[str], rows: List[Dict]) -> Path:
+        path = self.analysis_dir / filename
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def run(self, segment_dir: Path) -> int:
+        self.load_thermal(segment_dir)
+        if not self.samples:
+            print(f"❌ No CPU frequency samples in {segment_dir}")
+            return 1
+        runs = self.join_runs()
+        if not runs:
+            print("❌ No benchmark run falls within --tolerance of a thermal sample")
+            return 1
+        rows = self.summarize(runs)
+        self.print_summary(rows)
+        self.write_csv('thermal_runs.csv', RUN_COLUMNS, runs)
+        path = self.write_csv('thermal_correlation.csv', SUMMARY_COLUMNS, rows)
+        print(f"\n💾 Results written to {path} and thermal_runs.csv")
+        return 0
+
+
+def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--thermal-dir', type=Path, default=Path('/opt/monitoring/thermal-segments'),
+                        help='thermal-segments directory of monitor_server.py')
+    parser.add_argument('--analysis-dir', type=Path,
+                        default=Path(__file__).parent.parent / 'benchmark-results' / 'analysis',
+                        help='Directory with the <label>_metrics.csv files')
+    # Python samples on the hour and Go runs at :30; 2 h still covers one missed cron run
+    parser.add_argument('--tolerance', type=float, default=7200,
+                        help='Max seconds between a run start and its thermal sample')
+    args = parser.parse_args()
+    return ThermalCorrelator(args.analysis_dir, args.tolerance).run(args.thermal_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
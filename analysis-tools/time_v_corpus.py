@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Server Monitoring Benchmark Synthetic time -v Corpus Generator
+Writes arbitrarily large, realistic /usr/bin/time -v logs for parser scaling tests
+
+Author: Benchmark Analysis Team
+Date: October 19, 2026
+Version: 1.0 - Resampled profiles, noise, truncation, interleaving, corruption
+
+Each run resamples a real measurement from <app>_metrics.csv (built-in
+profile if the CSV is missing) and perturbs it with Gaussian noise, so
+the corpus has the same value mix as the real logs. On top of that:
+  - Go runs are followed by timestamped log chatter, Python runs
+    occasionally by a traceback (stderr goes to the same log)
+  - a fraction of blocks is cut off mid-line (killed run, log rotation)
+  - lines are corrupted: binary garbage and malformed values
+  - with --interleave, applications share files in random order
+Output is reproducible for a given --seed. corpus_manifest.json records
+the number of records BenchmarkLogParser must produce per application.
+
+Example:
+    python time_v_corpus.py --size 200M --output /tmp/corpus
+    python time_v_corpus.py --size 1G --files 8 --interleave --truncate-rate 0.01
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from log_formats import MIN_BLOCK_LINES
+
+# Application -> the command its runs are timed with (see parse_logs.DEFAULT_APPLICATIONS)
+COMMANDS = {
+    'golang': './monitor-app --log',
+    'python': '/opt/monitoring/env/bin/python3 /opt/monitoring/monitor_server.py --log',
+}
+
+# Used when benchmark-results/analysis/<app>_metrics.csv does not exist
+BUILTIN_PROFILES = {
+    'golang': {'max_rss_kb': 12694, 'elapsed_sec': 27.4, 'user_time_sec': 0.9, 'system_time_sec': 2.6,
+               'cpu_percent': 13, 'minor_page_faults': 2100, 'voluntary_context_switches': 54000,
+               'involuntary_context_switches': 300, 'file_system_outputs': 16},
+    'python': {'max_rss_kb': 185698, 'elapsed_sec': 41.7, 'user_time_sec': 3.0, 'system_time_sec': 3.8,
+               'cpu_percent': 16, 'minor_page_faults': 50100, 'voluntary_context_switches': 62000,
+               'involuntary_context_switches': 380, 'file_system_outputs': 8},
+}
+PROFILE_COLUMNS = list(BUILTIN_PROFILES['golang'])
+
+BLOCK_TEMPLATE = (
+    '\tCommand being timed: "{command}"\n'
+    '\tUser time (seconds): {user_time_sec:.2f}\n'
+    '\tSystem time (seconds): {system_time_sec:.2f}\n'
+    '\tPercent of CPU this job got: {cpu_percent}%\n'
+    '\tElapsed (wall clock) time (h:mm:ss or m:ss): {elapsed}\n'
+    '\tAverage shared text size (kbytes): 0\n'
+    '\tAverage unshared data size (kbytes): 0\n'
+    '\tAverage stack size (kbytes): 0\n'
+    '\tAverage total size (kbytes): 0\n'
+    '\tMaximum resident set size (kbytes): {max_rss_kb}\n'
+    '\tAverage resident set size (kbytes): 0\n'
+    '\tMajor (requiring I/O) page faults: 0\n'
+    '\tMinor (reclaiming a frame) page faults: {minor_page_faults}\n'
+    '\tVoluntary context switches: {voluntary_context_switches}\n'
+    '\tInvoluntary context switches: {involuntary_context_switches}\n'
+    '\tSwaps: 0\n'
+    '\tFile system inputs: 0\n'
+    '\tFile system outputs: {file_system_outputs}\n'
+    '\tSocket messages sent: 0\n'
+    '\tSocket messages received: 0\n'
+    '\tSignals delivered: 0\n'
+    '\tPage size (bytes): 4096\n'
+    '\tExit status: {exit_status}\n'
+)
+
+GO_CHATTER = [
+    'Unsolicited response received on idle HTTP channel starting with "{garbage}"; err=<nil>',
+    'speedtest: context deadline exceeded (Client.Timeout exceeded while awaiting headers)',
+    'Post "https://discord.com/api/webhooks/...": dial tcp: lookup discord.com: temporary failure',
+]
+PY_TRACEBACK = (
+    'Traceback (most recent call last):\n'
+    '  File "/opt/monitoring/monitor_server.py", line 59, in run_speedtest\n'
+    '    st = speedtest.Speedtest(secure=True)\n'
+    'speedtest.ConfigRetrievalError: HTTP Error 403: Forbidden\n'
+)
+
+
+def parse_size(text: str) -> int:
+    """'500M', '1G', '1.5G', '123456' -> bytes"""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def format_elapsed(seconds: float) -> str:
+    """time -v style: m:ss.cc below an hour, h:mm:ss above"""
+    if seconds >= 3600:
+        hours, rest = divmod(int(seconds), 3600)
+        return f"{hours}:{rest // 60:02d}:{rest % 60:02d}"
+    minutes, rest = divmod(seconds, 60)
+    return f"{int(minutes)}:{rest:05.2f}"
+
+
+class TimeVCorpusGenerator:
+    def __init__(self, apps: List[str], seed: int = 42, noise: float = 1.0,
+                 truncate_rate: float = 0.002, corrupt_rate: float = 0.001, chatter_rate: float = 0.05,
+                 failure_rate: float = 0.001, analysis_dir: Optional[Path] = None):
+        """Profiles are resampled from the real metric CSVs in analysis_dir when present"""
+        self.rng = random.Random(seed)
+        self.apps = apps
+        self.noise = noise
+        self.truncate_rate = truncate_rate
+        self.corrupt_rate = corrupt_rate
+        self.chatter_rate = chatter_rate
+        self.failure_rate = failure_rate
+        analysis_dir = analysis_dir or Path(__file__).parent.parent / 'benchmark-results' / 'analysis'
+        self.profiles = {app: self.load_profile(analysis_dir / f"{app}_metrics.csv", app) for app in apps}
+        self.clock = datetime(2026, 2, 5, 7, 0, 0)
+
+    @staticmethod
+    def load_profile(path: Path, app: str) -> List[Dict[str, float]]:
+        """Real measurements to resample from (one built-in row as fallback)"""
+        rows = []
+        if path.exists():
+            with open(path, newline='') as f:
+                for row in csv.DictReader(f):
+                    try:
+                        rows.append({col: float(row[col]) for col in PROFILE_COLUMNS})
+                    except (KeyError, ValueError):
+                        continue
+        return rows or [dict(BUILTIN_PROFILES[app])]
+
+    def sample(self, app: str) -> Dict:
+        """One run: a resampled real measurement with relative Gaussian noise"""
+        base = self.rng.choice(self.profiles[app])
+        gauss = self.rng.gauss
+        jitter = 0.03 * self.noise
+        values = {col: max(0.0, value * (1 + gauss(0, jitter))) for col, value in base.items()}
+        return {
+            'command': COMMANDS[app],
+            'user_time_sec': values['user_time_sec'],
+            'system_time_sec': values['system_time_sec'],
+            'cpu_percent': int(round(values['cpu_percent'])),
+            'elapsed': format_elapsed(values['elapsed_sec']),
+            'max_rss_kb': int(values['max_rss_kb']),
+            'minor_page_faults': int(values['minor_page_faults']),
+            'voluntary_context_switches': int(values['voluntary_context_switches']),
+            'involuntary_context_switches': int(values['involuntary_context_switches']),
+            'file_system_outputs': int(values['file_system_outputs']),
+            'exit_status': 1 if self.rng.random() < self.failure_rate else 0,
+        }
+
+    def garbage(self, length: int) -> str:
+        """Binary payload the way Go's %q prints it: \\xNN escapes mixed with runes"""
+        rng = self.rng
+        parts = []
+        for _ in range(length):
+            roll = rng.random()
+            if roll < 0.5:
+                parts.append(f"\\x{rng.randint(0x80, 0xff):02x}")
+            elif roll < 0.85:
+                parts.append(chr(rng.randint(0x21, 0x7e)))
+            else:
+                # Stay below U+2028/U+2029, which str.splitlines() treats as line breaks
+                parts.append(chr(rng.randint(0xa0, 0x1fff)))
+        return ''.join(parts)
+
+    def corrupt(self, lines: List[str]) -> List[str]:
+        """Damage one line: binary garbage or a malformed value"""
+        idx = self.rng.randrange(1, len(lines))
+        label, sep, value = lines[idx].partition(': ')
+        if sep and self.rng.random() < 0.5:
+            pos = self.rng.randrange(len(value.rstrip('\n')) or 1)
+            lines[idx] = f"{label}: {value[:pos]}#{value[pos:]}"
+        else:
+            lines[idx] = self.garbage(self.rng.randint(8, 120)) + '\n'
+        return lines
+
+    def chatter(self, app: str) -> str:
+        self.clock += timedelta(seconds=self.rng.randint(1, 40))
+        if app == 'python':
+            return PY_TRACEBACK
+        stamp = self.clock.strftime('%Y/%m/%d %H:%M:%S')
+        line = self.rng.choice(GO_CHATTER).format(garbage=self.garbage(self.rng.randint(40, 400)))
+        return f"{stamp} {line}\n"
+
+    def block(self, app: str) -> str:
+        """One run as it lands in the log, damage and trailing chatter included"""
+        rng = self.rng
+        text = BLOCK_TEMPLATE.format(**self.sample(app))
+        if rng.random() < self.corrupt_rate or rng.random() < self.truncate_rate:
+            lines = text.splitlines(keepends=True)
+            if rng.random() < self.corrupt_rate / (self.corrupt_rate + self.truncate_rate):
+                lines = self.corrupt(lines)
+            else:
+                # Cut somewhere after the command line so the marker survives
+                keep = rng.randrange(2, len(lines))
+                cut = lines[keep - 1]
+                lines = lines[:keep - 1] + [cut[:rng.randrange(1, len(cut))].rstrip('\n') + '\n']
+            text = ''.join(lines)
+        if rng.random() < self.chatter_rate:
+            text += self.chatter(app)
+        self.clock += timedelta(hours=1)
+        return text
+
+    def write_file(self, path: Path, target_bytes: int, apps: List[str], expected: Dict[str, int]) -> int:
+        """Write one log of about target_bytes; adds the parseable records per app to expected"""
+        written = 0
+        with open(path, 'wb') as f:
+            while written < target_bytes:
+                buffer, buffered = [], 0
+                while buffered < min(1 << 20, target_bytes - written):
+                    app = apps[0] if len(apps) == 1 else self.rng.choice(apps)
+                    text = self.block(app)
+                    # Same rule as TimeVerboseFormat.parse: short remnants are not records
+                    if len(text.strip().split('\n')) >= MIN_BLOCK_LINES:
+                        expected[app] = expected.get(app, 0) + 1
+                    buffer.append(text)
+                    buffered += len(text)
+                data = ''.join(buffer).encode('utf-8')
+                f.write(data)
+                written += len(data)
+        return written
+
+    def generate(self, output_dir: Path, total_bytes: int, files: int = 1, interleave: bool = False) -> Dict:
+        """Write the corpus and corpus_manifest.json; returns the manifest"""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        expected: Dict[str, int] = {}
+        written_files = []
+        started = time.perf_counter()
+        per_file = max(1, total_bytes // files)
+        for idx in range(files):
+            apps = self.apps if interleave else [self.apps[idx % len(self.apps)]]
+            label = 'mixed' if interleave else apps[0]
+            # day1..day3 in the name so parse_logs spreads the rows over days
+            path = output_dir / f"bench_synth_{label}_day{idx % 3 + 1}_{idx:03d}.log"
+            size = self.write_file(path, per_file, apps, expected)
+            written_files.append({'file': path.name, 'bytes': size})
+        manifest = {
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'files': written_files,
+            'total_bytes': sum(f['bytes'] for f in written_files),
+            'expected_records': expected,
+            'seconds': round(time.perf_counter() - started, 2),
+            'settings': {
+                'apps': self.apps, 'noise': self.noise, 'truncate_rate': self.truncate_rate,
+                'corrupt_rate': self.corrupt_rate, 'chatter_rate': self.chatter_rate,
+                'failure_rate': self.failure_rate, 'interleave': interleave,
+            },
+        }
+        with open(output_dir / 'corpus_manifest.json', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', type=Path, required=True, help='Directory for bench_synth_*.log files')
+    parser.add_argument('--size', default='100M', help='Total corpus size (e.g. 500M, 1G)')
+    parser.add_argument('--files', type=int, default=4)
+    parser.add_argument('--apps', nargs='+', default=sorted(COMMANDS), choices=sorted(COMMANDS))
+    parser.add_argument('--interleave', action='store_true', help='Mix applications within each file')
+    parser.add_argument('--noise', type=float, default=1.0, help='Noise multiplier (1.0 = 3%% relative sigma)')
+    parser.add_argument('--truncate-rate', type=float, default=0.002)
+    parser.add_argument('--corrupt-rate', type=float, default=0.001)
+    parser.add_argument('--chatter-rate', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    generator = TimeVCorpusGenerator(args.apps, seed=args.seed, noise=args.noise,
+                                     truncate_rate=args.truncate_rate, corrupt_rate=args.corrupt_rate,
+                                     chatter_rate=args.chatter_rate)
+    print(f"📝 Generating {parse_size(args.size) / 1e6:,.0f} MB of time -v logs in {args.output}...")
+    manifest = generator.generate(args.output, parse_size(args.size), args.files, args.interleave)
+    mb = manifest['total_bytes'] / 1e6
+    print(f"✅ {len(manifest['files'])} files, {mb:,.0f} MB in {manifest['seconds']:.1f}s "
+          f"({mb / max(manifest['seconds'], 1e-9):,.0f} MB/s)")
+    for app, count in sorted(manifest['expected_records'].items()):
+        print(f"   {app}: {count:,} parseable runs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,18 +8,124 @@ Date: February 9, 2026
 Version: 1.0 - Complete Visualization Suite
 """
 
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering, also safe inside worker processes
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from pathlib import Path
 import warnings
+from datetime import datetime
+from benchmark_summary import (load_summary, format_interval, recommendation, leak_label, memory_verdict,
+                               speed_verdict, verdict_mark, deployment_verdict)
+from downsample import plot_series, scatter_points
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow  # noqa: F401  Optional: Arrow CSV engine and Parquet cache
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
 # Set style for professional looking charts
 plt.style.use('default')
 sns.set_palette("husl")
 
+CACHE_FILENAME = '.chart_cache.json'
+
+# Above this many rows, skip per-point extras (KDE curves, box plot fliers)
+DETAIL_ROWS = 100_000
+
+# Chart name -> (render method, output file, input columns per DataFrame).
+# The cache key covers exactly these columns, so e.g. a change to
+# cpu_percent does not re-render the memory trend.
+CHART_JOBS = {
+    'memory_usage_trend': ('create_memory_usage_trend', 'memory_usage_trend.png',
+                           {'go_df': ['timestamp', 'max_rss_mb'], 'py_df': ['timestamp', 'max_rss_mb']}),
+    'performance_comparison': ('create_performance_comparison', 'performance_comparison.png', {}),
+    'executive_summary': ('create_executive_summary', 'executive_summary.png',
+                          {'summary_df': ['day', 'go_avg_memory_kb', 'py_avg_memory_kb', 'speed_improvement_percent']}),
+    'stability_analysis': ('create_stability_analysis', 'stability_analysis.png',
+                           {'go_df': ['max_rss_mb', 'performance_score', 'efficiency_ratio'],
+                            'py_df': ['max_rss_mb', 'performance_score', 'efficiency_ratio'],
+                            'summary_df': ['go_memory_variance_kb', 'py_memory_variance_kb']}),
+    'summary_report': ('create_summary_report', 'benchmark_report.md', {}),
+}
+
+
+# Compact dtypes for the parse_logs.py metric CSVs (defaults would be int64/float64/object)
+METRIC_DTYPES = {
+    'execution_id': 'uint32', 'day': 'category', 'application': 'category',
+    'max_rss_kb': 'uint32', 'max_rss_mb': 'float32', 'elapsed_sec': 'float32',
+    'user_time_sec': 'float32', 'system_time_sec': 'float32', 'cpu_percent': 'uint16',
+    'minor_page_faults': 'uint32', 'major_page_faults': 'uint32',
+    'voluntary_context_switches': 'uint32', 'involuntary_context_switches': 'uint32',
+    'file_system_outputs': 'uint32', 'file_system_inputs': 'uint32',
+    'socket_messages_sent': 'uint32', 'socket_messages_received': 'uint32',
+    'exit_status': 'uint8', 'efficiency_ratio': 'float32',
+    'memory_efficiency_score': 'float32', 'performance_score': 'float32',
+}
+
+
+def metric_columns(names):
+    """Columns of golang/python metrics needed by the given charts"""
+    columns = {'timestamp'}
+    for name in names:
+        inputs = CHART_JOBS[name][2]
+        columns.update(inputs.get('go_df', []), inputs.get('py_df', []))
+    return sorted(columns)
+
+
+def _parquet_cache(csv_path):
+    return csv_path.with_name(f'.{csv_path.stem}.parquet')
+
+
+def load_metrics(csv_path, columns=None):
+    """Typed, projected load of a metric CSV with timestamps parsed on read
+
+    With pyarrow installed the full typed table is converted once to a
+    hidden Parquet file next to the CSV and later loads read only the
+    requested columns from it; it is rebuilt whenever the CSV is newer.
+    """
+    csv_path = Path(csv_path)
+    if HAS_ARROW:
+        cache = _parquet_cache(csv_path)
+        try:
+            if cache.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+                return pd.read_parquet(cache, columns=columns)
+        except OSError:
+            pass
+
+    usecols = None if HAS_ARROW else columns  # Parquet cache keeps every column
+    dtypes = {col: dtype for col, dtype in METRIC_DTYPES.items() if usecols is None or col in usecols}
+    df = pd.read_csv(csv_path, usecols=usecols, dtype=dtypes, parse_dates=['timestamp'],
+                     date_format='mixed', engine='c')
+
+    if HAS_ARROW:
+        try:
+            tmp = _parquet_cache(csv_path).with_suffix('.tmp')
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, _parquet_cache(csv_path))
+        except OSError:
+            pass
+        if columns is not None:
+            df = df[columns]
+    return df
+
+
+def _render_chart(visualizer, name):
+    """Process pool entry point: render one chart and report how long it took"""
+    started = time.perf_counter()
+    getattr(visualizer, CHART_JOBS[name][0])()
+    return name, time.perf_counter() - started
+
 class BenchmarkVisualizer:
     def __init__(self):
         """Initialize visualizer with paths and settings"""
@@ -43,13 +149,17 @@ class BenchmarkVisualizer:
         # Chart settings
         self.fig_size = (12, 8)
         self.dpi = 300
+        self.cache_path = self.output_dir / CACHE_FILENAME
         
-    def load_data(self):
-        """Load all CSV files"""
+    def load_data(self, charts=None):
+        """Load only the metric columns the selected charts use, with compact dtypes"""
         try:
-            self.go_df = pd.read_csv(self.analysis_dir / 'golang_metrics.csv')
-            self.py_df = pd.read_csv(self.analysis_dir / 'python_metrics.csv')
+            columns = metric_columns(charts or CHART_JOBS)
+            self.go_df = load_metrics(self.analysis_dir / 'golang_metrics.csv', columns)
+            self.py_df = load_metrics(self.analysis_dir / 'python_metrics.csv', columns)
             self.summary_df = pd.read_csv(self.analysis_dir / 'combined_summary.csv')
+            self.summary = load_summary(self.analysis_dir)
+
             
             print(f"✅ Loaded data:")
             print(f"   🐹 Go: {len(self.go_df)} measurements")
@@ -64,33 +174,38 @@ class BenchmarkVisualizer:
     def create_memory_usage_trend(self):
         """Create memory usage trend chart over time"""
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-        
-        # Convert to datetime for proper x-axis
-        self.go_df['datetime'] = pd.to_datetime(self.go_df['timestamp'])
-        self.py_df['datetime'] = pd.to_datetime(self.py_df['timestamp'])
+
         
         # Plot 1: Memory Usage Over Time (MB)
-        ax1.plot(self.go_df['datetime'], self.go_df['max_rss_mb'], 
-                color=self.colors['golang'], linewidth=2, label='Golang', alpha=0.8)
-        ax1.plot(self.py_df['datetime'], self.py_df['max_rss_mb'], 
-                color=self.colors['python'], linewidth=2, label='Python', alpha=0.8)
-        ax1.set_title('🧠 Memory Usage Trend (72-Hour Test)', fontsize=16, fontweight='bold', pad=20)
+        # Long histories are reduced to LTTB lines + min/max bands per output pixel
+        plot_series(ax1, self.go_df['timestamp'], self.go_df['max_rss_mb'], self.dpi,
+                    color=self.colors['golang'], linewidth=2, label='Golang', alpha=0.8)
+        plot_series(ax1, self.py_df['timestamp'], self.py_df['max_rss_mb'], self.dpi,
+                    color=self.colors['python'], linewidth=2, label='Python', alpha=0.8)
+        apps = self.summary['apps']
+        go_avg_mb = apps['golang']['max_rss_mb']['mean']
+        py_avg_mb = apps['python']['max_rss_mb']['mean']
+        peak_mb = max(apps['golang']['max_rss_mb']['max'], apps['python']['max_rss_mb']['max'])
+
+        ax1.set_title(f"🧠 Memory Usage Trend ({self.summary['duration_hours']:.0f}-Hour Test)",
+                      fontsize=16, fontweight='bold', pad=20)
         ax1.set_ylabel('Memory Usage (MB)', fontsize=12)
         ax1.legend(loc='upper left', fontsize=12)
         ax1.grid(True, alpha=0.3)
-        ax1.set_ylim(0, 200)
+        ax1.set_ylim(0, peak_mb * 1.1)
         
         # Add annotations
-        ax1.axhline(y=13, color=self.colors['golang'], linestyle='--', alpha=0.5)
-        ax1.axhline(y=186, color=self.colors['python'], linestyle='--', alpha=0.5)
-        ax1.text(0.02, 0.95, 'Go Avg: 13MB', transform=ax1.transAxes, 
+        ax1.axhline(y=go_avg_mb, color=self.colors['golang'], linestyle='--', alpha=0.5)
+        ax1.axhline(y=py_avg_mb, color=self.colors['python'], linestyle='--', alpha=0.5)
+        ax1.text(0.02, 0.95, f'Go Avg: {go_avg_mb:.1f}MB', transform=ax1.transAxes, 
                 fontsize=10, color=self.colors['golang'], fontweight='bold')
-        ax1.text(0.02, 0.85, 'Python Avg: 186MB', transform=ax1.transAxes, 
+        ax1.text(0.02, 0.85, f'Python Avg: {py_avg_mb:.1f}MB', transform=ax1.transAxes, 
                 fontsize=10, color=self.colors['python'], fontweight='bold')
         
         # Plot 2: Memory Distribution (Box Plot)
         data_for_box = [self.go_df['max_rss_mb'], self.py_df['max_rss_mb']]
-        bp = ax2.boxplot(data_for_box, patch_artist=True, labels=['Golang', 'Python'])
+        detailed = max(len(self.go_df), len(self.py_df)) <= DETAIL_ROWS
+        bp = ax2.boxplot(data_for_box, patch_artist=True, labels=['Golang', 'Python'], showfliers=detailed)
         
         # Color the box plots
         bp['boxes'][0].set_facecolor(self.colors['go_light'])
@@ -118,7 +233,8 @@ class BenchmarkVisualizer:
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
         
         # 1. Execution Time Comparison
-        exec_data = [self.go_df['elapsed_sec'].mean(), self.py_df['elapsed_sec'].mean()]
+        apps = self.summary['apps']
+        exec_data = [apps['golang']['elapsed_sec']['mean'], apps['python']['elapsed_sec']['mean']]
         ax1.bar(['Golang', 'Python'], exec_data, 
                 color=[self.colors['golang'], self.colors['python']], alpha=0.8)
         ax1.set_title('⏱️ Average Execution Time', fontsize=14, fontweight='bold')
@@ -130,7 +246,7 @@ class BenchmarkVisualizer:
             ax1.text(i, v + 1, f"{v:.1f}s", ha='center', fontsize=12, fontweight='bold')
         
         # 2. CPU Usage Comparison
-        cpu_data = [self.go_df['cpu_percent'].mean(), self.py_df['cpu_percent'].mean()]
+        cpu_data = [apps['golang']['cpu_percent']['mean'], apps['python']['cpu_percent']['mean']]
         ax2.bar(['Golang', 'Python'], cpu_data, 
                 color=[self.colors['golang'], self.colors['python']], alpha=0.8)
         ax2.set_title('💻 Average CPU Usage', fontsize=14, fontweight='bold')
@@ -142,7 +258,8 @@ class BenchmarkVisualizer:
             ax2.text(i, v + 0.5, f"{v:.1f}%", ha='center', fontsize=12, fontweight='bold')
         
         # 3. Memory Efficiency (inverted for better visualization)
-        mem_efficiency = [100/12.795, 100/185.683]  # Efficiency per KB
+        mem_efficiency = [100 / apps['golang']['max_rss_mb']['mean'],
+                          100 / apps['python']['max_rss_mb']['mean']]  # Efficiency per MB
         ax3.bar(['Golang', 'Python'], mem_efficiency, 
                 color=[self.colors['golang'], self.colors['python']], alpha=0.8)
         ax3.set_title('🧠 Memory Efficiency Score', fontsize=14, fontweight='bold')
@@ -150,7 +267,7 @@ class BenchmarkVisualizer:
         ax3.grid(True, alpha=0.3, axis='y')
         
         # 4. Overall Performance Score
-        perf_data = [self.go_df['performance_score'].mean(), self.py_df['performance_score'].mean()]
+        perf_data = [apps['golang']['performance_score']['mean'], apps['python']['performance_score']['mean']]
         ax4.bar(['Golang', 'Python'], perf_data, 
                 color=[self.colors['golang'], self.colors['python']], alpha=0.8)
         ax4.set_title('🎯 Overall Performance Score', fontsize=14, fontweight='bold')
@@ -177,11 +294,16 @@ class BenchmarkVisualizer:
                      fontsize=20, fontweight='bold', y=0.95)
         
         # Key Metrics Cards
+        summary = self.summary
+        memory = summary['memory_ratio']
+        speed = summary['speed_reduction_percent']
         metrics_data = [
-            ('14.5x', 'Memory Efficiency Improvement', self.colors['improvement']),
-            ('36%', 'Execution Time Reduction', self.colors['improvement']),
-            ('318', 'Total Measurements', self.colors['golang']),
-            ('72 Hours', 'Test Duration', self.colors['python'])
+            (f"{memory['value']:.1f}x", f"Memory Ratio Python / Golang\n(95% CI {memory['ci_low']:.1f}-{memory['ci_high']:.1f}x)",
+             self.colors['improvement'] if verdict_mark(summary, memory_verdict(summary)[0]) == '✅' else self.colors['warning']),
+            (f"{speed['value']:.0f}%", f"Golang Execution Time Reduction\n(95% CI {speed['ci_low']:.0f}-{speed['ci_high']:.0f}%)",
+             self.colors['improvement'] if verdict_mark(summary, speed_verdict(summary)[0]) == '✅' else self.colors['warning']),
+            (f"{summary['total_measurements']}", 'Total Measurements', self.colors['golang']),
+            (f"{summary['duration_hours']:.0f} Hours", 'Test Duration', self.colors['python'])
         ]
         
         for i, (value, label, color) in enumerate(metrics_data):
@@ -220,13 +342,17 @@ class BenchmarkVisualizer:
         
         # Recommendation Box
         ax_rec = fig.add_subplot(gs[2, :])
+        approved = summary.get('winner') and not summary['leak_detected']
         ax_rec.text(0.5, 0.8, '🎯 PRODUCTION DEPLOYMENT RECOMMENDATION', 
-                   fontsize=16, fontweight='bold', ha='center', color=self.colors['improvement'])
-        ax_rec.text(0.5, 0.6, '✅ APPROVED: Golang Implementation for Production Use', 
+                   fontsize=16, fontweight='bold', ha='center',
+                   color=self.colors['improvement'] if approved else self.colors['warning'])
+        stability = summary['apps'][summary['winner']]['stability'] if summary.get('winner') else 'n/a'
+        ax_rec.text(0.5, 0.6, recommendation(summary), 
                    fontsize=14, ha='center')
-        ax_rec.text(0.5, 0.4, '📈 Benefits: 14.5x Memory Efficiency, 36% Speed Improvement, Excellent Stability', 
+        ax_rec.text(0.5, 0.4, f"📈 {memory_verdict(summary)[1]}; {speed_verdict(summary)[1]}\n"
+                   f"{stability} Stability ({leak_label(summary)})", 
                    fontsize=12, ha='center')
-        ax_rec.text(0.5, 0.2, '🚀 Ready for Edge Computing & Resource-Constrained Environments', 
+        ax_rec.text(0.5, 0.2, deployment_verdict(summary), 
                    fontsize=12, ha='center', style='italic')
         ax_rec.set_xlim(0, 1)
         ax_rec.set_ylim(0, 1)
@@ -258,10 +384,11 @@ class BenchmarkVisualizer:
             ax1.text(i, v + 50, f"{v:.0f} KB", ha='center', fontsize=12, fontweight='bold')
         
         # 2. Performance Score Distribution
+        detailed = max(len(self.go_df), len(self.py_df)) <= DETAIL_ROWS
         sns.histplot(data=self.go_df, x='performance_score', color=self.colors['golang'], 
-                   alpha=0.6, label='Golang', kde=True, ax=ax2)
+                   alpha=0.6, label='Golang', kde=detailed, ax=ax2)
         sns.histplot(data=self.py_df, x='performance_score', color=self.colors['python'], 
-                   alpha=0.6, label='Python', kde=True, ax=ax2)
+                   alpha=0.6, label='Python', kde=detailed, ax=ax2)
         ax2.set_title('📈 Performance Score Distribution', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Performance Score', fontsize=12)
         ax2.set_ylabel('Frequency', fontsize=12)
@@ -269,10 +396,10 @@ class BenchmarkVisualizer:
         ax2.grid(True, alpha=0.3)
         
         # 3. Memory vs Performance Scatter
-        ax3.scatter(self.go_df['max_rss_mb'], self.go_df['performance_score'], 
-                   color=self.colors['golang'], alpha=0.7, label='Golang', s=50)
-        ax3.scatter(self.py_df['max_rss_mb'], self.py_df['performance_score'], 
-                   color=self.colors['python'], alpha=0.7, label='Python', s=50)
+        scatter_points(ax3, self.go_df['max_rss_mb'], self.go_df['performance_score'], self.dpi,
+                       color=self.colors['golang'], alpha=0.7, label='Golang', s=50)
+        scatter_points(ax3, self.py_df['max_rss_mb'], self.py_df['performance_score'], self.dpi,
+                       color=self.colors['python'], alpha=0.7, label='Python', s=50)
         ax3.set_title('🎯 Memory vs Performance Correlation', fontsize=14, fontweight='bold')
         ax3.set_xlabel('Memory Usage (MB)', fontsize=12)
         ax3.set_ylabel('Performance Score', fontsize=12)
@@ -280,10 +407,10 @@ class BenchmarkVisualizer:
         ax3.grid(True, alpha=0.3)
         
         # 4. Efficiency Ratio Trend
-        ax4.plot(self.go_df.index, self.go_df['efficiency_ratio'], 
-                color=self.colors['golang'], linewidth=2, label='Golang', alpha=0.8)
-        ax4.plot(self.py_df.index, self.py_df['efficiency_ratio'], 
-                color=self.colors['python'], linewidth=2, label='Python', alpha=0.8)
+        plot_series(ax4, self.go_df.index, self.go_df['efficiency_ratio'], self.dpi,
+                    color=self.colors['golang'], linewidth=2, label='Golang', alpha=0.8)
+        plot_series(ax4, self.py_df.index, self.py_df['efficiency_ratio'], self.dpi,
+                    color=self.colors['python'], linewidth=2, label='Python', alpha=0.8)
         ax4.set_title('⚡ Efficiency Ratio Trend', fontsize=14, fontweight='bold')
         ax4.set_xlabel('Measurement #', fontsize=12)
         ax4.set_ylabel('Efficiency Ratio', fontsize=12)
@@ -299,60 +426,63 @@ class BenchmarkVisualizer:
     
     def create_summary_report(self):
         """Generate text summary report"""
-        go_avg_mem = self.go_df['max_rss_mb'].mean()
-        py_avg_mem = self.py_df['max_rss_mb'].mean()
-        go_avg_exec = self.go_df['elapsed_sec'].mean()
-        py_avg_exec = self.py_df['elapsed_sec'].mean()
+        summary = self.summary
+        go = summary['apps']['golang']
+        py = summary['apps']['python']
+        winner = summary.get('winner')
+        winner_name = {'golang': '🐹 **Golang Implementation**', 'python': '🐍 **Python Implementation**'}.get(winner, 'No clear winner')
         
         report = f"""
 # Server Monitoring Benchmark - Final Report
 
 ## 📊 Executive Summary
 
-**Test Duration:** 72 Hours (Day 2-3, 2026)
-**Total Measurements:** 318 data points
-**Winner:** 🐹 **Golang Implementation** - PRODUCTION READY
+**Test Duration:** {summary['duration_hours']:.1f} Hours
+**Total Measurements:** {summary['total_measurements']} data points
+**Winner:** {winner_name}
 
 ---
 
 ## 🏆 Key Results
 
 ### Memory Efficiency
-- **Golang:** {go_avg_mem:.1f} MB average
-- **Python:** {py_avg_mem:.1f} MB average
-- **Improvement:** {(py_avg_mem/go_avg_mem):.1f}x more efficient
+- **Golang:** {go['max_rss_mb']['mean']:.1f} MB average
+- **Python:** {py['max_rss_mb']['mean']:.1f} MB average
+- **Ratio (Python / Golang):** {format_interval(summary['memory_ratio'], suffix='x')}
+- **Verdict:** {memory_verdict(summary)[1]}
 
 ### Performance
-- **Golang:** {go_avg_exec:.1f} seconds average
-- **Python:** {py_avg_exec:.1f} seconds average
-- **Improvement:** {((py_avg_exec-go_avg_exec)/py_avg_exec*100):.1f}% faster
+- **Golang:** {go['elapsed_sec']['mean']:.1f} seconds average
+- **Python:** {py['elapsed_sec']['mean']:.1f} seconds average
+- **Golang time reduction:** {format_interval(summary['speed_reduction_percent'], suffix='%')}
+- **Verdict:** {speed_verdict(summary)[1]}
 
 ### Stability
-- **Golang Variance:** {self.go_df['max_rss_mb'].std():.1f} MB
-- **Python Variance:** {self.py_df['max_rss_mb'].std():.1f} MB
-- **Both:** Excellent stability with no memory leaks
+- **Golang Variance:** {go['max_rss_mb']['std']:.1f} MB ({go['stability']}, CV {go['max_rss_kb']['cv'] * 100:.2f}%)
+- **Python Variance:** {py['max_rss_mb']['std']:.1f} MB ({py['stability']}, CV {py['max_rss_kb']['cv'] * 100:.2f}%)
+- **Memory Trend:** Golang {go['leak']['growth_per_day']:+.1f} KB/day (p={go['leak']['p_value']:.3f}), Python {py['leak']['growth_per_day']:+.1f} KB/day (p={py['leak']['p_value']:.3f})
+- **Verdict:** {leak_label(summary)}
 
 ---
 
 ## 🎯 Production Deployment Recommendation
 
-✅ **APPROVED FOR PRODUCTION**
-- Deploy Golang version immediately
-- Archive Python version for reference
+**{recommendation(summary)}**
+- {deployment_verdict(summary)}
 - Monitor post-deployment performance
 
 ---
 
 ## 📈 Generated Visualizations
 
-1. `memory_usage_trend.png` - 72-hour memory usage trend
+1. `memory_usage_trend.png` - {summary['duration_hours']:.0f}-hour memory usage trend
 2. `performance_comparison.png` - Side-by-side performance metrics
 3. `executive_summary.png` - C-level dashboard
 4. `stability_analysis.png` - Detailed stability analysis
 
 ---
 
-*Generated: February 9, 2026*
+*Generated: {datetime.now().strftime('%B %d, %Y %H:%M')}*
 *Analysis Tool: Enhanced Benchmark Visualizer v1.0*
 """
         
@@ -361,46 +491,119 @@ class BenchmarkVisualizer:
         
         print(f"✅ Created: benchmark_report.md")
     
-    def generate_all_visualizations(self):
-        """Generate all visualizations"""
+    def chart_key(self, name):
+        """Content hash of a chart's input columns, summary and render parameters"""
+        method, output, inputs = CHART_JOBS[name]
+        digest = hashlib.sha256()
+        for frame_name, columns in sorted(inputs.items()):
+            frame = getattr(self, frame_name)[columns]
+            digest.update(frame_name.encode())
+            digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+        # Signature holds file mtimes, only the derived numbers matter here
+        summary = {k: v for k, v in self.summary.items() if k != 'signature'}
+        code = getattr(type(self), method).__code__
+        params = [name, output, self.dpi, self.fig_size, self.colors, summary,
+                  code.co_code.hex(), repr(code.co_consts)]
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+    
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_cache(self, cache):
+        tmp = self.cache_path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.cache_path)
+    
+    def generate_all_visualizations(self, only=None, jobs=None, force=False):
+        """Render charts in parallel, skipping those whose inputs are unchanged"""
         print("🎨 Starting Visualization Generation...")
         print(f"📁 Output directory: {self.output_dir}")
         print()
         
-        if not self.load_data():
+        names = list(only or CHART_JOBS)
+        if not self.load_data(names):
             return
         
-        print("📊 Creating visualizations:")
+        cache = self.load_cache()
+        keys = {name: self.chart_key(name) for name in names}
+        pending = []
+        for name in names:
+            output = self.output_dir / CHART_JOBS[name][1]
+            if not force and cache.get(name) == keys[name] and output.exists():
+                print(f"⏭️  Unchanged: {output.name}")
+            else:
+                pending.append(name)
+        
+        print(f"📊 Creating visualizations: {len(pending)} to render, {len(names) - len(pending)} cached")
+        
+        started = time.perf_counter()
+        failed = []
+        workers = min(len(pending), jobs or os.cpu_count() or 1)
+        if workers <= 1:
+            results = []
+            for name in pending:
+                try:
+                    results.append(_render_chart(self, name))
+                except Exception as e:
+                    print(f"❌ Error creating {name}: {e}")
+                    failed.append(name)
+        else:
+            results = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_render_chart, self, name): name for name in pending}
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        print(f"❌ Error creating {futures[future]}: {e}")
+                        failed.append(futures[future])
+        
+        for name, _ in results:
+            cache[name] = keys[name]
+        self.save_cache(cache)
         
-        try:
-            self.create_memory_usage_trend()
-            self.create_performance_comparison()
-            self.create_executive_summary()
-            self.create_stability_analysis()
-            self.create_summary_report()
-            
-            print()
-            print("🎉 All visualizations completed successfully!")
-            print(f"📁 Files created in: {self.output_dir}")
-            print()
-            print("📋 Generated files:")
-            print("   📈 memory_usage_trend.png")
-            print("   📊 performance_comparison.png")
-            print("   🎯 executive_summary.png")
-            print("   🔍 stability_analysis.png")
-            print("   📄 benchmark_report.md")
-            print()
-            print("🚀 Ready for executive presentation!")
-            
-        except Exception as e:
-            print(f"❌ Error creating visualizations: {e}")
-            import traceback
-            traceback.print_exc()
+        print()
+        for name, elapsed in sorted(results, key=lambda r: -r[1]):
+            print(f"   ⏱️  {CHART_JOBS[name][1]:28s} {elapsed:6.2f}s")
+        print(f"🕒 Wall time: {time.perf_counter() - started:.2f}s with {max(workers, 1)} worker(s) at {self.dpi} dpi")
+        
+        if failed:
+            print(f"❌ {len(failed)} visualization(s) failed: {', '.join(failed)}")
+            return
+        
+        print()
+        print("🎉 All visualizations completed successfully!")
+        print(f"📁 Files created in: {self.output_dir}")
+        print()
+        print("📋 Generated files:")
+        for name in names:
+            print(f"   📄 {CHART_JOBS[name][1]}")
+        print()
+        print("🚀 Ready for executive presentation!")
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Render benchmark charts and report')
+    parser.add_argument('--only', type=lambda v: v.split(','), default=None,
+                        help=f"Comma-separated subset of: {', '.join(CHART_JOBS)}")
+    parser.add_argument('--dpi', type=int, default=300, help='Output resolution (e.g. 72 for quick previews)')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Ignore the chart cache')
+    args = parser.parse_args()
+    
+    unknown = [name for name in args.only or [] if name not in CHART_JOBS]
+    if unknown:
+        parser.error(f"unknown chart(s): {', '.join(unknown)}")
+    
     visualizer = BenchmarkVisualizer()
-    visualizer.generate_all_visualizations()
+    visualizer.dpi = args.dpi
+    visualizer.generate_all_visualizations(only=args.only, jobs=args.jobs, force=args.force)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
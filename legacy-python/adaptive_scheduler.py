@@ -0,0 +1,177 @@
+import json
+import os
+import statistics
+from collections import deque
+from datetime import datetime
+
+
+def _env_float(name, default):
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return float(default)
+
+
+class SchedulerConfig:
+    def __init__(self, hw_min_sec=60, hw_max_sec=900, st_min_sec=3600, st_max_sec=6 * 3600,
+                 daily_budget_bytes=1000 * 1_000_000, window=12,
+                 cpu_limit=80.0, temp_limit=60.0, ram_limit=85.0,
+                 stable_cv=0.10, est_speedtest_bytes=60 * 1_000_000):
+        self.hw_min_sec = hw_min_sec
+        self.hw_max_sec = hw_max_sec
+        self.st_min_sec = st_min_sec
+        self.st_max_sec = st_max_sec
+        self.daily_budget_bytes = daily_budget_bytes
+        self.window = window
+        # Batas yang dianggap "bahaya" (suhu 60°C sama dengan batas merah di laporan PDF)
+        self.cpu_limit = cpu_limit
+        self.temp_limit = temp_limit
+        self.ram_limit = ram_limit
+        # Hasil speedtest dianggap stabil kalau koefisien variasi di bawah nilai ini
+        self.stable_cv = stable_cv
+        self.est_speedtest_bytes = est_speedtest_bytes
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            hw_min_sec=_env_float("ADAPTIVE_HW_MIN_SEC", 60),
+            hw_max_sec=_env_float("ADAPTIVE_HW_MAX_SEC", 900),
+            st_min_sec=_env_float("ADAPTIVE_ST_MIN_SEC", 3600),
+            st_max_sec=_env_float("ADAPTIVE_ST_MAX_SEC", 6 * 3600),
+            daily_budget_bytes=_env_float("SPEEDTEST_DAILY_BUDGET_MB", 1000) * 1_000_000,
+        )
+
+
+class AdaptiveScheduler:
+    """Menentukan kapan sampling hardware & speedtest berikutnya dijalankan.
+
+    Interval hardware mengecil (sampai hw_min_sec) saat CPU/suhu/RAM
+    bervariasi atau mendekati batas, dan membesar (sampai hw_max_sec)
+    saat host idle. Interval speedtest digandakan selama hasil DL/UL
+    stabil, kembali ke st_min_sec kalau tidak, dan tidak pernah melewati
+    budget byte harian.
+    """
+
+    # Simpangan baku yang dianggap "ramai" untuk masing-masing metric
+    NOISY_STDEV = {"cpu": 10.0, "temp": 2.0, "ram": 2.0}
+
+    def __init__(self, config=None):
+        self.config = config or SchedulerConfig()
+        self.hw = {key: deque(maxlen=self.config.window) for key in self.NOISY_STDEV}
+        self.bandwidth = deque(maxlen=6)
+        self.speedtest_bytes = deque(maxlen=6)
+        self.st_interval = self.config.st_min_sec
+        self.last_speedtest = 0.0
+        self.budget_day = ""
+        self.bytes_today = 0
+
+    # --- Hardware ---
+
+    def observe_hardware(self, cpu, temp, ram_percent):
+        self.hw["cpu"].append(cpu)
+        self.hw["temp"].append(temp)
+        self.hw["ram"].append(ram_percent)
+
+    def activity_score(self):
+        """0 = idle & jauh dari batas, 1 = ramai atau sudah di batas."""
+        score = 0.0
+        for key, values in self.hw.items():
+            if len(values) >= 2:
+                score = max(score, statistics.pstdev(values) / self.NOISY_STDEV[key])
+
+        limits = {"cpu": self.config.cpu_limit, "temp": self.config.temp_limit, "ram": self.config.ram_limit}
+        for key, limit in limits.items():
+            if self.hw[key] and limit > 0:
+                # Mulai "waspada" di 70% dari batas, penuh di batas
+                ratio = self.hw[key][-1] / limit
+                score = max(score, (ratio - 0.7) / 0.3)
+
+        return min(1.0, max(0.0, score))
+
+    def next_hardware_interval(self):
+        lo, hi = self.config.hw_min_sec, self.config.hw_max_sec
+        # Interpolasi geometris: perubahan kecil di skor rendah tetap terasa
+        return lo * (hi / lo) ** (1.0 - self.activity_score())
+
+    # --- Speedtest ---
+
+    def _roll_budget(self, now):
+        today = datetime.fromtimestamp(now).strftime("%Y-%m-%d")
+        if today != self.budget_day:
+            self.budget_day = today
+            self.bytes_today = 0
+
+    def expected_speedtest_bytes(self):
+        if self.speedtest_bytes:
+            return statistics.mean(self.speedtest_bytes)
+        return self.config.est_speedtest_bytes
+
+    def speedtest_due(self, now):
+        self._roll_budget(now)
+        if self.bytes_today + self.expected_speedtest_bytes() > self.config.daily_budget_bytes:
+            return False
+        return now - self.last_speedtest >= self.st_interval
+
+    def _bandwidth_stable(self):
+        if len(self.bandwidth) < 3:
+            return False
+        for idx in (0, 1):
+            values = [pair[idx] for pair in self.bandwidth]
+            mean = statistics.mean(values)
+            if mean <= 0 or statistics.pstdev(values) / mean > self.config.stable_cv:
+                return False
+        return True
+
+    def observe_speedtest(self, now, dl, ul, bytes_used):
+        self._roll_budget(now)
+        self.last_speedtest = now
+        self.bytes_today += bytes_used
+        if bytes_used > 0:
+            self.speedtest_bytes.append(bytes_used)
+        if dl > 0 or ul > 0:
+            self.bandwidth.append((dl, ul))
+
+        if self._bandwidth_stable():
+            self.st_interval = min(self.config.st_max_sec, self.st_interval * 2)
+        else:
+            self.st_interval = self.config.st_min_sec
+
+    # --- Persistensi (supaya restart tidak mereset budget) ---
+
+    def to_dict(self):
+        return {
+            "hw": {key: list(values) for key, values in self.hw.items()},
+            "bandwidth": list(self.bandwidth),
+            "speedtest_bytes": list(self.speedtest_bytes),
+            "st_interval": self.st_interval,
+            "last_speedtest": self.last_speedtest,
+            "budget_day": self.budget_day,
+            "bytes_today": self.bytes_today,
+        }
+
+    @classmethod
+    def load(cls, path, config=None):
+        scheduler = cls(config)
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return scheduler
+
+        for key, values in state.get("hw", {}).items():
+            if key in scheduler.hw:
+                scheduler.hw[key].extend(values)
+        scheduler.bandwidth.extend(tuple(pair) for pair in state.get("bandwidth", []))
+        scheduler.speedtest_bytes.extend(state.get("speedtest_bytes", []))
+        scheduler.st_interval = min(scheduler.config.st_max_sec,
+                                    max(scheduler.config.st_min_sec, state.get("st_interval", 0)))
+        scheduler.last_speedtest = state.get("last_speedtest", 0.0)
+        scheduler.budget_day = state.get("budget_day", "")
+        scheduler.bytes_today = state.get("bytes_today", 0)
+        return scheduler
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
@@ -0,0 +1,287 @@
+import array
+import fcntl
+import http.client
+import math
+import os
+import socket
+import statistics
+import termios
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Ukuran baca/kirim per syscall dan body satu request upload
+CHUNK_BYTES = 64 * 1024
+UPLOAD_REQUEST_BYTES = 4 * 1024 * 1024
+# Upload dihitung di sisi pengirim: byte yang masih antre di send buffer
+# (TIOCOUTQ) dikurangkan, dan buffer-nya dibatasi supaya overshoot kecil
+UPLOAD_SNDBUF = 128 * 1024
+UPLOAD_CHUNK_BYTES = 16 * 1024
+# File terbesar yang disediakan server speedtest.net (~30 MB), diulang kalau habis
+DOWNLOAD_FILE = "random4000x4000.jpg"
+
+
+def _env_float(name, default):
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return float(default)
+
+
+def t_critical(confidence, df):
+    """Kuantil dua sisi distribusi t (ekspansi Cornish-Fisher dari normal).
+
+    Cukup akurat untuk df >= 3 (error < 1%), tanpa scipy.
+    """
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    return (z + (z**3 + z) / (4 * df)
+            + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+            + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3))
+
+
+class ThroughputEstimator:
+    """Estimasi throughput dari rate per window pendek.
+
+    Estimasi = rata-rata `rolling` window terakhir. Rate per window saling
+    berkorelasi (burst ACK, antrean buffer), jadi error bar (setengah lebar
+    interval kepercayaan t) dihitung dengan overlapping batch means atas
+    `batch` window berurutan, bukan s/sqrt(n) biasa. Dianggap konvergen
+    kalau error bar <= band x estimasi dan sudah ada min_windows window.
+    """
+
+    def __init__(self, band=0.05, confidence=0.95, min_windows=8, rolling=32, batch=4, resolution_bytes=0):
+        self.band = band
+        self.confidence = confidence
+        self.batch = max(1, batch)
+        self.min_windows = max(2 * self.batch, min_windows)
+        self.rolling = max(self.min_windows, rolling)
+        # Byte dihitung per chunk: window yang kebetulan sama persis tidak
+        # boleh menghasilkan error bar nol
+        self.resolution_bytes = resolution_bytes
+        self.rates = []
+        self.durations = []
+
+    def add(self, nbytes, seconds):
+        if seconds > 0:
+            self.rates.append(nbytes * 8 / seconds)
+            self.durations.append(seconds)
+
+    def estimate(self):
+        """(bit/detik, setengah lebar interval) atau (None, None)."""
+        recent = self.rates[-self.rolling:]
+        n, b = len(recent), self.batch
+        if not n:
+            return None, None
+        mean = statistics.fmean(recent)
+        if n < 2 * b:
+            return mean, math.inf
+
+        # Overlapping batch means (Meketon & Schmeiser): varians rata-rata
+        # jangka panjang dari rata-rata tiap b window berurutan
+        batch_means = [statistics.fmean(recent[i:i + b]) for i in range(n - b + 1)]
+        variance = n * b / ((n - b + 1) * (n - b)) * sum((m - mean) ** 2 for m in batch_means)
+        df = max(1.0, 1.5 * (n / b - 1))
+        half = t_critical(self.confidence, df) * math.sqrt(variance / n)
+        floor = self.resolution_bytes * 8 / sum(self.durations[-self.rolling:])
+        return mean, max(half, floor)
+
+    def converged(self):
+        if len(self.rates) < self.min_windows:
+            return False
+        mean, half = self.estimate()
+        return mean > 0 and half <= self.band * mean
+
+
+class BandwidthResult:
+    def __init__(self, direction, mbps, error_mbps, bytes_used, seconds, windows, reason):
+        self.direction = direction
+        self.mbps = mbps
+        self.error_mbps = error_mbps
+        self.bytes_used = bytes_used
+        self.seconds = seconds
+        self.windows = windows
+        self.reason = reason
+
+    @property
+    def converged(self):
+        return self.reason == "konvergen"
+
+    @property
+    def low_mbps(self):
+        return max(0.0, self.mbps - self.error_mbps)
+
+    @property
+    def high_mbps(self):
+        return self.mbps + self.error_mbps
+
+    def __str__(self):
+        return (f"{self.direction}: {self.mbps:.2f} ± {self.error_mbps:.2f} Mbps "
+                f"({self.bytes_used / 1_000_000:.1f} MB, {self.seconds:.1f} s, {self.windows} window, {self.reason})")
+
+
+def unacked_bytes(sock):
+    """Byte di send queue yang belum di-ACK peer (Linux TIOCOUTQ), 0 kalau tidak didukung."""
+    buf = array.array("i", [0])
+    try:
+        fcntl.ioctl(sock.fileno(), termios.TIOCOUTQ, buf)
+    except (OSError, ValueError):
+        return 0
+    return buf[0]
+
+
+def _connect(parts, timeout):
+    cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    return cls(parts.netloc, timeout=timeout)
+
+
+def _target(parts):
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+class BandwidthProbe:
+    """Ukur bandwidth dengan durasi adaptif, berhenti saat estimasi konvergen.
+
+    Beberapa stream HTTP paralel menghitung byte ke satu counter; thread
+    utama mengambil rate tiap window_sec. Window selama warmup_sec (TCP
+    slow start) tidak ikut estimasi tapi tetap dihitung ke batas byte.
+    Pengukuran selalu berhenti di max_bytes atau max_sec, mana yang duluan.
+    """
+
+    def __init__(self, window_sec=0.25, warmup_sec=0.5, band=0.05, confidence=0.95,
+                 min_windows=8, rolling=32, batch=4, max_bytes=25_000_000, max_sec=8.0, streams=2, timeout=5.0):
+        self.window_sec = window_sec
+        self.warmup_sec = warmup_sec
+        self.band = band
+        self.confidence = confidence
+        self.min_windows = min_windows
+        self.rolling = rolling
+        self.batch = batch
+        self.max_bytes = max_bytes
+        self.max_sec = max_sec
+        self.streams = streams
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            band=_env_float("BANDWIDTH_BAND", 0.05),
+            confidence=_env_float("BANDWIDTH_CONFIDENCE", 0.95),
+            max_bytes=_env_float("BANDWIDTH_MAX_MB", 25) * 1_000_000,
+            max_sec=_env_float("BANDWIDTH_MAX_SEC", 8),
+            streams=int(_env_float("BANDWIDTH_STREAMS", 2)),
+        )
+
+    def download(self, url):
+        return self._measure("download", url, self._download_worker)
+
+    def upload(self, url):
+        return self._measure("upload", url, self._upload_worker)
+
+    def _measure(self, direction, url, worker):
+        parts = urlsplit(url)
+        state = {"bytes": 0, "errors": [], "sockets": set(), "stop": threading.Event(), "lock": threading.Lock()}
+        threads = [threading.Thread(target=worker, args=(parts, state), daemon=True) for _ in range(self.streams)]
+
+        estimator = ThroughputEstimator(self.band, self.confidence, self.min_windows, self.rolling,
+                                        self.batch, resolution_bytes=self.streams * CHUNK_BYTES)
+        start = last = time.perf_counter()
+        last_bytes = 0
+        for thread in threads:
+            thread.start()
+
+        reason = None
+        while reason is None:
+            state["stop"].wait(self.window_sec)
+            now = time.perf_counter()
+            total = self._delivered(state)
+            if now - start > self.warmup_sec:
+                estimator.add(total - last_bytes, now - last)
+            last, last_bytes = now, total
+
+            if estimator.converged():
+                reason = "konvergen"
+            elif total >= self.max_bytes:
+                reason = "batas byte"
+            elif now - start >= self.max_sec:
+                reason = "batas waktu"
+            elif not any(thread.is_alive() for thread in threads):
+                reason = "error: " + state["errors"][0] if state["errors"] else "koneksi selesai"
+        state["stop"].set()
+        for thread in threads:
+            thread.join(self.timeout)
+
+        elapsed = time.perf_counter() - start
+        mean, half = estimator.estimate()
+        if mean is None:
+            # Terlalu cepat selesai untuk satu window pun: pakai rata-rata total
+            mean, half = (last_bytes * 8 / elapsed if elapsed > 0 else 0.0), math.inf
+        if state["errors"] and not last_bytes:
+            raise OSError(f"{direction} gagal: {state['errors'][0]}")
+        return BandwidthResult(direction, mean / 1_000_000, half / 1_000_000,
+                               state["bytes"], elapsed, len(estimator.rates), reason)
+
+    def _delivered(self, state):
+        with state["lock"]:
+            total, sockets = state["bytes"], list(state["sockets"])
+        return total - sum(unacked_bytes(sock) for sock in sockets)
+
+    def _count(self, state, nbytes):
+        with state["lock"]:
+            state["bytes"] += nbytes
+            if state["bytes"] >= self.max_bytes:
+                state["stop"].set()
+
+    def _download_worker(self, parts, state):
+        stop = state["stop"]
+        try:
+            while not stop.is_set():
+                conn = _connect(parts, self.timeout)
+                try:
+                    conn.request("GET", _target(parts), headers={"Cache-Control": "no-cache"})
+                    response = conn.getresponse()
+                    if response.status != 200:
+                        raise OSError(f"HTTP {response.status}")
+                    while not stop.is_set():
+                        chunk = response.read(CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        self._count(state, len(chunk))
+                finally:
+                    conn.close()
+        except (OSError, http.client.HTTPException) as e:
+            state["errors"].append(str(e))
+
+    def _upload_worker(self, parts, state):
+        stop = state["stop"]
+        payload = b"content1=" + b"0" * (UPLOAD_CHUNK_BYTES - len(b"content1="))
+        try:
+            while not stop.is_set():
+                conn = _connect(parts, self.timeout)
+                try:
+                    conn.connect()
+                    conn.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UPLOAD_SNDBUF)
+                    with state["lock"]:
+                        state["sockets"].add(conn.sock)
+                    conn.putrequest("POST", _target(parts))
+                    conn.putheader("Content-Type", "application/x-www-form-urlencoded")
+                    conn.putheader("Content-Length", str(UPLOAD_REQUEST_BYTES))
+                    conn.endheaders()
+                    sent = 0
+                    while sent < UPLOAD_REQUEST_BYTES and not stop.is_set():
+                        data = payload[:UPLOAD_REQUEST_BYTES - sent]
+                        conn.send(data)
+                        sent += len(data)
+                        self._count(state, len(data))
+                    if sent == UPLOAD_REQUEST_BYTES:
+                        conn.getresponse().read()
+                finally:
+                    with state["lock"]:
+                        state["sockets"].discard(conn.sock)
+                    conn.close()
+        except (OSError, http.client.HTTPException) as e:
+            state["errors"].append(str(e))
+
+
+def speedtest_download_url(upload_url):
+    """URL file download di server speedtest.net (sebelah upload.php)."""
+    return upload_url.rsplit("/", 1)[0] + "/" + DOWNLOAD_FILE
@@ -0,0 +1,163 @@
+"""Bandingkan arsip kolumnar (metric_archive.py) dengan CSV + gzip.
+
+Membuat data sintetis satu tahun dengan pola mirip log monitor, lalu
+mengukur ukuran total dan waktu scan setahun penuh (rata-rata semua kolom),
+plus biaya report rentang 30 hari dari ringkasan harian (day_summary.py).
+
+Contoh:
+    python bench_archive.py                 # 1 tahun, sampel tiap 60 detik
+    python bench_archive.py --interval 3600 # 1 tahun, sampel tiap jam (mode cron)
+"""
+import argparse
+import csv
+import gzip
+import io
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from day_summary import combine, load_summaries
+from metric_archive import VALUE_COLUMNS, archive_path, encode_columns, scan_archives
+from metric_log import HEADER
+
+
+def synthetic_day(day_start, interval, rng):
+    timestamps = []
+    columns = {name: [] for name in VALUE_COLUMNS}
+    t = day_start
+    while t < day_start + 86400:
+        hour = (t - day_start) / 3600
+        load = 15 + 10 * math.sin(hour / 24 * 2 * math.pi)
+        speedtest = (t - day_start) % 3600 < interval
+        columns["CPU_%"].append(round(max(0.0, load + rng.gauss(0, 3)), 1))
+        columns["Suhu_C"].append(round(45 + load / 4 + rng.gauss(0, 0.5), 1))
+        columns["RAM_GB"].append(round(1.2 + rng.gauss(0, 0.02), 2))
+        columns["Ping_ms"].append(round(20 + abs(rng.gauss(0, 5)), 1) if speedtest else None)
+        columns["DL_Mbps"].append(round(50 + rng.gauss(0, 4), 2) if speedtest else None)
+        columns["UL_Mbps"].append(round(20 + rng.gauss(0, 2), 2) if speedtest else None)
+        columns["Disk_%"].append(41.0)
+        columns["DiskR_MBps"].append(round(abs(rng.gauss(0.05, 0.03)), 3))
+        columns["DiskW_MBps"].append(round(0.2 + load / 100 + abs(rng.gauss(0, 0.05)), 3))
+        columns["Disk_IOPS"].append(round(3 + load / 5 + abs(rng.gauss(0, 1)), 2))
+        columns["NetRX_Mbps"].append(round(0.5 + abs(rng.gauss(0, 0.3)), 3))
+        columns["NetTX_Mbps"].append(round(0.2 + abs(rng.gauss(0, 0.1)), 3))
+        columns["DL_err_Mbps"].append(round(abs(rng.gauss(1.5, 0.5)), 2) if speedtest else None)
+        columns["UL_err_Mbps"].append(round(abs(rng.gauss(0.6, 0.2)), 2) if speedtest else None)
+        # Pi 4 1500 MHz, turun ke 1000 MHz saat panas di puncak beban
+        hot = columns["Suhu_C"][-1] > 50.5
+        columns["CPU_MHz"].append(round(1000 + 500 * rng.random() if hot else 1500.0, 1))
+        columns["Throttled"].append(1 if hot else 0)
+        timestamps.append(t + rng.choice((0, 0, 0, 1)))  # jitter kecil seperti cron
+        t += interval
+    return timestamps, columns
+
+
+def day_csv_gz(timestamps, columns):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["Waktu"] + HEADER[1:])
+    for i, ts in enumerate(timestamps):
+        writer.writerow([ts] + ["" if columns[name][i] is None else columns[name][i] for name in VALUE_COLUMNS])
+    return gzip.compress(buf.getvalue().encode("utf-8"))
+
+
+def scan_csv_gz(directory):
+    sums = {name: 0.0 for name in VALUE_COLUMNS}
+    counts = {name: 0 for name in VALUE_COLUMNS}
+    for name in sorted(os.listdir(directory)):
+        with gzip.open(os.path.join(directory, name), "rt", newline="") as f:
+            reader = csv.reader(f)
+            next(reader)
+            for row in reader:
+                for idx, col in enumerate(VALUE_COLUMNS, start=1):
+                    if row[idx] != "":
+                        sums[col] += float(row[idx])
+                        counts[col] += 1
+    return {name: sums[name] / counts[name] for name in VALUE_COLUMNS if counts[name]}
+
+
+def scan_archive(directory):
+    sums = {name: 0.0 for name in VALUE_COLUMNS}
+    counts = {name: 0 for name in VALUE_COLUMNS}
+    for _, _, columns in scan_archives(archive_dir=directory):
+        for name, values in columns.items():
+            filled = [v for v in values if v is not None] if None in values else values
+            sums[name] += sum(filled)
+            counts[name] += len(filled)
+    return {name: sums[name] / counts[name] for name in VALUE_COLUMNS if counts[name]}
+
+
+def dir_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, n)) for n in os.listdir(directory))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--interval', type=int, default=60, help='Detik antar sampel')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp(prefix="bench_archive_")
+    mca_dir = os.path.join(workdir, "mca")
+    gz_dir = os.path.join(workdir, "csv_gz")
+    os.makedirs(mca_dir)
+    os.makedirs(gz_dir)
+
+    print(f"Membuat {args.days} hari data (interval {args.interval} detik)...")
+    rows = 0
+    encode_time = 0.0
+    start = datetime(2026, 1, 1)
+    for d in range(args.days):
+        day = start + timedelta(days=d)
+        timestamps, columns = synthetic_day(int(day.timestamp()), args.interval, rng)
+        rows += len(timestamps)
+        t0 = time.perf_counter()
+        data = encode_columns(timestamps, columns)
+        encode_time += time.perf_counter() - t0
+        with open(archive_path(day.strftime("%Y-%m-%d"), mca_dir), "wb") as f:
+            f.write(data)
+        with open(os.path.join(gz_dir, day.strftime("%Y-%m-%d") + ".csv.gz"), "wb") as f:
+            f.write(day_csv_gz(timestamps, columns))
+
+    t0 = time.perf_counter()
+    mca_means = scan_archive(mca_dir)
+    mca_scan = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    gz_means = scan_csv_gz(gz_dir)
+    gz_scan = time.perf_counter() - t0
+
+    # Report --range 30d: ringkasan dibuat sekali, report berikutnya hanya baca ringkasan
+    last = (start + timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+    first = (start + timedelta(days=max(0, args.days - 30))).strftime("%Y-%m-%d")
+    summary_dir = os.path.join(workdir, "summaries")
+    t0 = time.perf_counter()
+    load_summaries(first, last, mca_dir, summary_dir)
+    range_first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    combine(load_summaries(first, last, mca_dir, summary_dir))
+    range_again = time.perf_counter() - t0
+
+    mca_size, gz_size = dir_size(mca_dir), dir_size(gz_dir)
+    values = rows * len(VALUE_COLUMNS)
+    print(f"Baris        : {rows:,} ({values:,} nilai)")
+    print(f"Ukuran       : arsip {mca_size / 1024:,.0f} KiB | csv.gz {gz_size / 1024:,.0f} KiB "
+          f"({gz_size / mca_size:.1f}x lebih kecil), {mca_size * 8 / values:.2f} bit/nilai")
+    print(f"Encode       : {encode_time:.2f} detik total")
+    print(f"Scan setahun : arsip {mca_scan:.3f} detik ({values / mca_scan / 1e6:.1f} M nilai/detik) | "
+          f"csv.gz {gz_scan:.3f} detik ({gz_scan / mca_scan:.1f}x lebih lambat)")
+    print(f"Range 30 hari: {range_first:.3f} detik pertama kali, {range_again * 1000:.1f} ms berikutnya "
+          f"(ringkasan {dir_size(summary_dir) / 1024:,.0f} KiB)")
+    mismatch = [n for n in VALUE_COLUMNS if abs(mca_means[n] - gz_means[n]) > 1e-6]
+    print(f"Hasil sama   : {'ya' if not mismatch else 'TIDAK: ' + ', '.join(mismatch)}")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Uji BandwidthProbe (bandwidth_probe.py) terhadap server HTTP lokal yang di-throttle.
+
+Server stand-in meniru server speedtest.net: GET /random4000x4000.jpg
+mengirim data, POST /upload.php membuang body, keduanya dibatasi token
+bucket bersama dengan rate yang diketahui (plus jitter acak). Setiap rate
+diukur dengan mode adaptif (berhenti saat konvergen) dan mode durasi
+tetap (band 0 -> selalu jalan sampai batas waktu) sebagai pembanding.
+
+Contoh:
+    python bench_bandwidth.py                     # 10, 25, 50 Mbps
+    python bench_bandwidth.py --rates 5 100 --jitter 0.3
+"""
+import argparse
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bandwidth_probe import CHUNK_BYTES, DOWNLOAD_FILE, BandwidthProbe
+
+
+class Throttle:
+    """Token bucket bersama semua koneksi (rate dalam bit/detik)."""
+
+    def __init__(self, rate_bps, jitter=0.0, seed=42):
+        self.rate_bps = rate_bps
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.next_free = time.perf_counter()
+
+    def take(self, nbytes):
+        with self.lock:
+            # Jitter pada waktu per chunk (bukan rate) supaya rata-ratanya tetap rate_bps
+            delay = nbytes * 8 / self.rate_bps * (1 + self.rng.uniform(-self.jitter, self.jitter))
+            now = time.perf_counter()
+            self.next_free = max(self.next_free, now) + delay
+            wait = self.next_free - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+def make_server(throttle):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if not self.path.endswith(DOWNLOAD_FILE):
+                self.send_error(404)
+                return
+            size = 30 * 1024 * 1024
+            self.send_response(200)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            chunk = b"\0" * CHUNK_BYTES
+            try:
+                for _ in range(size // CHUNK_BYTES):
+                    throttle.take(len(chunk))
+                    self.wfile.write(chunk)
+            except OSError:
+                pass  # Probe menutup koneksi saat sudah konvergen
+
+        def do_POST(self):
+            remaining = int(self.headers.get("Content-Length", 0))
+            try:
+                while remaining > 0:
+                    data = self.rfile.read(min(CHUNK_BYTES, remaining))
+                    if not data:
+                        return
+                    throttle.take(len(data))
+                    remaining -= len(data)
+            except OSError:
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def server_bind(self):
+            # Receive buffer kecil (diwarisi socket hasil accept) supaya throttle
+            # di aplikasi terasa seperti bottleneck link, bukan buffer yang
+            # menelan burst upload di awal tiap koneksi
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CHUNK_BYTES)
+            super().server_bind()
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rates', type=float, nargs='+', default=[10, 25, 50], help='Rate server (Mbps)')
+    parser.add_argument('--jitter', type=float, default=0.2, help='Variasi rate acak per chunk (fraksi)')
+    parser.add_argument('--band', type=float, default=0.05)
+    parser.add_argument('--max-sec', type=float, default=10)
+    args = parser.parse_args()
+
+    print(f"{'Rate':>6} {'Arah':<9} {'Mode':<8} {'Estimasi (Mbps)':>18} {'MB':>6} {'Detik':>6}  Dalam error bar")
+    for rate in args.rates:
+        throttle = Throttle(rate * 1_000_000, args.jitter)
+        server = make_server(throttle)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        for mode, band in (("adaptif", args.band), ("tetap", 0.0)):
+            probe = BandwidthProbe(band=band, max_sec=args.max_sec, max_bytes=10**12)
+            for direction, result in (("download", lambda: probe.download(f"{base}/{DOWNLOAD_FILE}")),
+                                      ("upload", lambda: probe.upload(f"{base}/upload.php"))):
+                res = result()
+                inside = "ya" if res.low_mbps <= rate <= res.high_mbps else "tidak"
+                print(f"{rate:>6.0f} {direction:<9} {mode:<8} {res.mbps:>8.2f} ± {res.error_mbps:<7.2f} "
+                      f"{res.bytes_used / 1_000_000:>6.1f} {res.seconds:>6.1f}  {inside} ({res.reason})")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Ukur biaya per tick ContainerStats (cgroup_stats.py) untuk banyak container.
+
+Membuat tree cgroup v2 tiruan (system.slice/docker-<id>.scope dengan
+cpu.stat, memory.current, memory.stat, io.stat) berisi N container, lalu
+counter dinaikkan di antara tick. Dibandingkan dengan cara naif: walk
+seluruh tree dan open/read/close setiap file di setiap tick.
+
+Di /sys/fs/cgroup asli biaya baca per file lebih mahal (kernel membangun
+isi file), tapi jumlah syscall per container yang dibandingkan sama.
+
+Contoh:
+    python bench_containers.py                      # 10, 100, 500 container
+    python bench_containers.py --containers 50 1000 --ticks 50
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from bench_log_append import percentile
+from cgroup_stats import ContainerStats
+
+# Slice lain yang biasa ada di host, supaya walk punya sesuatu untuk dilewati
+OTHER_UNITS = 60
+
+
+def make_tree(root, count, rng):
+    os.makedirs(os.path.join(root, "init.scope"))
+    open(os.path.join(root, "cgroup.controllers"), "w").write("cpu io memory pids\n")
+    for i in range(OTHER_UNITS):
+        os.makedirs(os.path.join(root, "system.slice", f"service-{i}.service"))
+        os.makedirs(os.path.join(root, "user.slice", f"user-{1000 + i}.slice"))
+    paths = []
+    for _ in range(count):
+        path = os.path.join(root, "system.slice", f"docker-{rng.getrandbits(256):064x}.scope")
+        os.makedirs(path)
+        open(os.path.join(path, "memory.max"), "w").write("max\n")
+        paths.append(path)
+    return paths
+
+
+def write_counters(path, tick, rng):
+    usage = tick * 250_000 + rng.randint(0, 10_000)
+    files = {
+        "cpu.stat": f"usage_usec {usage}\nuser_usec {usage // 2}\nsystem_usec {usage // 2}\n"
+                    f"nr_periods {tick * 10}\nnr_throttled {tick}\nthrottled_usec {tick * 5000}\n",
+        "memory.current": f"{200 * 1024**2 + rng.randint(0, 1024**2)}\n",
+        # memory.stat asli ~40 baris
+        "memory.stat": f"anon {150 * 1024**2}\nfile {40 * 1024**2}\n"
+                       + "".join(f"stat_{k} {rng.randint(0, 10**6)}\n" for k in range(38)),
+        "io.stat": f"8:0 rbytes={tick * 4096} wbytes={tick * 8192} rios={tick} wios={tick * 2} dbytes=0 dios=0\n",
+    }
+    for name, text in files.items():
+        # Tulis di inode yang sama (fd yang sudah terbuka tetap valid, seperti file cgroup)
+        with open(os.path.join(path, name), "r+b" if os.path.exists(os.path.join(path, name)) else "wb") as f:
+            data = text.encode()
+            f.write(data)
+            f.truncate(len(data))
+
+
+def naive_tick(stats, now):
+    """Walk penuh (rescan_sec=0) + open/pread/close tiap file, setiap tick; parsing sama."""
+    rows = stats.sample(now)
+    stats.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--containers', type=int, nargs='+', default=[10, 100, 500])
+    parser.add_argument('--ticks', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'Container':>9} {'Mode':<8} {'Tick p50 (ms)':>14} {'p95 (ms)':>9} {'µs/container':>13} {'fd':>5}")
+    for count in args.containers:
+        root = tempfile.mkdtemp(prefix="bench_containers_")
+        try:
+            paths = make_tree(root, count, rng)
+            for path in paths:
+                write_counters(path, 0, rng)
+
+            docker_dir = os.path.join(root, "no-docker")
+            stats = ContainerStats(containers="", root=root, docker_dir=docker_dir)
+            baseline = ContainerStats(containers="", root=root, docker_dir=docker_dir, rescan_sec=0)
+            cached, naive = [], []
+            for tick in range(1, args.ticks + 1):
+                for path in paths:
+                    write_counters(path, tick, rng)
+                t0 = time.perf_counter()
+                rows = stats.sample(time.time())
+                cached.append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                naive_tick(baseline, time.time())
+                naive.append(time.perf_counter() - t0)
+            assert len(rows) == count, f"{len(rows)} baris untuk {count} container"
+            fds = stats.open_fds()
+            stats.close()
+
+            for mode, values, fd in (("cached", cached[1:], fds), ("naif", naive[1:], 0)):
+                p50 = percentile(values, 50)
+                print(f"{count:>9} {mode:<8} {p50 * 1000:>14.2f} {percentile(values, 95) * 1000:>9.2f} "
+                      f"{p50 / count * 1e6:>13.1f} {fd:>5}")
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Stress test jalur append log: banyak writer + report yang merotasi bersamaan.
+
+Contoh:
+    python bench_log_append.py --writers 16 --seconds 5
+    python bench_log_append.py --writers 16 --seconds 5 --naive   # cara lama (open 'a' + os.remove)
+
+Setiap record berisi (writer, seq, checksum). Di akhir, semua record
+dicocokkan: harus ada tepat sekali dan tidak ada baris yang terpotong.
+"""
+import argparse
+import csv
+import multiprocessing as mp
+import os
+import shutil
+import tempfile
+import time
+import zlib
+
+from metric_log import append_record, claim_closed_segments, read_rows, mark_reported, reported_dir
+
+SPAN_SEC = 1
+SETTLE_SEC = 0.2
+
+
+def make_row(writer_id, seq):
+    payload = f"{writer_id}-{seq}-" + "x" * 48
+    return [writer_id, seq, payload, zlib.crc32(payload.encode())]
+
+
+def valid_row(row):
+    return len(row) == 4 and str(zlib.crc32(row[2].encode())) == row[3]
+
+
+def safe_writer(segment_dir, writer_id, deadline, out):
+    seq, latencies = 0, []
+    while time.time() < deadline:
+        t0 = time.perf_counter()
+        append_record(make_row(writer_id, seq), segment_dir=segment_dir, span_sec=SPAN_SEC)
+        latencies.append(time.perf_counter() - t0)
+        seq += 1
+    out.put((writer_id, seq, latencies))
+
+
+def naive_writer(log_file, writer_id, deadline, out):
+    seq, latencies = 0, []
+    while time.time() < deadline:
+        t0 = time.perf_counter()
+        with open(log_file, mode='a', newline='') as file:
+            csv.writer(file).writerow(make_row(writer_id, seq))
+        latencies.append(time.perf_counter() - t0)
+        seq += 1
+    out.put((writer_id, seq, latencies))
+
+
+def safe_reporter(segment_dir, deadline):
+    rows = []
+    while time.time() < deadline:
+        paths = claim_closed_segments(segment_dir=segment_dir, span_sec=SPAN_SEC, settle_sec=SETTLE_SEC)
+        rows.extend(read_rows(paths, min_columns=0))
+        mark_reported(paths, segment_dir=segment_dir)
+        time.sleep(0.05)
+    # Setelah semua writer selesai: klaim sisa segment
+    paths = claim_closed_segments(now=time.time() + 3600, segment_dir=segment_dir,
+                                  span_sec=SPAN_SEC, settle_sec=SETTLE_SEC)
+    rows.extend(read_rows(paths, min_columns=0))
+    mark_reported(paths, segment_dir=segment_dir)
+    return rows
+
+
+def naive_reporter(log_file, deadline):
+    # Meniru generate_report() lama: baca lalu os.remove file yang masih dipakai
+    rows = []
+    while time.time() < deadline + 0.5:
+        if os.path.exists(log_file):
+            with open(log_file, mode='r', newline='') as file:
+                rows.extend(csv.reader(file))
+            os.remove(log_file)
+        time.sleep(0.05)
+    return rows
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writers', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--naive', action='store_true', help='Bandingkan dengan cara tulis lama')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_log_append_")
+    target = os.path.join(workdir, "daily_log.csv") if args.naive else workdir
+    writer_fn = naive_writer if args.naive else safe_writer
+    deadline = time.time() + args.seconds
+
+    out = mp.Queue()
+    procs = [mp.Process(target=writer_fn, args=(target, i, deadline, out)) for i in range(args.writers)]
+    for p in procs:
+        p.start()
+
+    rows = naive_reporter(target, deadline) if args.naive else safe_reporter(target, deadline + 0.5)
+
+    results = [out.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    expected = sum(count for _, count, _ in results)
+    latencies = [lat for _, _, lats in results for lat in lats]
+
+    seen = set()
+    torn = duplicates = 0
+    for row in rows:
+        if not valid_row(row):
+            torn += 1
+            continue
+        key = (row[0], row[1])
+        if key in seen:
+            duplicates += 1
+        seen.add(key)
+    lost = expected - len(seen)
+
+    mode = "naive (open 'a' + os.remove)" if args.naive else "segment O_APPEND + rename"
+    print(f"Mode         : {mode}")
+    print(f"Writer       : {args.writers} proses, {args.seconds:.1f} detik")
+    print(f"Record ditulis: {expected} ({expected / args.seconds:,.0f} record/detik)")
+    print(f"Latency append: p50 {percentile(latencies, 50) * 1e6:.0f} µs | p99 {percentile(latencies, 99) * 1e6:.0f} µs")
+    print(f"Hilang       : {lost}")
+    print(f"Terpotong    : {torn}")
+    print(f"Duplikat     : {duplicates}")
+    if not args.naive:
+        print(f"Segment      : {len(os.listdir(reported_dir(target)))} tersimpan di reported/")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    return 0 if (lost == 0 and torn == 0 and duplicates == 0) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""Replay stream metric lewat jalur data monitor: append log -> report -> alert -> arsip.
+
+Stream diambil dari arsip harian (.mca, hasil metric_archive.py) atau dibuat
+sintetis (pola yang sama dengan bench_archive.py). Setiap sampel ditulis
+dengan append_record() ke segment per host, dan setiap --report-hours jam
+virtual generate_report() dijalankan per host dengan waktu virtual: klaim
+segment, agregasi, PDF, kirim ke webhook (sink HTTP lokal, bukan Discord),
+arsip + ringkasan harian.
+
+Waktu virtual berjalan --speedup kali lebih cepat dari waktu nyata
+(0 = secepat mungkin). Hasil: sampel/detik yang bisa dipertahankan,
+keterlambatan terhadap jadwal, persentil latency append & tiap tahap
+report (dari span MONITOR_SPAN_LOG), dan memori.
+
+Contoh:
+    python bench_pipeline.py                                  # 7 hari, 4 host, 1 sampel/menit, secepatnya
+    python bench_pipeline.py --hosts 50 --days 2 --speedup 7200
+    python bench_pipeline.py --source /opt/monitoring/archive --hosts 10
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bench_archive import synthetic_day
+from bench_log_append import percentile
+from metric_archive import VALUE_COLUMNS, scan_archives
+from metric_log import append_record
+
+
+def start_sink():
+    """Webhook lokal pengganti Discord: terima POST, hitung request & byte."""
+    stats = {"requests": 0, "bytes": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            stats["requests"] += 1
+            stats["bytes"] += len(body)
+            self.send_response(204)
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats
+
+
+def synthetic_stream(days, interval, seed):
+    rng = random.Random(seed)
+    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    for d in range(days):
+        timestamps, columns = synthetic_day(int((start + timedelta(days=d)).timestamp()), interval, rng)
+        yield timestamps, columns
+
+
+def recorded_stream(archive_dir):
+    for _, timestamps, columns in scan_archives(archive_dir=archive_dir):
+        yield timestamps, columns
+
+
+def stream_rows(chunks):
+    """(timestamp, baris log) dengan urutan kolom metric_log.HEADER."""
+    for timestamps, columns in chunks:
+        values = [columns.get(name, [None] * len(timestamps)) for name in VALUE_COLUMNS]
+        for i, ts in enumerate(timestamps):
+            row = [datetime.fromtimestamp(ts).strftime("%H:%M")]
+            row.extend("" if col[i] is None else col[i] for col in values)
+            yield ts, row
+
+
+def span_latencies(path):
+    """span -> [detik] dari file MONITOR_SPAN_LOG."""
+    stages = {}
+    if not os.path.exists(path):
+        return stages
+    with open(path) as f:
+        for line in f:
+            span = json.loads(line)
+            stages.setdefault(span["span"], []).append(span["dur_ms"] / 1000)
+    return stages
+
+
+def current_rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', help='Direktori arsip .mca (default: stream sintetis)')
+    parser.add_argument('--days', type=int, default=7, help='Panjang stream sintetis')
+    parser.add_argument('--interval', type=int, default=60, help='Detik antar sampel stream sintetis')
+    parser.add_argument('--hosts', type=int, default=4)
+    parser.add_argument('--speedup', type=float, default=0, help='Kelipatan waktu nyata (0 = secepatnya)')
+    parser.add_argument('--report-hours', type=float, default=24, help='Jarak report (jam virtual)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keep', action='store_true', help='Jangan hapus direktori kerja')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    sink, sink_stats = start_sink()
+    # Harus di-set sebelum import monitor_server (webhook wajib ada, span dibaca saat import)
+    os.environ["DISCORD_WEBHOOK_URL"] = f"http://127.0.0.1:{sink.server_address[1]}/webhook"
+    os.environ["MONITOR_SPAN_LOG"] = os.path.join(workdir, "spans.jsonl")
+    import monitor_server
+
+    hosts = []
+    for h in range(args.hosts):
+        base = os.path.join(workdir, f"host{h:03d}")
+        names = ("segments", "io-segments", "container-segments", "thermal-segments", "process-segments",
+                 "archive", "summaries")
+        hosts.append({name: os.path.join(base, name) for name in names})
+
+    chunks = recorded_stream(args.source) if args.source else synthetic_stream(args.days, args.interval, args.seed)
+    report_every = args.report_hours * 3600
+    append_lat, lags = [], []
+    samples = reports = 0
+    first_ts = next_report = None
+    quiet = open(os.devnull, "w")
+
+    wall_start = time.perf_counter()
+    for ts, row in stream_rows(chunks):
+        if first_ts is None:
+            first_ts = ts
+            next_report = ts + report_every
+        if args.speedup:
+            target = wall_start + (ts - first_ts) / args.speedup
+            lag = time.perf_counter() - target
+            if lag < 0:
+                time.sleep(-lag)
+            lags.append(max(0.0, lag))
+
+        # Report jalan di waktu virtual yang sama untuk semua host, seperti cron 06:10
+        if ts >= next_report:
+            for dirs in hosts:
+                stdout, sys.stdout = sys.stdout, quiet
+                try:
+                    monitor_server.generate_report(ts, dirs["segments"], dirs["io-segments"],
+                                                   dirs["archive"], dirs["summaries"], dirs["container-segments"],
+                                                   dirs["thermal-segments"], dirs["process-segments"])
+                finally:
+                    sys.stdout = stdout
+                reports += 1
+            next_report += report_every
+
+        for dirs in hosts:
+            t0 = time.perf_counter()
+            append_record(row, when=ts, segment_dir=dirs["segments"])
+            append_lat.append(time.perf_counter() - t0)
+            samples += 1
+    wall = time.perf_counter() - wall_start
+    sink.shutdown()
+
+    virtual = (ts - first_ts) if first_ts is not None else 0
+    print(f"Stream       : {'arsip ' + args.source if args.source else 'sintetis'}, "
+          f"{samples // max(1, args.hosts):,} sampel x {args.hosts} host, {virtual / 86400:.1f} hari virtual")
+    print(f"Durasi       : {wall:.2f} detik nyata (speedup {'maks' if not args.speedup else f'{args.speedup:g}x'}"
+          f", efektif {virtual / wall:,.0f}x)")
+    print(f"Throughput   : {samples / wall:,.0f} sampel/detik berkelanjutan (termasuk report)")
+    if lags:
+        print(f"Terlambat    : p99 {percentile(lags, 99) * 1000:.1f} ms | maks {max(lags) * 1000:.1f} ms dari jadwal")
+    print(f"Append       : p50 {percentile(append_lat, 50) * 1e6:.0f} µs | p99 {percentile(append_lat, 99) * 1e6:.0f} µs"
+          f" | maks {max(append_lat, default=0) * 1e6:.0f} µs")
+    stages = span_latencies(os.environ["MONITOR_SPAN_LOG"])
+    print(f"Report       : {reports} kali, webhook {sink_stats['requests']} POST ({sink_stats['bytes'] / 1024:,.0f} KiB)")
+    for name in ("read", "pdf", "send", "archive", "report"):
+        if name in stages:
+            values = stages[name]
+            print(f"  {name:<10} : p50 {percentile(values, 50) * 1000:7.1f} ms | p95 {percentile(values, 95) * 1000:7.1f} ms"
+                  f" | maks {max(values) * 1000:7.1f} ms")
+    print(f"Memori       : RSS puncak {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB"
+          f" | sekarang {current_rss_mb():.1f} MB")
+
+    if args.keep:
+        print(f"Direktori kerja: {workdir}")
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Bandingkan waktu start monitor_server.py dari venv dengan monitor.pyz (build_zipapp.py).
+
+Yang diukur adalah "--help": semua import modul dan dependensi berjalan,
+lalu argparse keluar, jadi selisihnya murni biaya start (resolusi import,
+validasi .pyc, site/.pth), bukan kerja monitoring.
+
+Cold cache: sebagai root page cache dikosongkan (sync + drop_caches=3)
+sebelum setiap run, seperti cron pertama setelah lama idle di kartu SD.
+Tanpa root, file stdlib, site-packages, script, zip dan interpreter
+dikeluarkan dari cache dengan posix_fadvise(DONTNEED) (metadata direktori
+tetap di cache, jadi cold tanpa root lebih optimistis).
+
+Contoh:
+    python bench_startup.py                                  # build zipapp ke direktori sementara
+    sudo /opt/monitoring/env/bin/python3 bench_startup.py --python /opt/monitoring/env/bin/python3
+    python bench_startup.py --pyz /opt/monitoring/monitor.pyz --runs 30
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_log_append import percentile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DROP_CACHES = "/proc/sys/vm/drop_caches"
+
+
+def interpreter_files(python):
+    """Direktori sys.path dan binary interpreter target (bisa venv lain)."""
+    out = subprocess.run([python, "-c", "import json, sys; print(json.dumps([sys.executable, sys.path[1:]]))"],
+                         capture_output=True, text=True, check=True).stdout
+    executable, paths = json.loads(out)
+    return [os.path.realpath(executable)] + [p for p in paths if os.path.exists(p)]
+
+
+def evict(paths):
+    """posix_fadvise(DONTNEED) untuk semua file di bawah paths; jumlah file."""
+    count = 0
+    for top in paths:
+        walker = [(os.path.dirname(top), [], [os.path.basename(top)])] if os.path.isfile(top) else os.walk(top)
+        for dirpath, _, filenames in walker:
+            for name in filenames:
+                try:
+                    fd = os.open(os.path.join(dirpath, name), os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    count += 1
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+    return count
+
+
+def drop_caches(paths):
+    if os.geteuid() == 0:
+        try:
+            os.sync()
+            with open(DROP_CACHES, "w") as f:
+                f.write("3\n")
+            return
+        except OSError:
+            pass  # Container tanpa akses tulis /proc/sys
+    evict(paths)
+
+
+def run_once(cmd, cwd, env):
+    """(wall detik, CPU detik, major fault) satu proses anak, dari wait4."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = proc.stderr.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - t0
+    proc.stderr.close()
+    code = os.waitstatus_to_exitcode(status)
+    proc.returncode = code  # Sudah di-reap oleh wait4; jangan ditunggu lagi oleh Popen
+    if code != 0:
+        raise SystemExit(f"{' '.join(cmd)} gagal ({code}):\n{stderr.decode(errors='replace')}")
+    return wall, usage.ru_utime + usage.ru_stime, usage.ru_majflt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--python', default=sys.executable, help='Interpreter venv yang dipakai cron')
+    parser.add_argument('--pyz', help='monitor.pyz yang sudah ada (default: dibangun dengan --python)')
+    parser.add_argument('--runs', type=int, default=20, help='Run per layout per kondisi cache')
+    parser.add_argument('--no-cold', action='store_true', help='Lewati cold cache (tanpa drop cache)')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        pyz = args.pyz
+        if not pyz:
+            # Dibangun oleh interpreter target: .pyc harus cocok dengan versinya
+            pyz = os.path.join(workdir, "monitor.pyz")
+            subprocess.run([args.python, os.path.join(HERE, "build_zipapp.py"), "--output", pyz,
+                            "--interpreter", args.python], check=True, stdout=subprocess.DEVNULL)
+        pyz = os.path.abspath(pyz)
+        libs = os.path.splitext(pyz)[0] + "_libs"
+
+        layouts = {
+            "venv": [args.python, os.path.join(HERE, "monitor_server.py"), "--help"],
+            "zipapp": [args.python, "-I", "-S", pyz, "--help"],
+        }
+        # Tanpa webhook monitor_server.py berhenti sebelum argparse; cwd kosong supaya .env lokal tidak ikut
+        env = dict(os.environ, DISCORD_WEBHOOK_URL=os.environ.get("DISCORD_WEBHOOK_URL", "http://127.0.0.1:9/"))
+        cwd = os.path.join(workdir, "cwd")
+        os.makedirs(cwd)
+        cache_files = interpreter_files(args.python) + [HERE, pyz, libs]
+
+        conditions = ["warm"] if args.no_cold else ["cold", "warm"]
+        if not args.no_cold and os.geteuid() != 0:
+            print("⚠️  Bukan root: cold cache memakai posix_fadvise(DONTNEED), metadata direktori tetap di cache")
+        results = {(c, name): [] for c in conditions for name in layouts}
+        for condition in conditions:
+            for cmd in layouts.values():
+                run_once(cmd, cwd, env)  # Pemanasan (dan cek bahwa keduanya jalan)
+            for _ in range(args.runs):
+                # Diselang-seling supaya drift (suhu, proses lain) kena kedua layout
+                for name, cmd in layouts.items():
+                    if condition == "cold":
+                        drop_caches(cache_files)
+                    results[condition, name].append(run_once(cmd, cwd, env))
+
+        print(f"{'Cache':<6} {'Layout':<8} {'Wall p50 (ms)':>14} {'p95 (ms)':>9} {'CPU (ms)':>9} {'Major fault':>12}")
+        for condition in conditions:
+            for name in layouts:
+                runs = results[condition, name]
+                walls = [r[0] for r in runs]
+                cpu = percentile([r[1] for r in runs], 50)
+                faults = percentile([r[2] for r in runs], 50)
+                print(f"{condition:<6} {name:<8} {percentile(walls, 50) * 1000:>14.1f} "
+                      f"{percentile(walls, 95) * 1000:>9.1f} {cpu * 1000:>9.1f} {faults:>12.0f}")
+        for condition in conditions:
+            venv = percentile([r[0] for r in results[condition, "venv"]], 50)
+            zipapp = percentile([r[0] for r in results[condition, "zipapp"]], 50)
+            print(f"{condition}: zipapp {venv / zipapp:.2f}x lebih cepat dari venv (p50 wall)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Bangun monitor.pyz: monitor_server.py + dependensi pure-Python dalam satu zipapp.
+
+Setiap run cron mengimpor dari venv penuh di kartu SD: semua entri sys.path
+di-stat untuk setiap import, site memproses file .pth, dan setiap .pyc
+divalidasi terhadap mtime sumbernya. Zipapp ini:
+- berisi modul monitor (dicari dengan modulefinder dari monitor_server.py)
+  dan distribusi di requirements.txt, sudah dikompilasi ke .pyc
+  unchecked-hash: saat import tidak ada stat/baca sumber. Di dalam zip .pyc
+  biasa (timestamp) malah sering dianggap basi karena waktu zip beresolusi
+  2 detik, lalu dikompilasi ulang di memori setiap start;
+- dijalankan dengan "python -I -S" (shebang): tanpa site, .pth, user site
+  dan cwd, sys.path hanya zip + direktori libs + stdlib;
+- paket yang butuh file asli (ekstensi C seperti psutil, cacert.pem milik
+  certifi) disalin ke <nama>_libs/ di sebelah zip, .pyc-nya juga unchecked-hash.
+
+.pyc terikat versi Python: bangun dengan interpreter yang dipakai cron.
+Sumber .py ikut disimpan (traceback tetap lengkap, dan jadi cadangan kalau
+versinya berbeda); --strip-source membuangnya.
+
+Contoh:
+    /opt/monitoring/env/bin/python3 build_zipapp.py --output /opt/monitoring/monitor.pyz
+    /opt/monitoring/monitor.pyz --log
+"""
+import argparse
+import compileall
+import importlib.machinery
+import importlib.metadata
+import modulefinder
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENTRY = "monitor_server"
+
+# Dibaca lewat path file sungguhan: requests memberikan certifi.where() ke ssl,
+# dari dalam zip cacert.pem harus diekstrak ke /tmp di setiap start
+FILESYSTEM_PACKAGES = {"certifi"}
+# Tidak dipakai saat runtime
+SKIP_SUFFIXES = (".pyc", ".pyi", "py.typed")
+
+MAIN_TEMPLATE = '''# Dibuat oleh build_zipapp.py
+import os
+import sys
+
+BUILD_PYTHON = {version!r}
+LIBS = {libs!r}
+
+archive = os.path.abspath(sys.path[0])
+# Dependensi hanya dari zip dan libs, walaupun dijalankan tanpa -I -S
+sys.path[:] = [archive, os.path.join(os.path.dirname(archive), LIBS)] + [
+    p for p in sys.path[1:] if os.path.basename(p) not in ("site-packages", "dist-packages")]
+if sys.version_info[:2] != BUILD_PYTHON:
+    sys.stderr.write("monitor.pyz: dibangun untuk Python %d.%d, .pyc diabaikan (import lebih lambat)\\n"
+                     % BUILD_PYTHON)
+
+import runpy
+runpy.run_module({entry!r}, run_name="__main__", alter_sys=True)
+'''
+
+
+def local_modules(src_dir=HERE, entry=ENTRY):
+    """Modul di src_dir yang diimpor (langsung/tidak langsung) oleh entry; bench_* tidak ikut."""
+    finder = modulefinder.ModuleFinder(path=[src_dir])
+    finder.run_script(os.path.join(src_dir, entry + ".py"))
+    found = {entry: os.path.join(src_dir, entry + ".py")}
+    for name, module in finder.modules.items():
+        path = module.__file__
+        if name != "__main__" and path and os.path.dirname(os.path.abspath(path)) == src_dir:
+            found[name] = path
+    return found
+
+
+def read_requirements(path):
+    names = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if line:
+                names.append(line.split("==")[0].split(">=")[0].split("[")[0].strip())
+    return names
+
+
+def distribution_units(names):
+    """top-level (paket/modul) -> [(path relatif, path asli)] dari distribusi terpasang."""
+    units = {}
+    for name in names:
+        dist = importlib.metadata.distribution(name)
+        for file in dist.files or []:
+            rel = str(file)
+            top = rel.split("/")[0]
+            if (rel.startswith("..") or top.endswith((".dist-info", ".egg-info")) or "__pycache__" in rel
+                    or rel.endswith(SKIP_SUFFIXES)):
+                continue
+            units.setdefault(top, []).append((rel, str(file.locate())))
+    return units
+
+
+def needs_filesystem(top, files):
+    if top.removesuffix(".py") in FILESYSTEM_PACKAGES:
+        return True
+    # Ekstensi C tidak bisa dimuat zipimport
+    return any(rel.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)) for rel, _ in files)
+
+
+def compile_pyc(path, display_name):
+    with tempfile.NamedTemporaryFile(suffix=".pyc") as tmp:
+        py_compile.compile(path, cfile=tmp.name, dfile=display_name, doraise=True,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        with open(tmp.name, "rb") as f:
+            return f.read()
+
+
+def build(output, src_dir=HERE, requirements=None, interpreter=None, compress=False, strip_source=False):
+    """Tulis zipapp ke output dan <stem>_libs/ di sebelahnya; kembalikan ringkasan."""
+    output = os.path.abspath(output)
+    requirements = requirements or os.path.join(src_dir, "requirements.txt")
+    interpreter = interpreter or sys.executable
+    libs_name = os.path.splitext(os.path.basename(output))[0] + "_libs"
+    libs_dir = os.path.join(os.path.dirname(output), libs_name)
+
+    entries = [(name + ".py", path) for name, path in sorted(local_modules(src_dir).items())]
+    libs = []
+    for top, files in sorted(distribution_units(read_requirements(requirements)).items()):
+        if needs_filesystem(top, files):
+            libs.append((top, files))
+        else:
+            entries.extend(files)
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    tmp = output + ".tmp"
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with open(tmp, "wb") as f:
+        # -IS digabung jadi satu argumen; Linux hanya meneruskan satu argumen shebang
+        f.write(f"#!{interpreter} -IS\n".encode())
+        with zipfile.ZipFile(f, "w", compression=compression) as archive:
+            main = MAIN_TEMPLATE.format(version=tuple(sys.version_info[:2]), libs=libs_name, entry=ENTRY)
+            archive.writestr("__main__.py", main)
+            for arcname, path in entries:
+                if not arcname.endswith(".py"):
+                    archive.write(path, arcname)  # Data paket (mis. template), bukan modul
+                    continue
+                # zipimport mencari modul.pyc di sebelah modul.py, bukan di __pycache__/
+                archive.writestr(arcname + "c", compile_pyc(path, os.path.join(output, arcname)))
+                if not strip_source:
+                    archive.write(path, arcname)
+    os.chmod(tmp, 0o755)
+
+    # Direktori libs baru disiapkan dulu, baru zip dan libs ditukar
+    new_libs = libs_dir + ".new"
+    shutil.rmtree(new_libs, ignore_errors=True)
+    os.makedirs(new_libs)
+    for top, files in libs:
+        for rel, path in files:
+            dest = os.path.join(new_libs, rel)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copy2(path, dest)
+    compileall.compile_dir(new_libs, quiet=1,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    os.replace(tmp, output)
+    old_libs = libs_dir + ".old"
+    if os.path.exists(libs_dir):
+        os.rename(libs_dir, old_libs)
+    os.rename(new_libs, libs_dir)
+    shutil.rmtree(old_libs, ignore_errors=True)
+
+    return {
+        "output": output,
+        "libs_dir": libs_dir,
+        "modules": sum(1 for arcname, _ in entries if arcname.endswith(".py")),
+        "libs": [top for top, _ in libs],
+        "size": os.path.getsize(output),
+    }
+
+
+def check(output, interpreter=None):
+    """Jalankan "--help": semua import modul monitor harus berhasil dari zip."""
+    # Tanpa webhook monitor_server.py berhenti sebelum argparse
+    env = dict(os.environ, DISCORD_WEBHOOK_URL=os.environ.get("DISCORD_WEBHOOK_URL", "http://127.0.0.1:9/"))
+    result = subprocess.run([interpreter or sys.executable, "-I", "-S", output, "--help"],
+                            capture_output=True, text=True, cwd=tempfile.gettempdir(), env=env)
+    if result.returncode != 0:
+        raise SystemExit(f"Zipapp gagal dijalankan:\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=os.path.join(HERE, "dist", "monitor.pyz"))
+    parser.add_argument('--requirements', default=os.path.join(HERE, "requirements.txt"))
+    parser.add_argument('--interpreter', default=sys.executable,
+                        help='Interpreter di shebang (default: interpreter yang menjalankan build)')
+    parser.add_argument('--compress', action='store_true',
+                        help='Deflate: file lebih kecil dibaca dari SD, tapi CPU untuk dekompresi')
+    parser.add_argument('--strip-source', action='store_true', help='Hanya .pyc (harus versi Python yang sama)')
+    parser.add_argument('--no-check', action='store_true', help='Lewati uji jalan "--help"')
+    args = parser.parse_args()
+
+    info = build(args.output, requirements=args.requirements, interpreter=args.interpreter,
+                 compress=args.compress, strip_source=args.strip_source)
+    if not args.no_check:
+        check(info["output"], args.interpreter)
+    print(f"Zipapp : {info['output']} ({info['size'] / 1024:.0f} KiB, {info['modules']} modul)")
+    print(f"Libs   : {info['libs_dir']} ({', '.join(info['libs']) or '-'})")
+    print(f"Jalankan: {info['output']} --log   (shebang: {args.interpreter} -IS)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+import json
+import os
+import re
+import resource
+import time
+
+from io_stats import parse_filter, selected
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+DOCKER_CONTAINERS = "/var/lib/docker/containers"
+
+# Satu baris per container per sampel, ditulis ke segment terpisah (lihat metric_log.append_record)
+CONTAINER_COLUMNS = [
+    "timestamp", "container", "cpu_percent", "throttled_percent", "throttled_ms_per_sec",
+    "memory_mb", "memory_max_mb", "anon_mb", "file_mb",
+    "io_read_bytes_per_sec", "io_write_bytes_per_sec", "io_ops_per_sec",
+]
+
+STAT_FILES = ("cpu.stat", "memory.current", "memory.stat", "io.stat")
+
+# docker (driver systemd: docker-<id>.scope, driver cgroupfs: docker/<id>),
+# containerd/CRI-O (Kubernetes) dan podman
+CONTAINER_DIR = re.compile(r"^(?:(?:docker|cri-containerd|crio|libpod)-)?([0-9a-f]{64})(?:\.scope)?$")
+
+READ_SIZE = 16384
+
+CPU_KEYS = (b"usage_usec", b"nr_periods", b"nr_throttled", b"throttled_usec")
+MEMORY_KEYS = (b"anon", b"file")
+IO_KEYS = {b"rbytes": 0, b"wbytes": 1, b"rios": 2, b"wios": 3}
+
+
+def unified_root(root=CGROUP_ROOT):
+    """Mount cgroup v2: root langsung, atau root/unified di mode hybrid. None kalau tidak ada."""
+    for path in (root, os.path.join(root, "unified")):
+        if os.path.exists(os.path.join(path, "cgroup.controllers")):
+            return path
+    return None
+
+
+def keyed_pattern(keys):
+    # Dicari dengan regex (loop di C), memory.stat punya ~40 baris tapi hanya 2 yang dipakai
+    return re.compile(rb"^(" + b"|".join(keys) + rb") (\d+)$", re.MULTILINE)
+
+
+CPU_PATTERN = keyed_pattern(CPU_KEYS)
+MEMORY_PATTERN = keyed_pattern(MEMORY_KEYS)
+
+
+def parse_keyed(data, pattern):
+    """"usage_usec 123\\n..." -> {key: int} untuk key di pattern saja"""
+    return {key: int(value) for key, value in pattern.findall(data)}
+
+
+def parse_io_stat(data):
+    """Jumlah semua device: (rbytes, wbytes, rios, wios)"""
+    totals = [0, 0, 0, 0]
+    for line in data.splitlines():
+        for field in line.split()[1:]:
+            key, _, value = field.partition(b"=")
+            idx = IO_KEYS.get(key)
+            if idx is not None:
+                totals[idx] += int(value)
+    return tuple(totals)
+
+
+def docker_name(container_id, docker_dir=DOCKER_CONTAINERS):
+    """Nama container dari config Docker, 12 karakter id kalau tidak terbaca."""
+    try:
+        with open(os.path.join(docker_dir, container_id, "config.v2.json"), "r") as f:
+            name = json.load(f).get("Name", "")
+    except (OSError, ValueError):
+        name = ""
+    return name.lstrip("/") or container_id[:12]
+
+
+def _read_limit(path):
+    try:
+        with open(os.path.join(path, "memory.max"), "rb") as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+    return None if value == b"max" else int(value)
+
+
+class Container:
+    """File stat satu cgroup container, dibuka sekali lalu dibaca ulang dengan pread().
+
+    pread() di offset 0 membuat kernel membangun ulang isi file cgroup,
+    jadi setiap tick cukup satu syscall per file (tanpa open/close).
+    """
+
+    def __init__(self, container_id, path, name, keep_open=True):
+        self.id = container_id
+        self.path = path
+        self.name = name
+        # Dibaca sekali saat ditemukan; "docker update" baru terlihat setelah rescan
+        self.memory_max = _read_limit(path)
+        self.fds = {}
+        for stat in STAT_FILES:
+            stat_path = os.path.join(path, stat)
+            if not os.path.exists(stat_path):
+                # Controller tidak aktif untuk cgroup ini (mis. io di Raspberry Pi tanpa blkio)
+                continue
+            # Di luar jatah fd, file dibuka ulang setiap tick (path disimpan, bukan fd)
+            self.fds[stat] = os.open(stat_path, os.O_RDONLY) if keep_open else stat_path
+
+    def _pread(self, fd):
+        if isinstance(fd, str):
+            with open(fd, "rb") as f:
+                return f.read()
+        data = os.pread(fd, READ_SIZE, 0)
+        while len(data) % READ_SIZE == 0 and data:
+            more = os.pread(fd, READ_SIZE, len(data))
+            if not more:
+                break
+            data += more
+        return data
+
+    def read(self):
+        """Counter mentah; OSError (ENODEV) kalau cgroup sudah dihapus."""
+        raw = {stat: self._pread(fd) for stat, fd in self.fds.items()}
+        cpu = parse_keyed(raw.get("cpu.stat", b""), CPU_PATTERN)
+        memory = parse_keyed(raw.get("memory.stat", b""), MEMORY_PATTERN)
+        return {
+            "cpu": [cpu.get(k, 0) for k in CPU_KEYS],
+            "io": list(parse_io_stat(raw["io.stat"])) if "io.stat" in raw else None,
+            "memory": int(raw["memory.current"]) if "memory.current" in raw else None,
+            "anon": memory.get(b"anon"),
+            "file": memory.get(b"file"),
+        }
+
+    def close(self):
+        for fd in self.fds.values():
+            if not isinstance(fd, str):
+                os.close(fd)
+        self.fds = {}
+
+
+class ContainerStats:
+    """Pemakaian CPU, throttling, memori dan I/O per container dari cgroup v2.
+
+    /sys/fs/cgroup di-walk sekali untuk menemukan direktori yang berisi
+    container (mis. system.slice); tick berikutnya cukup listdir direktori
+    itu untuk container baru/hilang, ditambah walk penuh tiap rescan_sec.
+    Biaya per tick: satu pread per file stat per container, tanpa walk.
+
+    Counter sebelumnya disimpan di state file seperti IOCounters, jadi
+    mode --log (sekali jalan per jam) tetap dapat rate rata-rata.
+    """
+
+    def __init__(self, containers=None, root=CGROUP_ROOT, docker_dir=DOCKER_CONTAINERS, rescan_sec=None):
+        self.root = unified_root(root)
+        self.docker_dir = docker_dir
+        # Filter nama container, format sama dengan IO_DISKS: "jenkins,web*,-buildx*"
+        containers = os.getenv("CONTAINERS", "") if containers is None else containers
+        self.filter = parse_filter(containers)
+        if rescan_sec is None:
+            rescan_sec = float(os.getenv("CONTAINER_RESCAN_SEC", "300"))
+        self.rescan_sec = rescan_sec
+        self.parents = set()
+        self.containers = {}  # id -> Container
+        self.names = {}  # id -> nama (config Docker hanya dibaca sekali per container)
+        self.last_walk = None
+        self.prev = None
+        self.ncpu = os.cpu_count() or 1
+        # Maksimal separuh batas fd proses untuk file yang tetap terbuka
+        self.fd_budget = resource.getrlimit(resource.RLIMIT_NOFILE)[0] // 2
+
+    def walk(self):
+        """Walk penuh: cari semua direktori cgroup container."""
+        found = {}
+        self.parents = set()
+        for dirpath, dirnames, _ in os.walk(self.root):
+            keep = []
+            for name in dirnames:
+                match = CONTAINER_DIR.match(name)
+                if match:
+                    found[match.group(1)] = os.path.join(dirpath, name)
+                    self.parents.add(dirpath)
+                else:
+                    keep.append(name)
+            # Jangan turun ke dalam container (cgroup milik systemd di dalam container)
+            dirnames[:] = keep
+        return found
+
+    def list_parents(self):
+        """Container di direktori yang sudah dikenal; None kalau ada yang hilang (perlu walk)."""
+        found = {}
+        for parent in self.parents:
+            try:
+                names = os.listdir(parent)
+            except FileNotFoundError:
+                return None
+            for name in names:
+                match = CONTAINER_DIR.match(name)
+                if match:
+                    found[match.group(1)] = os.path.join(parent, name)
+        return found
+
+    def open_fds(self):
+        return sum(1 for c in self.containers.values() for fd in c.fds.values() if not isinstance(fd, str))
+
+    def refresh(self, now):
+        found = None
+        if self.last_walk is not None and now - self.last_walk < self.rescan_sec:
+            found = self.list_parents()
+        if found is None:
+            found = self.walk()
+            self.last_walk = now
+
+        for cid in list(self.containers):
+            if cid not in found or found[cid] != self.containers[cid].path:
+                self.containers.pop(cid).close()
+        # Build CI membuat banyak container berumur pendek, jangan simpan nama yang sudah hilang
+        self.names = {cid: name for cid, name in self.names.items() if cid in found}
+        include, exclude = self.filter
+        open_fds = self.open_fds()
+        for cid, path in found.items():
+            if cid in self.containers:
+                continue
+            if cid not in self.names:
+                self.names[cid] = docker_name(cid, self.docker_dir)
+            if selected(self.names[cid], include, exclude):
+                keep_open = open_fds + len(STAT_FILES) <= self.fd_budget
+                self.containers[cid] = Container(cid, path, self.names[cid], keep_open)
+                open_fds += len(self.containers[cid].fds) if keep_open else 0
+
+    def read(self, now=None):
+        now = time.time() if now is None else now
+        counters = {}
+        if self.root is None:
+            return {"time": now, "containers": counters}
+        self.refresh(now)
+        for cid, container in list(self.containers.items()):
+            try:
+                counters[cid] = container.read()
+            except OSError:
+                # Container berhenti di antara listdir dan pread
+                self.containers.pop(cid).close()
+        return {"time": now, "containers": counters}
+
+    def sample(self, now=None):
+        """Baris CONTAINER_COLUMNS per container yang punya sampel sebelumnya."""
+        cur = self.read(now)
+        prev, self.prev = self.prev, cur
+        if not prev or cur["time"] <= prev["time"]:
+            return []
+
+        dt = cur["time"] - prev["time"]
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cur["time"]))
+        mb = 1024**2
+        rows = []
+        for cid, c in sorted(cur["containers"].items(), key=lambda item: self.names.get(item[0], item[0])):
+            p = prev["containers"].get(cid)
+            if p is None:
+                continue
+            # Counter cgroup 64-bit tidak wrap; turun berarti cgroup dibuat ulang (restart)
+            if c["cpu"][0] < p["cpu"][0]:
+                continue
+            usage, periods, throttled, throttled_usec = (b - a for a, b in zip(p["cpu"], c["cpu"]))
+            row = [stamp, self.names.get(cid, cid[:12]),
+                   # Persen dari seluruh host (sama dengan kolom CPU_% di log utama)
+                   round(usage / (dt * 1e6 * self.ncpu) * 100, 2),
+                   round(throttled / periods * 100, 1) if periods else "",
+                   round(throttled_usec / 1000 / dt, 1)]
+            container = self.containers.get(cid)
+            limit = container.memory_max if container else None
+            row += [round(c["memory"] / mb, 1) if c["memory"] is not None else "",
+                    round(limit / mb, 1) if limit is not None else "",
+                    round(c["anon"] / mb, 1) if c["anon"] is not None else "",
+                    round(c["file"] / mb, 1) if c["file"] is not None else ""]
+            if c["io"] is not None and p["io"] is not None:
+                rbytes, wbytes, rios, wios = (max(0, b - a) for a, b in zip(p["io"], c["io"]))
+                row += [round(rbytes / dt, 1), round(wbytes / dt, 1), round((rios + wios) / dt, 2)]
+            else:
+                row += ["", "", ""]
+            rows.append(row)
+        return rows
+
+    def close(self):
+        for container in self.containers.values():
+            container.close()
+        self.containers = {}
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        stats = cls(**kwargs)
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+            stats.prev = {"time": state["time"], "containers": state["containers"]}
+            stats.names.update(state.get("names", {}))
+        except (OSError, ValueError, KeyError):
+            pass
+        return stats
+
+    def save(self, path):
+        if self.prev is None:
+            return
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            names = {cid: self.names[cid] for cid in self.prev["containers"] if cid in self.names}
+            json.dump(dict(self.prev, names=names), f)
+        os.replace(tmp, path)
@@ -0,0 +1,226 @@
+import fnmatch
+import json
+import os
+import time
+
+PROC = "/proc"
+SYS_BLOCK = "/sys/class/block"
+
+# Detail per device, ditulis ke segment terpisah (lihat metric_log.append_record)
+# disk: in = read, out = write; net: in = rx, out = tx
+IO_COLUMNS = [
+    "timestamp", "kind", "device", "in_bytes_per_sec", "out_bytes_per_sec",
+    "in_ops_per_sec", "out_ops_per_sec", "busy_percent",
+]
+
+SECTOR_BYTES = 512  # /proc/diskstats selalu dalam sektor 512 byte
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def boot_time(proc=PROC):
+    for line in _read(os.path.join(proc, "stat")).splitlines():
+        if line.startswith(b"btime "):
+            return int(line.split()[1])
+    return 0
+
+
+def parse_diskstats(data):
+    """device -> (reads, sectors_read, writes, sectors_written, io_ms)"""
+    out = {}
+    for line in data.splitlines():
+        f = line.split()
+        if len(f) < 14:
+            continue
+        out[f[2].decode()] = (int(f[3]), int(f[5]), int(f[7]), int(f[9]), int(f[12]))
+    return out
+
+
+def parse_net_dev(data):
+    """interface -> (rx_bytes, rx_packets, tx_bytes, tx_packets)"""
+    out = {}
+    for line in data.splitlines()[2:]:
+        name, sep, rest = line.partition(b":")
+        f = rest.split()
+        if not sep or len(f) < 10:
+            continue
+        out[name.strip().decode()] = (int(f[0]), int(f[1]), int(f[8]), int(f[9]))
+    return out
+
+
+def mounted_devices(proc=PROC):
+    """Nama device di diskstats untuk semua filesystem yang di-mount dari /dev.
+
+    Dicocokkan lewat major:minor (st_dev mount point), jadi /dev/root,
+    /dev/mapper/* dan /dev/disk/by-uuid/* ikut ketemu.
+    """
+    numbers = set()
+    for line in _read(os.path.join(proc, "self", "mounts")).splitlines():
+        f = line.split()
+        if len(f) < 2 or not f[0].startswith(b"/dev/"):
+            continue
+        mount_point = f[1].decode().replace("\\040", " ")
+        try:
+            st_dev = os.stat(mount_point).st_dev
+        except OSError:
+            continue
+        numbers.add((os.major(st_dev), os.minor(st_dev)))
+
+    names = set()
+    for line in _read(os.path.join(proc, "diskstats")).splitlines():
+        f = line.split()
+        if len(f) >= 3 and (int(f[0]), int(f[1])) in numbers:
+            names.add(f[2].decode())
+    return names
+
+
+def partition_parent(name, sys_block=SYS_BLOCK):
+    """Disk induk sebuah partisi (sda1 -> sda, mmcblk0p2 -> mmcblk0); None kalau bukan partisi."""
+    # Di sysfs "/" pada nama device (cciss/c0d0) ditulis "!"
+    path = os.path.join(sys_block, name.replace("/", "!"))
+    if not os.path.exists(os.path.join(path, "partition")):
+        return None
+    # /sys/class/block/sda1 -> .../block/sda/sda1
+    return os.path.basename(os.path.dirname(os.path.realpath(path))).replace("!", "/")
+
+
+def parse_filter(spec):
+    """"sd*,mmcblk0p2,-loop*" -> (include, exclude); include kosong = semua"""
+    include, exclude = [], []
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if item.startswith("-"):
+            exclude.append(item[1:])
+        elif item:
+            include.append(item)
+    return include, exclude
+
+
+def selected(name, include, exclude):
+    if any(fnmatch.fnmatchcase(name, p) for p in exclude):
+        return False
+    return not include or any(fnmatch.fnmatchcase(name, p) for p in include)
+
+
+def counter_delta(prev, cur):
+    """Selisih counter yang bisa wrap (unsigned long 32-bit di kernel 32-bit)."""
+    if cur >= prev:
+        return cur - prev
+    width = 2**32 if prev < 2**32 else 2**64
+    return cur + width - prev
+
+
+class IOCounters:
+    """Rate disk & network per interval dari counter kumulatif /proc.
+
+    Counter sebelumnya disimpan di state file, jadi mode --log (sekali
+    jalan per jam dari cron) tetap dapat rate rata-rata sejak run
+    sebelumnya. Sampel pertama, device baru, atau reboot (btime berubah)
+    tidak punya rate.
+    """
+
+    def __init__(self, disks=None, interfaces=None, proc=PROC, sys_block=SYS_BLOCK):
+        self.proc = proc
+        self.sys_block = sys_block
+        # Default: device yang di-mount, dan semua interface kecuali loopback
+        disks = os.getenv("IO_DISKS", "") if disks is None else disks
+        interfaces = os.getenv("IO_INTERFACES", "-lo") if interfaces is None else interfaces
+        self.disk_filter = parse_filter(disks)
+        self.net_filter = parse_filter(interfaces)
+        self.prev = None
+
+    def _disk_names(self, stats):
+        include, exclude = self.disk_filter
+        if not include:
+            mounted = mounted_devices(self.proc)
+            return [n for n in stats if n in mounted and selected(n, [], exclude)]
+        return [n for n in stats if selected(n, include, exclude)]
+
+    def read(self, now=None):
+        disk = parse_diskstats(_read(os.path.join(self.proc, "diskstats")))
+        net = parse_net_dev(_read(os.path.join(self.proc, "net", "dev")))
+        include, exclude = self.net_filter
+        return {
+            "time": time.time() if now is None else now,
+            "btime": boot_time(self.proc),
+            "disk": {n: disk[n] for n in self._disk_names(disk)},
+            "net": {n: v for n, v in net.items() if selected(n, include, exclude)},
+        }
+
+    def sample(self, now=None):
+        """(total untuk log utama atau None, baris detail per device)
+
+        Total sesuai kolom DiskR_MBps..NetTX_Mbps di metric_log.HEADER.
+        """
+        cur = self.read(now)
+        prev, self.prev = self.prev, cur
+        if not prev or prev["btime"] != cur["btime"] or cur["time"] <= prev["time"]:
+            return None, []
+
+        dt = cur["time"] - prev["time"]
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cur["time"]))
+        rows = []
+        read_b = write_b = ops = 0.0
+        # Filter seperti "sd*" memilih sda dan sda1: I/O partisi sudah termasuk di disk induknya
+        nested = {n for n in cur["disk"] if partition_parent(n, self.sys_block) in cur["disk"]}
+        for name, c in cur["disk"].items():
+            p = prev["disk"].get(name)
+            if p is None:
+                continue
+            reads, sectors_r, writes, sectors_w, io_ms = (counter_delta(a, b) for a, b in zip(p, c))
+            rows.append([stamp, "disk", name,
+                         round(sectors_r * SECTOR_BYTES / dt, 1), round(sectors_w * SECTOR_BYTES / dt, 1),
+                         round(reads / dt, 2), round(writes / dt, 2),
+                         round(min(100.0, io_ms / (dt * 10)), 1)])
+            if name in nested:
+                continue  # Tetap ada di baris detail, tidak dihitung dua kali di total
+            read_b += sectors_r * SECTOR_BYTES
+            write_b += sectors_w * SECTOR_BYTES
+            ops += reads + writes
+
+        rx_b = tx_b = 0.0
+        for name, c in cur["net"].items():
+            p = prev["net"].get(name)
+            if p is None:
+                continue
+            rx, rx_pkt, tx, tx_pkt = (counter_delta(a, b) for a, b in zip(p, c))
+            rows.append([stamp, "net", name, round(rx / dt, 1), round(tx / dt, 1),
+                         round(rx_pkt / dt, 2), round(tx_pkt / dt, 2), ""])
+            rx_b += rx
+            tx_b += tx
+
+        totals = [
+            round(read_b / dt / 1024**2, 3),
+            round(write_b / dt / 1024**2, 3),
+            round(ops / dt, 2),
+            round(rx_b * 8 / dt / 1_000_000, 3),
+            round(tx_b * 8 / dt / 1_000_000, 3),
+        ]
+        return totals, rows
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        counters = cls(**kwargs)
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+            counters.prev = {
+                "time": state["time"],
+                "btime": state["btime"],
+                "disk": {n: tuple(v) for n, v in state["disk"].items()},
+                "net": {n: tuple(v) for n, v in state["net"].items()},
+            }
+        except (OSError, ValueError, KeyError):
+            pass
+        return counters
+
+    def save(self, path):
+        if self.prev is None:
+            return
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.prev, f)
+        os.replace(tmp, path)
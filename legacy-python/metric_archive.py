@@ -0,0 +1,269 @@
+import json
+import os
+import struct
+import zlib
+from array import array
+from datetime import datetime
+from itertools import accumulate, chain, compress
+
+from metric_log import HEADER, SEGMENT_DIR, SPAN_SEC, read_rows, reported_dir, segment_start
+
+ARCHIVE_DIR = "/opt/monitoring/archive"
+MAGIC = b"MCA1"
+
+# Kolom angka yang diarsipkan (Jam diganti timestamp lengkap)
+VALUE_COLUMNS = HEADER[1:]
+
+# Typecode array dari yang paling kecil, dipilih per kolom sesuai rentang nilai
+INT_TYPECODES = (("b", 2**7), ("h", 2**15), ("i", 2**31), ("q", 2**63))
+MAX_DECIMALS = 4
+
+
+def _pick_typecode(values):
+    lo = min(values, default=0)
+    hi = max(values, default=0)
+    for typecode, limit in INT_TYPECODES:
+        if -limit <= lo and hi < limit:
+            return typecode
+    raise OverflowError("Nilai terlalu besar untuk diarsipkan")
+
+
+def _pack_ints(values):
+    typecode = _pick_typecode(values)
+    return typecode, array(typecode, values).tobytes()
+
+
+def _unpack_ints(typecode, raw):
+    values = array(typecode)
+    values.frombytes(raw)
+    return values
+
+
+def _deltas(values):
+    prev = 0
+    out = []
+    for value in values:
+        out.append(value - prev)
+        prev = value
+    return out
+
+
+def _decimal_scale(values):
+    """Jumlah desimal terkecil yang membuat semua nilai jadi integer (lossless)."""
+    for decimals in range(MAX_DECIMALS + 1):
+        factor = 10 ** decimals
+        if all(abs(v * factor - round(v * factor)) < 1e-6 for v in values):
+            return decimals
+    return None
+
+
+def encode_columns(timestamps, columns):
+    """Encode satu hari data ke format arsip kolumnar.
+
+    - timestamp: delta-of-delta (interval tetap -> hampir semua nol)
+    - kolom angka: skala desimal -> integer, lalu delta. Logger selalu
+      membulatkan ke 1-2 desimal jadi ini lossless; kalau tidak bisa,
+      jatuh ke XOR bit float64 dengan nilai sebelumnya (gaya Gorilla).
+    - nilai kosong disimpan sebagai bitmap byte per baris.
+    Semua array fixed-width (typecode terkecil yang cukup) lalu header +
+    array dikompres sebagai satu stream zlib.
+    """
+    timestamps = [int(t) for t in timestamps]
+    parts = []
+    meta = {"rows": len(timestamps), "columns": []}
+
+    deltas = _deltas(timestamps)
+    meta["t0"] = deltas[0] if deltas else 0
+    typecode, raw = _pack_ints(_deltas(deltas[1:]))
+    meta["time"] = {"typecode": typecode, "size": len(raw)}
+    parts.append(raw)
+
+    for name, values in columns.items():
+        present = [v is not None for v in values]
+        filled = [v for v in values if v is not None]
+        col = {"name": name, "nulls": not all(present)}
+
+        if col["nulls"]:
+            parts.append(bytes(present))
+
+        decimals = _decimal_scale(filled)
+        if decimals is not None:
+            factor = 10 ** decimals
+            scaled = [int(round(v * factor)) for v in filled]
+            typecode, raw = _pack_ints(_deltas(scaled))
+            col.update(kind="dec", decimals=decimals, typecode=typecode)
+        else:
+            bits = array("Q", array("d", filled).tobytes())
+            prev = 0
+            xored = array("Q")
+            for b in bits:
+                xored.append(b ^ prev)
+                prev = b
+            raw = xored.tobytes()
+            col.update(kind="xor")
+
+        col["size"] = len(raw)
+        parts.append(raw)
+        meta["columns"].append(col)
+
+    header = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    payload = struct.pack("<I", len(header)) + header + b"".join(parts)
+    return MAGIC + zlib.compress(payload, 6)
+
+
+def decode_columns(data, names=None):
+    """Decode arsip -> (timestamps, {kolom: list nilai}).
+
+    names membatasi kolom yang di-decode. Semua langkah berat (zlib,
+    array.frombytes, accumulate) jalan di C, bukan per bit di Python.
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Bukan file arsip metric")
+    payload = memoryview(zlib.decompress(data[4:]))
+    (header_len,) = struct.unpack_from("<I", payload, 0)
+    meta = json.loads(bytes(payload[4:4 + header_len]))
+    pos = 4 + header_len
+    rows = meta["rows"]
+
+    time_meta = meta["time"]
+    dod = _unpack_ints(time_meta["typecode"], payload[pos:pos + time_meta["size"]])
+    pos += time_meta["size"]
+    # dod -> delta -> timestamp, dua kali accumulate
+    timestamps = list(accumulate(chain([meta["t0"]], accumulate(dod)))) if rows else []
+
+    columns = {}
+    for col in meta["columns"]:
+        mask = None
+        if col["nulls"]:
+            mask = payload[pos:pos + rows]
+            pos += rows
+
+        raw = payload[pos:pos + col["size"]]
+        pos += col["size"]
+        if names is not None and col["name"] not in names:
+            continue
+
+        if col["kind"] == "dec":
+            factor = 10 ** col["decimals"]
+            values = accumulate(_unpack_ints(col["typecode"], raw))
+            values = [v / factor for v in values] if factor != 1 else [float(v) for v in values]
+        else:
+            xored = array("Q")
+            xored.frombytes(raw)
+            bits = array("Q")
+            prev = 0
+            for x in xored:
+                prev ^= x
+                bits.append(prev)
+            values = list(array("d", bits.tobytes()))
+
+        if mask is not None:
+            it = iter(values)
+            values = [next(it) if present else None for present in mask]
+        columns[col["name"]] = values
+
+    return timestamps, columns
+
+
+def row_timestamp(jam, seg_start):
+    """Jam "HH:MM" -> epoch, relatif terhadap waktu mulai segment.
+
+    Baris bisa ditulis sedikit setelah jamnya lewat (speedtest ~40 detik),
+    jadi "23:59" di segment jam 00 milik hari sebelumnya.
+    """
+    hour, minute = jam.split(":")
+    midnight = datetime.fromtimestamp(seg_start).replace(hour=0, minute=0, second=0, microsecond=0)
+    ts = int(midnight.timestamp()) + int(hour) * 3600 + int(minute) * 60
+    if ts > seg_start + SPAN_SEC:
+        ts -= 86400
+    return ts
+
+
+def rows_to_columns(rows):
+    """Pasangan (timestamp, baris CSV) -> (timestamps, kolom)."""
+    timestamps = []
+    columns = {name: [] for name in VALUE_COLUMNS}
+    for ts, row in rows:
+        timestamps.append(ts)
+        for idx, name in enumerate(VALUE_COLUMNS, start=1):
+            value = row[idx] if idx < len(row) else ""
+            columns[name].append(float(value) if value != "" else None)
+    return timestamps, columns
+
+
+def archive_path(day, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"{day}.mca")
+
+
+def read_archive(path, names=None):
+    with open(path, "rb") as f:
+        return decode_columns(f.read(), names)
+
+
+def write_archive(path, timestamps, columns):
+    # Gabung dengan isi arsip hari yang sama yang sudah ada (report jam 06:10
+    # membawa data dua tanggal kalender)
+    if os.path.exists(path):
+        old_ts, old_cols = read_archive(path)
+        timestamps = old_ts + timestamps
+        columns = {name: old_cols.get(name, [None] * len(old_ts)) + values
+                   for name, values in columns.items()}
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        timestamps = [timestamps[i] for i in order]
+        columns = {name: [values[i] for i in order] for name, values in columns.items()}
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(encode_columns(timestamps, columns))
+    os.replace(tmp, path)
+
+
+def archive_reported(segment_dir=SEGMENT_DIR, archive_dir=ARCHIVE_DIR):
+    """Pindahkan segment di reported/ ke arsip harian terkompresi."""
+    source = reported_dir(segment_dir)
+    if not os.path.isdir(source):
+        return []
+    os.makedirs(archive_dir, exist_ok=True)
+
+    by_day = {}
+    paths = []
+    for name in sorted(os.listdir(source)):
+        seg_start = segment_start(name)
+        if seg_start is None:
+            continue
+        path = os.path.join(source, name)
+        paths.append(path)
+        for row in read_rows([path]):
+            ts = row_timestamp(row[0], seg_start)
+            day = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+            by_day.setdefault(day, []).append((ts, row))
+
+    written = []
+    for day, rows in sorted(by_day.items()):
+        timestamps, columns = rows_to_columns(sorted(rows, key=lambda pair: pair[0]))
+        write_archive(archive_path(day, archive_dir), timestamps, columns)
+        written.append(archive_path(day, archive_dir))
+
+    # CSV segment baru dihapus setelah semua arsip harian berhasil ditulis
+    for path in paths:
+        os.remove(path)
+    return written
+
+
+def scan_archives(start_day=None, end_day=None, names=None, archive_dir=ARCHIVE_DIR):
+    """Iterasi (hari, timestamps, kolom) untuk rentang tanggal (inklusif)."""
+    if not os.path.isdir(archive_dir):
+        return
+    for name in sorted(os.listdir(archive_dir)):
+        if not name.endswith(".mca"):
+            continue
+        day = name[:-len(".mca")]
+        if (start_day and day < start_day) or (end_day and day > end_day):
+            continue
+        timestamps, columns = read_archive(os.path.join(archive_dir, name), names)
+        yield day, timestamps, columns
+
+
+def present_values(values):
+    """Buang nilai kosong (kolom network saat speedtest di-skip)."""
+    return list(compress(values, (v is not None for v in values)))
@@ -0,0 +1,136 @@
+import csv
+import io
+import os
+import time
+from datetime import datetime
+
+LOG_DIR = "/opt/monitoring"
+SEGMENT_DIR = os.path.join(LOG_DIR, "segments")
+LEGACY_LOG_FILE = os.path.join(LOG_DIR, "daily_log.csv")
+
+HEADER = ["Jam", "CPU_%", "Suhu_C", "RAM_GB", "Ping_ms", "DL_Mbps", "UL_Mbps", "Disk_%",
+          # Rate I/O sejak sampel sebelumnya (io_stats.py), kosong di sampel pertama
+          "DiskR_MBps", "DiskW_MBps", "Disk_IOPS", "NetRX_Mbps", "NetTX_Mbps",
+          # Error bar (± setengah interval kepercayaan) DL/UL dari bandwidth_probe.py
+          "DL_err_Mbps", "UL_err_Mbps",
+          # Frekuensi CPU rata-rata selama interval & 1 kalau ada throttling (thermal_stats.py)
+          "CPU_MHz", "Throttled"]
+
+# Satu segment per jam. Segment baru dianggap "tertutup" setelah jamnya
+# lewat + SETTLE_SEC, jadi writer yang masih memegang fd sudah selesai.
+SPAN_SEC = 3600
+SETTLE_SEC = 60
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_FORMAT = "%Y%m%d-%H%M%S"
+
+
+def closed_dir(segment_dir=SEGMENT_DIR):
+    return os.path.join(segment_dir, "closed")
+
+
+def reported_dir(segment_dir=SEGMENT_DIR):
+    return os.path.join(segment_dir, "reported")
+
+
+def segment_name(when, span_sec=SPAN_SEC):
+    start = int(when // span_sec * span_sec)
+    return SEGMENT_PREFIX + datetime.fromtimestamp(start).strftime(SEGMENT_FORMAT) + ".csv"
+
+
+def segment_start(name):
+    """Waktu mulai segment dari nama file, None kalau bukan file segment."""
+    if not name.startswith(SEGMENT_PREFIX) or not name.endswith(".csv"):
+        return None
+    try:
+        stamp = name[len(SEGMENT_PREFIX):-len(".csv")]
+        return datetime.strptime(stamp, SEGMENT_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+def format_record(row):
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(row)
+    return buf.getvalue().encode("utf-8")
+
+
+def append_record(row, when=None, segment_dir=SEGMENT_DIR, span_sec=SPAN_SEC):
+    """Tambahkan satu baris ke segment aktif dengan satu write() O_APPEND.
+
+    Satu record = satu syscall write, jadi writer yang jalan bersamaan
+    tidak pernah menghasilkan baris yang terpotong/bercampur, tanpa lock.
+    """
+    data = format_record(row)
+    if when is None:
+        when = time.time()
+    os.makedirs(segment_dir, exist_ok=True)
+    path = os.path.join(segment_dir, segment_name(when, span_sec))
+
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        written = os.write(fd, data)
+    finally:
+        os.close(fd)
+    if written != len(data):
+        raise OSError(f"Penulisan record tidak lengkap ({written}/{len(data)} byte) ke {path}")
+    return path
+
+
+def claim_closed_segments(now=None, segment_dir=SEGMENT_DIR, span_sec=SPAN_SEC, settle_sec=SETTLE_SEC):
+    """Pindahkan segment yang sudah tertutup ke closed/ (rename atomik).
+
+    Mengembalikan semua file di closed/ (termasuk sisa klaim sebelumnya
+    yang belum sempat dilaporkan), urut dari yang paling lama.
+    """
+    if now is None:
+        now = time.time()
+    target = closed_dir(segment_dir)
+    os.makedirs(target, exist_ok=True)
+
+    # File log lama (sebelum ada segment) ikut diklaim sekali
+    if segment_dir == SEGMENT_DIR and os.path.exists(LEGACY_LOG_FILE):
+        stamp = datetime.fromtimestamp(os.path.getmtime(LEGACY_LOG_FILE)).strftime(SEGMENT_FORMAT)
+        os.rename(LEGACY_LOG_FILE, os.path.join(target, f"{SEGMENT_PREFIX}{stamp}.csv"))
+
+    for name in os.listdir(segment_dir):
+        start = segment_start(name)
+        if start is None or start + span_sec + settle_sec > now:
+            continue
+        try:
+            os.rename(os.path.join(segment_dir, name), os.path.join(target, name))
+        except FileNotFoundError:
+            # Sudah diklaim proses report lain
+            continue
+
+    return sorted(os.path.join(target, name) for name in os.listdir(target)
+                  if segment_start(name) is not None)
+
+
+def read_rows(paths, min_columns=7):
+    rows = []
+    for path in paths:
+        with open(path, mode='r', newline='') as file:
+            for row in csv.reader(file):
+                # Header hanya ada di file log lama
+                if len(row) >= min_columns and row[0] != HEADER[0]:
+                    rows.append(row)
+    return rows
+
+
+def mark_reported(paths, segment_dir=SEGMENT_DIR):
+    """Segment yang sudah masuk laporan disimpan, bukan dihapus."""
+    target = reported_dir(segment_dir)
+    os.makedirs(target, exist_ok=True)
+    for path in paths:
+        os.rename(path, os.path.join(target, os.path.basename(path)))
+
+
+def latest_segment(segment_dir=SEGMENT_DIR):
+    try:
+        names = [name for name in os.listdir(segment_dir) if segment_start(name) is not None]
+    except FileNotFoundError:
+        return None
+    if not names:
+        return None
+    return os.path.join(segment_dir, max(names))
@@ -0,0 +1,190 @@
+import csv
+import gzip
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import psutil
+
+from metric_log import HEADER, SEGMENT_DIR, closed_dir, latest_segment
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Kolom CSV -> (nama metric, help, faktor konversi ke satuan dasar)
+SAMPLE_METRICS = {
+    "CPU_%": ("monitor_cpu_usage_percent", "CPU load saat sampel diambil", 1.0),
+    "Suhu_C": ("monitor_cpu_temperature_celsius", "Suhu CPU (thermal_zone0)", 1.0),
+    "RAM_GB": ("monitor_ram_used_bytes", "RAM yang terpakai", 1024**3),
+    "Disk_%": ("monitor_disk_usage_percent", "Pemakaian disk root", 1.0),
+    "Ping_ms": ("monitor_ping_seconds", "Latency speedtest", 0.001),
+    "DL_Mbps": ("monitor_download_bits_per_second", "Kecepatan download speedtest", 1_000_000),
+    "UL_Mbps": ("monitor_upload_bits_per_second", "Kecepatan upload speedtest", 1_000_000),
+    "DL_err_Mbps": ("monitor_download_error_bits_per_second", "Error bar (± interval kepercayaan) download", 1_000_000),
+    "UL_err_Mbps": ("monitor_upload_error_bits_per_second", "Error bar (± interval kepercayaan) upload", 1_000_000),
+    "DiskR_MBps": ("monitor_disk_read_bytes_per_second", "Throughput baca disk (/proc/diskstats)", 1024**2),
+    "DiskW_MBps": ("monitor_disk_write_bytes_per_second", "Throughput tulis disk (/proc/diskstats)", 1024**2),
+    "Disk_IOPS": ("monitor_disk_operations_per_second", "IOPS baca+tulis disk", 1.0),
+    "NetRX_Mbps": ("monitor_network_receive_bits_per_second", "Traffic masuk semua interface (/proc/net/dev)", 1_000_000),
+    "NetTX_Mbps": ("monitor_network_transmit_bits_per_second", "Traffic keluar semua interface (/proc/net/dev)", 1_000_000),
+    "CPU_MHz": ("monitor_cpu_frequency_hertz", "Frekuensi CPU rata-rata selama interval (cpufreq)", 1_000_000),
+    "Throttled": ("monitor_cpu_throttled", "1 kalau CPU di-throttle selama interval", 1.0),
+}
+
+
+def read_latest_sample(path):
+    """Ambil baris terakhir segment tanpa membaca seluruh file."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 4096))
+        tail = f.read().decode("utf-8", "ignore").splitlines()
+
+    for line in reversed(tail):
+        row = next(csv.reader([line]), [])
+        if len(row) >= 2 and row[0] != HEADER[0]:
+            return dict(zip(HEADER, row))
+    return {}
+
+
+def _fmt(value):
+    return repr(float(value))
+
+
+class MetricsCache:
+    """Eksposisi OpenMetrics yang sudah diserialisasi.
+
+    Body hanya dibangun ulang kalau segment log berubah (mtime/size) atau
+    statistik proses sudah kadaluarsa; scrape biasa cukup mengembalikan
+    bytes yang sudah ada, tanpa pengukuran baru.
+    """
+
+    def __init__(self, segment_dir=SEGMENT_DIR, check_interval=1.0, process_ttl=15.0):
+        self.segment_dir = segment_dir
+        self.check_interval = check_interval
+        self.process_ttl = process_ttl
+        self.process = psutil.Process()
+        self._lock = threading.Lock()
+        self._signature = None
+        self._last_check = 0.0
+        self._last_build = 0.0
+        self._body = b""
+        self._body_gzip = b""
+
+    def _file_signature(self):
+        # Segment aktif; setelah report mengklaimnya, pakai segment tertutup terakhir
+        path = latest_segment(self.segment_dir) or latest_segment(closed_dir(self.segment_dir))
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size, path)
+        except OSError:
+            return None
+
+    def _render(self, signature):
+        lines = []
+        sample = {}
+        if signature is not None:
+            try:
+                sample = read_latest_sample(signature[2])
+            except OSError:
+                sample = {}
+
+        for column, (name, help_text, factor) in SAMPLE_METRICS.items():
+            try:
+                value = float(sample[column]) * factor
+            except (KeyError, ValueError):
+                continue
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"# HELP {name} {help_text}.")
+            lines.append(f"{name} {_fmt(value)}")
+
+        if signature is not None:
+            lines.append("# TYPE monitor_last_sample_timestamp_seconds gauge")
+            lines.append("# HELP monitor_last_sample_timestamp_seconds Waktu modifikasi terakhir segment log.")
+            lines.append(f"monitor_last_sample_timestamp_seconds {_fmt(signature[0] / 1e9)}")
+
+        with self.process.oneshot():
+            cpu = self.process.cpu_times()
+            mem = self.process.memory_info()
+            lines.append("# TYPE process_cpu_seconds counter")
+            lines.append("# HELP process_cpu_seconds Total CPU user+system proses monitor.")
+            lines.append(f"process_cpu_seconds_total {_fmt(cpu.user + cpu.system)}")
+            lines.append("# TYPE process_resident_memory_bytes gauge")
+            lines.append("# HELP process_resident_memory_bytes RSS proses monitor.")
+            lines.append(f"process_resident_memory_bytes {mem.rss}")
+            lines.append("# TYPE process_virtual_memory_bytes gauge")
+            lines.append("# HELP process_virtual_memory_bytes VMS proses monitor.")
+            lines.append(f"process_virtual_memory_bytes {mem.vms}")
+            lines.append("# TYPE process_threads gauge")
+            lines.append("# HELP process_threads Jumlah thread proses monitor.")
+            lines.append(f"process_threads {self.process.num_threads()}")
+            if hasattr(self.process, "num_fds"):
+                lines.append("# TYPE process_open_fds gauge")
+                lines.append("# HELP process_open_fds Jumlah file descriptor yang terbuka.")
+                lines.append(f"process_open_fds {self.process.num_fds()}")
+            lines.append("# TYPE process_start_time_seconds gauge")
+            lines.append("# HELP process_start_time_seconds Waktu start proses monitor.")
+            lines.append(f"process_start_time_seconds {_fmt(self.process.create_time())}")
+
+        lines.append("# EOF")
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def get(self):
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval and self._body:
+            return self._body, self._body_gzip
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_check >= self.check_interval or not self._body:
+                self._last_check = now
+                signature = self._file_signature()
+                expired = now - self._last_build >= self.process_ttl
+                if signature != self._signature or expired or not self._body:
+                    body = self._render(signature)
+                    self._body_gzip = gzip.compress(body, compresslevel=6)
+                    self._body = body
+                    self._signature = signature
+                    self._last_build = now
+            return self._body, self._body_gzip
+
+
+def make_handler(cache):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            body, body_gzip = cache.get()
+            use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            payload = body_gzip if use_gzip else body
+
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            # Jangan spam stdout untuk setiap scrape
+            pass
+
+    return MetricsHandler
+
+
+def serve(segment_dir=SEGMENT_DIR, host="127.0.0.1", port=9105):
+    cache = MetricsCache(segment_dir)
+    server = ThreadingHTTPServer((host, port), make_handler(cache))
+    server.daemon_threads = True
+    print(f"Exporter OpenMetrics aktif di http://{host}:{port}/metrics (sumber: {segment_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
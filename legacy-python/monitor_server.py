@@ -4,22 +4,58 @@ import requests
 from fpdf import FPDF
 from datetime import datetime
 import os
-import csv
+import sys
 import time
 import argparse
 import statistics
 
 import os
 from dotenv import load_dotenv
+from metrics_exporter import serve
+from metric_log import SEGMENT_DIR, append_record, claim_closed_segments, read_rows, mark_reported
+from metric_archive import ARCHIVE_DIR, archive_reported
+from day_summary import SUMMARY_DIR, combine, group_by_week, load_summaries, parse_range, summarize_archives
+from process_watch import ProcessWatcher, PROCESS_COLUMNS
+from adaptive_scheduler import AdaptiveScheduler, SchedulerConfig
+from span_log import Tracer
+from io_stats import IOCounters, IO_COLUMNS
+from cgroup_stats import ContainerStats, CONTAINER_COLUMNS
+from thermal_stats import ThermalSampler, THERMAL_COLUMNS, FULL_FREQ_RATIO
+from bandwidth_probe import BandwidthProbe, speedtest_download_url
+
+def find_env_file(name=".env"):
+    # Sama dengan load_dotenv(): dari direktori script ke atas. Di zipapp (build_zipapp.py)
+    # __file__ ada di dalam monitor.pyz, jadi mulai dari direktori tempat monitor.pyz berada
+    path = os.path.dirname(os.path.abspath(__file__))
+    while not os.path.isdir(path):
+        path = os.path.dirname(path)
+    while True:
+        if os.path.isfile(os.path.join(path, name)):
+            return os.path.join(path, name)
+        if os.path.dirname(path) == path:
+            return None
+        path = os.path.dirname(path)
 
 # Load environment variables
-load_dotenv()
+env_file = find_env_file()
+if env_file:
+    load_dotenv(env_file)
 
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
 if not DISCORD_WEBHOOK_URL:
     print("❌ ERROR: DISCORD_WEBHOOK_URL not found in .env file")
-    exit(1)
-LOG_FILE = "/opt/monitoring/daily_log.csv"
+    # sys.exit: builtin exit() tidak ada kalau dijalankan dengan -S (zipapp)
+    sys.exit(1)
+SCHEDULER_STATE_FILE = "/opt/monitoring/scheduler_state.json"
+PROCESS_SEGMENT_DIR = "/opt/monitoring/process-segments"
+IO_STATE_FILE = "/opt/monitoring/io_counters.json"
+IO_SEGMENT_DIR = "/opt/monitoring/io-segments"
+CONTAINER_STATE_FILE = "/opt/monitoring/container_counters.json"
+CONTAINER_SEGMENT_DIR = "/opt/monitoring/container-segments"
+THERMAL_STATE_FILE = "/opt/monitoring/thermal_counters.json"
+THERMAL_SEGMENT_DIR = "/opt/monitoring/thermal-segments"
+# "adaptive" (default): berhenti saat estimasi DL/UL konvergen, "full": fase penuh speedtest-cli
+SPEEDTEST_MODE = os.getenv("SPEEDTEST_MODE", "adaptive")
 
 def get_cpu_temp():
     try:
@@ -50,10 +86,22 @@ def run_speedtest():
             st.get_best_server()
 
             ping = st.results.ping
-            dl = st.download() / 1_000_000
-            ul = st.upload() / 1_000_000
-
-            return round(ping, 1), round(dl, 2), round(ul, 2)
+            if SPEEDTEST_MODE == "full":
+                # Fase download/upload penuh dari library (tanpa error bar)
+                dl = st.download() / 1_000_000
+                ul = st.upload() / 1_000_000
+                bytes_used = st.results.bytes_received + st.results.bytes_sent
+                return round(ping, 1), round(dl, 2), round(ul, 2), bytes_used, ("", "")
+
+            # Library hanya untuk pilih server & ping; DL/UL diukur sampai konvergen
+            probe = BandwidthProbe.from_env()
+            down = probe.download(speedtest_download_url(st.best["url"]))
+            up = probe.upload(st.best["url"])
+            print(down)
+            print(up)
+            bytes_used = down.bytes_used + up.bytes_used
+            errors = (round(down.error_mbps, 2), round(up.error_mbps, 2))
+            return round(ping, 1), round(down.mbps, 2), round(up.mbps, 2), bytes_used, errors
 
         except Exception as e:
             error_msg = f"{datetime.now()} - Gagal Percobaan {attempt}: {str(e)}\n"
@@ -63,70 +111,422 @@ def run_speedtest():
             if attempt == max_retries:
                 with open("/opt/monitoring/error_log.txt", "a") as f:
                     f.write(f"{datetime.now()} - ERROR FINAL Speedtest: {str(e)}\n")
-                return 0, 0, 0
+                return 0, 0, 0, 0, ("", "")
 
             # Jika belum menyerah, tunggu 15 detik sebelum coba lagi
             time.sleep(15)
 
+def sample_hardware():
+    cpu = psutil.cpu_percent(interval=1)
+    temp = get_cpu_temp()
+    ram = psutil.virtual_memory()
+    _, _, disk_percent = get_storage_info()
+    return cpu, temp, ram, disk_percent
+
+def sample_io(counters):
+    # Rate disk/network dari counter /proc, tanpa membuat traffic uji.
+    # Detail per device ke segment sendiri, total ikut baris log utama.
+    now = time.time()
+    totals, rows = counters.sample(now)
+    for row in rows:
+        append_record(row, when=now, segment_dir=IO_SEGMENT_DIR)
+    return totals or [""] * 5
+
+def sample_containers(stats):
+    # CPU/throttling/memori/I/O per container Docker dari cgroup v2, ke segment sendiri
+    now = time.time()
+    for row in stats.sample(now):
+        append_record(row, when=now, segment_dir=CONTAINER_SEGMENT_DIR)
+
+def sample_thermal(sampler):
+    # Semua zona suhu, histogram waktu-per-frekuensi & flag throttling ke segment sendiri;
+    # CPU_MHz dan Throttled ikut baris log utama
+    now = time.time()
+    totals, rows = sampler.sample(now)
+    for row in rows:
+        append_record(row, when=now, segment_dir=THERMAL_SEGMENT_DIR)
+    return totals
+
+def write_log_row(timestamp, cpu, temp, ram, disk_percent, ping, dl, ul, io, errors, thermal):
+    # Satu baris = satu write() O_APPEND ke segment per jam (lihat metric_log.py)
+    append_record([
+        timestamp,
+        round(cpu, 1),
+        round(temp, 1),
+        round(ram.used/(1024**3), 2),  # Hanya GB yang digunakan
+        ping,
+        dl,
+        ul,
+        disk_percent,
+        *io,  # DiskR_MBps, DiskW_MBps, Disk_IOPS, NetRX_Mbps, NetTX_Mbps
+        *errors,  # DL_err_Mbps, UL_err_Mbps
+        *thermal  # CPU_MHz, Throttled
+    ])
+
 def log_data():
     print("Mencatat data harian... (Mohon tunggu Speedtest)")
+    tracer = Tracer("log")
     timestamp = datetime.now().strftime("%H:%M")
 
-    cpu = psutil.cpu_percent(interval=1)
-    temp = get_cpu_temp()
-    ram = psutil.virtual_memory()
+    with tracer.span("hardware"):
+        cpu, temp, ram, disk_percent = sample_hardware()
+        # Rate = rata-rata sejak run --log sebelumnya (counter disimpan di state file)
+        counters = IOCounters.load(IO_STATE_FILE)
+        io = sample_io(counters)
+        counters.save(IO_STATE_FILE)
+        containers = ContainerStats.load(CONTAINER_STATE_FILE)
+        sample_containers(containers)
+        containers.save(CONTAINER_STATE_FILE)
+        containers.close()
+        thermal_sampler = ThermalSampler.load(THERMAL_STATE_FILE)
+        thermal = sample_thermal(thermal_sampler)
+        thermal_sampler.save(THERMAL_STATE_FILE)
+
+    with tracer.span("speedtest"):
+        ping, dl, ul, _, errors = run_speedtest()
+
+    with tracer.span("write"):
+        write_log_row(timestamp, cpu, temp, ram, disk_percent, ping, dl, ul, io, errors, thermal)
+
+    tracer.finish()
+    print(f"Data jam {timestamp} berhasil dicatat (DL: {dl} Mbps).")
 
-    ping, dl, ul = run_speedtest()
+def run_adaptive():
+    # Mode daemon: interval sampling & speedtest ditentukan AdaptiveScheduler
+    scheduler = AdaptiveScheduler.load(SCHEDULER_STATE_FILE, SchedulerConfig.from_env())
+    counters = IOCounters.load(IO_STATE_FILE)
+    # File stat cgroup tetap terbuka selama daemon jalan (pread per tick)
+    containers = ContainerStats.load(CONTAINER_STATE_FILE)
+    thermal_sampler = ThermalSampler.load(THERMAL_STATE_FILE)
+    print("Mode adaptif aktif (Ctrl+C untuk berhenti)")
+
+    while True:
+        timestamp = datetime.now().strftime("%H:%M")
+        cpu, temp, ram, disk_percent = sample_hardware()
+        io = sample_io(counters)
+        sample_containers(containers)
+        thermal = sample_thermal(thermal_sampler)
+        scheduler.observe_hardware(cpu, temp, ram.percent)
+
+        # Kolom network dikosongkan kalau speedtest tidak dijalankan
+        ping, dl, ul, errors = "", "", "", ("", "")
+        now = time.time()
+        if scheduler.speedtest_due(now):
+            ping, dl, ul, bytes_used, errors = run_speedtest()
+            scheduler.observe_speedtest(now, dl, ul, bytes_used)
+
+        write_log_row(timestamp, cpu, temp, ram, disk_percent, ping, dl, ul, io, errors, thermal)
+        scheduler.save(SCHEDULER_STATE_FILE)
+        counters.save(IO_STATE_FILE)
+        containers.save(CONTAINER_STATE_FILE)
+        thermal_sampler.save(THERMAL_STATE_FILE)
+
+        interval = scheduler.next_hardware_interval()
+        print(f"[{timestamp}] CPU {cpu:.1f}% | Suhu {temp:.1f}°C | DL {dl or '-'} | sampel berikutnya {interval:.0f} detik")
+        time.sleep(interval)
+
+def run_process_watch(targets, interval):
+    # Pantau proses tertentu terus-menerus (metric sama dengan /usr/bin/time -v)
+    watcher = ProcessWatcher(targets)
+    print(f"Memantau proses: {', '.join(targets)} (tiap {interval} detik)")
+
+    while True:
+        started = time.time()
+        for row in watcher.sample(started):
+            append_record([row[c] for c in PROCESS_COLUMNS], when=started, segment_dir=PROCESS_SEGMENT_DIR)
+        time.sleep(max(0.0, interval - (time.time() - started)))
+
+def mean_of(rows, idx):
+    # Nilai kosong (speedtest tidak dijalankan, baris lama tanpa kolom I/O) tidak ikut dirata-rata
+    values = [float(r[idx]) for r in rows if idx < len(r) and r[idx] != ""]
+    return statistics.mean(values) if values else 0
+
+def rows_per_hour(rows):
+    # Mode adaptif bisa mencatat beberapa sampel per jam, tabel detail tetap per jam
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row[0][:2], []).append(row)
+
+    result = []
+    for hour, group in grouped.items():
+        if len(group) == 1:
+            result.append(group[0])
+            continue
+        row = [f"{hour}:00"]
+        for idx, digits in ((1, 1), (2, 1), (3, 2), (4, 1), (5, 2), (6, 2)):
+            if any(r[idx] != "" for r in group):
+                row.append(f"{mean_of(group, idx):.{digits}f}")
+            else:
+                row.append("")
+        result.append(row)
+    return result
+
+def io_per_device(io_rows):
+    # (jenis, device) -> rata-rata & puncak; baris: IO_COLUMNS
+    grouped = {}
+    for row in io_rows:
+        grouped.setdefault((row[1], row[2]), []).append(row)
+
+    result = []
+    for (kind, device), rows in sorted(grouped.items()):
+        result.append({
+            "kind": kind,
+            "device": device,
+            "avg_in": mean_of(rows, 3),
+            "avg_out": mean_of(rows, 4),
+            "max_in": max(float(r[3]) for r in rows),
+            "max_out": max(float(r[4]) for r in rows),
+            "ops": mean_of(rows, 5) + mean_of(rows, 6),
+            "busy": mean_of(rows, 7) if kind == "disk" else None,
+        })
+    return result
+
+def write_io_table(pdf, io_rows):
+    pdf.ln(8)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, "3. I/O per Device (rata-rata / puncak)", ln=True, fill=True)
+    pdf.ln(2)
 
-    file_exists = os.path.isfile(LOG_FILE)
-    with open(LOG_FILE, mode='a', newline='') as file:
-        writer = csv.writer(file)
+    # Device(30), Jenis(15), Masuk(35), Keluar(35), Ops/s(22), Busy(22) = Total 159mm
+    widths = (30, 15, 35, 35, 22, 22)
+    pdf.set_font("Arial", 'B', 9)
+    for width, title in zip(widths, ("Device", "Jenis", "R/RX (KB/s)", "W/TX (KB/s)", "IOPS/pkt", "Busy%")):
+        pdf.cell(width, 8, title, 1, 0, 'C')
+    pdf.ln()
 
-        if not file_exists:
-            writer.writerow(["Jam", "CPU_%", "Suhu_C", "RAM_GB", "Ping_ms", "DL_Mbps", "UL_Mbps"])
+    pdf.set_font("Arial", size=9)
+    for dev in io_per_device(io_rows):
+        pdf.cell(widths[0], 8, dev["device"], 1, 0, 'C')
+        pdf.cell(widths[1], 8, dev["kind"], 1, 0, 'C')
+        pdf.cell(widths[2], 8, f"{dev['avg_in'] / 1024:.1f} / {dev['max_in'] / 1024:.1f}", 1, 0, 'C')
+        pdf.cell(widths[3], 8, f"{dev['avg_out'] / 1024:.1f} / {dev['max_out'] / 1024:.1f}", 1, 0, 'C')
+        pdf.cell(widths[4], 8, f"{dev['ops']:.1f}", 1, 0, 'C')
+        pdf.cell(widths[5], 8, f"{dev['busy']:.1f}" if dev["busy"] is not None else "-", 1, 1, 'C')
+
+def container_summary(container_rows):
+    # container -> rata-rata & puncak; baris: CONTAINER_COLUMNS
+    grouped = {}
+    for row in container_rows:
+        grouped.setdefault(row[1], []).append(row)
+
+    result = []
+    for name, rows in sorted(grouped.items()):
+        memory = [float(r[5]) for r in rows if r[5] != ""]
+        limits = [float(r[6]) for r in rows if r[6] != ""]
+        result.append({
+            "name": name,
+            "avg_cpu": mean_of(rows, 2),
+            "max_cpu": max(float(r[2]) for r in rows),
+            "throttled": mean_of(rows, 3),
+            "avg_mem": mean_of(rows, 5),
+            "max_mem": max(memory, default=0),
+            "limit": limits[-1] if limits else None,
+        })
+    return result
+
+def write_container_table(pdf, section, container_rows):
+    pdf.ln(8)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, f"{section}. Container (rata-rata / puncak)", ln=True, fill=True)
+    pdf.ln(2)
 
-        writer.writerow([
-            timestamp,
-            round(cpu, 1),
-            round(temp, 1),
-            round(ram.used/(1024**3), 2),  # Hanya GB yang digunakan
-            ping,
-            dl,
-            ul
-        ])
+    # Container(45), CPU(30), Throttle(22), RAM(37), Limit(25) = Total 159mm
+    widths = (45, 30, 22, 37, 25)
+    pdf.set_font("Arial", 'B', 9)
+    for width, title in zip(widths, ("Container", "CPU%", "Throttle%", "RAM (MB)", "Limit (MB)")):
+        pdf.cell(width, 8, title, 1, 0, 'C')
+    pdf.ln()
 
-    print(f"Data jam {timestamp} berhasil dicatat (DL: {dl} Mbps).")
+    pdf.set_font("Arial", size=9)
+    for ct in container_summary(container_rows):
+        pdf.cell(widths[0], 8, ct["name"][:24], 1, 0, 'C')
+        pdf.cell(widths[1], 8, f"{ct['avg_cpu']:.1f} / {ct['max_cpu']:.1f}", 1, 0, 'C')
+        # Throttling > 5% periode berarti limit CPU container terlalu ketat
+        if ct["throttled"] > 5: pdf.set_text_color(255, 0, 0)
+        pdf.cell(widths[2], 8, f"{ct['throttled']:.1f}", 1, 0, 'C')
+        pdf.set_text_color(0, 0, 0)
+        pdf.cell(widths[3], 8, f"{ct['avg_mem']:.0f} / {ct['max_mem']:.0f}", 1, 0, 'C')
+        pdf.cell(widths[4], 8, f"{ct['limit']:.0f}" if ct["limit"] is not None else "-", 1, 1, 'C')
+
+def process_summary(process_rows):
+    # nama proses -> rata-rata & puncak; baris: PROCESS_COLUMNS (PID bisa berganti kalau proses restart)
+    grouped = {}
+    for row in process_rows:
+        grouped.setdefault(row[2], []).append(row)
+
+    result = []
+    for name, rows in sorted(grouped.items()):
+        cpu = [float(r[8]) for r in rows if r[8] != ""]
+        result.append({
+            "name": name,
+            "pids": len({r[1] for r in rows}),
+            "samples": len(rows),
+            "avg_cpu": mean_of(rows, 8),
+            "max_cpu": max(cpu, default=0),
+            "avg_rss": mean_of(rows, 4) / 1024,
+            "max_rss": max(float(r[3]) for r in rows) / 1024,
+            "fds": max((int(r[17]) for r in rows if r[17] != ""), default=None),
+        })
+    return result
+
+def write_process_table(pdf, section, process_rows):
+    pdf.ln(8)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, f"{section}. Proses Dipantau --watch (rata-rata / puncak)", ln=True, fill=True)
+    pdf.ln(2)
+
+    # Proses(40), PID(19), Sampel(20), CPU(30), RSS(30), FD(20) = Total 159mm
+    widths = (40, 19, 20, 30, 30, 20)
+    pdf.set_font("Arial", 'B', 9)
+    for width, title in zip(widths, ("Proses", "PID", "Sampel", "CPU%", "RSS (MB)", "FD maks")):
+        pdf.cell(width, 8, title, 1, 0, 'C')
+    pdf.ln()
+
+    pdf.set_font("Arial", size=9)
+    for proc in process_summary(process_rows):
+        pdf.cell(widths[0], 8, proc["name"][:22], 1, 0, 'C')
+        # Lebih dari satu PID dalam sehari berarti proses restart
+        if proc["pids"] > 1: pdf.set_text_color(255, 0, 0)
+        pdf.cell(widths[1], 8, f"{proc['pids']}", 1, 0, 'C')
+        pdf.set_text_color(0, 0, 0)
+        pdf.cell(widths[2], 8, f"{proc['samples']}", 1, 0, 'C')
+        pdf.cell(widths[3], 8, f"{proc['avg_cpu']:.1f} / {proc['max_cpu']:.1f}", 1, 0, 'C')
+        pdf.cell(widths[4], 8, f"{proc['avg_rss']:.1f} / {proc['max_rss']:.1f}", 1, 0, 'C')
+        pdf.cell(widths[5], 8, f"{proc['fds']}" if proc["fds"] is not None else "-", 1, 1, 'C')
+
+def pearson(xs, ys):
+    # None kalau data terlalu sedikit atau salah satu deret konstan
+    if len(xs) < 3:
+        return None
+    mx, my = statistics.mean(xs), statistics.mean(ys)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    return sxy / (sxx * syy) ** 0.5 if sxx and syy else None
+
+def thermal_summary(data_rows, thermal_rows):
+    # Histogram waktu-per-frekuensi & kejadian throttle dari segment thermal (THERMAL_COLUMNS)
+    histogram, events = {}, {}
+    max_mhz = None
+    for _, kind, source, key, value in (row[:5] for row in thermal_rows):
+        if kind == "freq" and key.isdigit():
+            histogram[int(key)] = histogram.get(int(key), 0) + float(value)
+        elif kind == "freq" and key == "max_mhz":
+            max_mhz = max(max_mhz or 0, float(value))
+        elif kind == "throttle" and key != "since_boot" and value not in ("", "0"):
+            events[f"{source}/{key}"] = events.get(f"{source}/{key}", 0) + 1
+
+    # 15=CPU_MHz, 16=Throttled; baris lama / host tanpa cpufreq tidak punya nilai
+    rows = [r for r in data_rows if len(r) > 15 and r[15] != ""]
+    if max_mhz is None and rows:
+        max_mhz = max(float(r[15]) for r in rows)
+    full = [r for r in rows if float(r[15]) >= FULL_FREQ_RATIO * max_mhz]
+    reduced = [r for r in rows if float(r[15]) < FULL_FREQ_RATIO * max_mhz]
+    throttled = [r for r in rows if len(r) > 16 and r[16] == "1"]
+    mhz = [float(r[15]) for r in rows]
+    return {
+        "histogram": dict(sorted(histogram.items())),
+        "events": events,
+        "max_mhz": max_mhz,
+        "groups": [(f"Frekuensi penuh (>= {FULL_FREQ_RATIO * (max_mhz or 0):.0f} MHz)", full),
+                   ("Frekuensi turun", reduced), ("Throttled", throttled)],
+        "r_temp": pearson(mhz, [float(r[2]) for r in rows]),
+        "r_cpu": pearson(mhz, [float(r[1]) for r in rows]),
+    }
+
+def write_thermal_section(pdf, section, data_rows, thermal_rows):
+    summary = thermal_summary(data_rows, thermal_rows)
+    pdf.ln(8)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, f"{section}. Frekuensi CPU & Throttling", ln=True, fill=True)
+    pdf.ln(2)
+
+    # Waktu per frekuensi (semua policy): MHz(40), Jam(40), Persen(40)
+    total = sum(summary["histogram"].values())
+    if total:
+        pdf.set_font("Arial", 'B', 9)
+        for width, title in zip((40, 40, 40), ("Frekuensi (MHz)", "Waktu (jam)", "% waktu")):
+            pdf.cell(width, 8, title, 1, 0, 'C')
+        pdf.ln()
+        pdf.set_font("Arial", size=9)
+        for freq, seconds in summary["histogram"].items():
+            # Di bawah frekuensi penuh ditandai merah
+            if summary["max_mhz"] and freq < FULL_FREQ_RATIO * summary["max_mhz"]: pdf.set_text_color(255, 0, 0)
+            pdf.cell(40, 8, f"{freq}", 1, 0, 'C')
+            pdf.cell(40, 8, f"{seconds / 3600:.2f}", 1, 0, 'C')
+            pdf.cell(40, 8, f"{seconds / total * 100:.1f}%", 1, 1, 'C')
+            pdf.set_text_color(0, 0, 0)
+        pdf.ln(4)
+
+    # Kondisi(60), Sampel(22), CPU(25), Suhu(25), MHz(27) = Total 159mm
+    widths = (60, 22, 25, 25, 27)
+    pdf.set_font("Arial", 'B', 9)
+    for width, title in zip(widths, ("Kondisi", "Sampel", "CPU%", "Suhu°C", "MHz")):
+        pdf.cell(width, 8, title, 1, 0, 'C')
+    pdf.ln()
+    pdf.set_font("Arial", size=9)
+    for label, rows in summary["groups"]:
+        pdf.cell(widths[0], 8, label, 1, 0, 'L')
+        pdf.cell(widths[1], 8, f"{len(rows)}", 1, 0, 'C')
+        for width, idx, digits in ((widths[2], 1, 1), (widths[3], 2, 1), (widths[4], 15, 0)):
+            pdf.cell(width, 8, f"{mean_of(rows, idx):.{digits}f}" if rows else "-", 1, 0, 'C')
+        pdf.ln()
 
-def generate_report():
+    pdf.ln(2)
+    pdf.cell(0, 6, f"Korelasi MHz vs suhu: r = {fmt_stat(summary['r_temp'], 2)} | "
+                   f"MHz vs CPU%: r = {fmt_stat(summary['r_cpu'], 2)}", ln=True)
+    if summary["events"]:
+        events = ", ".join(f"{name} x{count}" for name, count in sorted(summary["events"].items()))
+        pdf.cell(0, 6, f"Indikator throttle (jumlah sampel): {events}", ln=True)
+
+def generate_report(now=None, segment_dir=SEGMENT_DIR, io_segment_dir=IO_SEGMENT_DIR,
+                    archive_dir=ARCHIVE_DIR, summary_dir=SUMMARY_DIR, container_segment_dir=CONTAINER_SEGMENT_DIR,
+                    thermal_segment_dir=THERMAL_SEGMENT_DIR, process_segment_dir=PROCESS_SEGMENT_DIR):
+    # Parameter hanya dipakai bench_pipeline.py (replay dengan waktu virtual & direktori sendiri)
     print("1. Membaca Data Log Harian...")
-    data_rows = []
-    if os.path.exists(LOG_FILE):
-        with open(LOG_FILE, mode='r') as file:
-            reader = csv.reader(file)
-            next(reader, None)
-            for row in reader:
-                if len(row) >= 8:
-                    data_rows.append(row)
+    tracer = Tracer("report")
+    done = tracer.start("read")
+    # Ambil snapshot segment yang sudah tertutup, segment aktif tidak disentuh
+    segments = claim_closed_segments(now=now, segment_dir=segment_dir)
+    data_rows = read_rows(segments)
+    io_segments = claim_closed_segments(now=now, segment_dir=io_segment_dir)
+    io_rows = read_rows(io_segments, min_columns=len(IO_COLUMNS))
+    container_segments = claim_closed_segments(now=now, segment_dir=container_segment_dir)
+    container_rows = read_rows(container_segments, min_columns=len(CONTAINER_COLUMNS))
+    thermal_segments = claim_closed_segments(now=now, segment_dir=thermal_segment_dir)
+    thermal_rows = read_rows(thermal_segments, min_columns=len(THERMAL_COLUMNS))
+    # Segment --watch (kosong kalau daemon tidak jalan)
+    process_segments = claim_closed_segments(now=now, segment_dir=process_segment_dir)
+    process_rows = read_rows(process_segments, min_columns=len(PROCESS_COLUMNS))
+    done()
 
     avg_cpu, avg_temp, avg_ram = 0, 0, 0
     avg_ping, avg_dl, avg_ul = 0, 0, 0
+    avg_disk_r, avg_disk_w, avg_iops, avg_rx, avg_tx = 0, 0, 0, 0, 0
 
     storage_total, storage_used, storage_percent = get_storage_info()
 
     if data_rows:
         # Index CSV baru: 0=Jam, 1=CPU, 2=Suhu, 3=RAM, 4=Ping, 5=DL, 6=UL
-        avg_cpu = statistics.mean([float(r[1]) for r in data_rows])
-        avg_temp = statistics.mean([float(r[2]) for r in data_rows])
-        avg_ram = statistics.mean([float(r[3]) for r in data_rows])
-        avg_ping = statistics.mean([float(r[4]) for r in data_rows])
-        avg_dl = statistics.mean([float(r[5]) for r in data_rows])
-        avg_ul = statistics.mean([float(r[6]) for r in data_rows])
+        avg_cpu = mean_of(data_rows, 1)
+        avg_temp = mean_of(data_rows, 2)
+        avg_ram = mean_of(data_rows, 3)
+        avg_ping = mean_of(data_rows, 4)
+        avg_dl = mean_of(data_rows, 5)
+        avg_ul = mean_of(data_rows, 6)
+        # 8..12 = DiskR_MBps, DiskW_MBps, Disk_IOPS, NetRX_Mbps, NetTX_Mbps
+        avg_disk_r = mean_of(data_rows, 8)
+        avg_disk_w = mean_of(data_rows, 9)
+        avg_iops = mean_of(data_rows, 10)
+        avg_rx = mean_of(data_rows, 11)
+        avg_tx = mean_of(data_rows, 12)
 
     # Setup Nama File Tanggal
-    today_str = datetime.now().strftime('%Y-%m-%d')
+    today_str = (datetime.fromtimestamp(now) if now else datetime.now()).strftime('%Y-%m-%d')
     dynamic_filename = f"/tmp/Laporan_Server_{today_str}.pdf"
 
     # --- BUAT PDF ---
+    done = tracer.start("pdf")
     pdf = FPDF()
     pdf.add_page()
 
@@ -158,6 +558,11 @@ def generate_report():
     pdf.cell(60, 8, f"Download: {avg_dl:.1f} Mbps", border=1)
     pdf.cell(60, 8, f"Upload: {avg_ul:.1f} Mbps", border=1)
     pdf.cell(70, 8, f"Ping: {avg_ping:.0f} ms", border=1, ln=True)
+
+    # Baris 4: I/O pasif dari /proc (bukan speedtest)
+    pdf.cell(60, 8, f"Disk R/W: {avg_disk_r:.2f}/{avg_disk_w:.2f} MB/s", border=1)
+    pdf.cell(60, 8, f"Disk IOPS: {avg_iops:.1f}", border=1)
+    pdf.cell(70, 8, f"Net RX/TX: {avg_rx:.2f}/{avg_tx:.2f} Mbps", border=1, ln=True)
     pdf.ln(8)
 
     # BAGIAN 2: TABEL DETAIL (UPDATE: Tambah Kolom Speed)
@@ -182,7 +587,7 @@ def generate_report():
 
     # Isi Tabel dengan format praktis
     pdf.set_font("Arial", size=9)
-    for row in data_rows:
+    for row in rows_per_hour(data_rows):
         # row baru: [0:Jam, 1:CPU, 2:Suhu, 3:RAM(GB), 4:Ping, 5:DL, 6:UL]
         pdf.cell(w_jam, 8, row[0], 1, 0, 'C')
         pdf.cell(w_cpu, 8, f"{row[1]}%", 1, 0, 'C')
@@ -193,25 +598,171 @@ def generate_report():
         pdf.set_text_color(0, 0, 0) # Reset Hitam
 
         pdf.cell(w_ram, 8, f"{row[3]} GB", 1, 0, 'C')
-        pdf.cell(w_ping, 8, f"{float(row[4]):.0f}", 1, 0, 'C')
-        pdf.cell(w_dl, 8, f"{row[5]} Mbps", 1, 0, 'C')
-        pdf.cell(w_ul, 8, f"{row[6]} Mbps", 1, 1, 'C')
+        # Kolom network bisa kosong kalau jam itu speedtest di-skip (mode adaptif)
+        pdf.cell(w_ping, 8, f"{float(row[4]):.0f}" if row[4] else "-", 1, 0, 'C')
+        pdf.cell(w_dl, 8, f"{row[5]} Mbps" if row[5] else "-", 1, 0, 'C')
+        pdf.cell(w_ul, 8, f"{row[6]} Mbps" if row[6] else "-", 1, 1, 'C')
+
+    # BAGIAN 3 dst: I/O per device, container, proses, frekuensi CPU (nomor bergeser kalau bagian kosong)
+    section = 3
+    if io_rows:
+        write_io_table(pdf, io_rows)
+        section += 1
+
+    if container_rows:
+        write_container_table(pdf, section, container_rows)
+        section += 1
+
+    if process_rows:
+        write_process_table(pdf, section, process_rows)
+        section += 1
+
+    if thermal_rows or any(len(r) > 15 and r[15] != "" for r in data_rows):
+        write_thermal_section(pdf, section, data_rows, thermal_rows)
 
     # Output File
     pdf.output(dynamic_filename)
+    done()
 
     # Kirim ke Discord
     print(f"3. Mengirim ke Discord: {dynamic_filename}")
+    done = tracer.start("send")
 
     with open(dynamic_filename, "rb") as f:
         # Caption Discord dengan format praktis
         caption = f"📊 **Daily Report ({today_str})**\n💾 RAM: {avg_ram:.2f}GB | 🌡️ Suhu: {avg_temp:.1f}°C | 🚀 DL: {avg_dl:.1f}Mbps | 💿 Disk: {storage_percent}%"
         files = {"file": (f"Laporan_{today_str}.pdf", f)}
         requests.post(DISCORD_WEBHOOK_URL, data={"content": caption}, files=files)
+    done()
 
     # Bersih-bersih
     if os.path.exists(dynamic_filename): os.remove(dynamic_filename)
-    if os.path.exists(LOG_FILE): os.remove(LOG_FILE)
+    done = tracer.start("archive")
+    mark_reported(segments, segment_dir=segment_dir)
+    mark_reported(io_segments, segment_dir=io_segment_dir)
+    mark_reported(container_segments, segment_dir=container_segment_dir)
+    mark_reported(thermal_segments, segment_dir=thermal_segment_dir)
+    mark_reported(process_segments, segment_dir=process_segment_dir)
+    # Hari yang masuk arsip langsung diringkas untuk report --range
+    summarize_archives(archive_reported(segment_dir, archive_dir), summary_dir)
+    done()
+    tracer.finish()
+    print("Selesai.")
+
+# (kolom, label, desimal) untuk rangkuman report rentang
+RANGE_METRICS = [
+    ("CPU_%", "CPU (%)", 1), ("Suhu_C", "Suhu (°C)", 1), ("RAM_GB", "RAM (GB)", 2),
+    ("Ping_ms", "Ping (ms)", 0), ("DL_Mbps", "Download (Mbps)", 1), ("UL_Mbps", "Upload (Mbps)", 1),
+    ("Disk_%", "Disk Usage (%)", 1), ("DiskR_MBps", "Disk Read (MB/s)", 2),
+    ("DiskW_MBps", "Disk Write (MB/s)", 2), ("Disk_IOPS", "Disk IOPS", 1),
+    ("NetRX_Mbps", "Net RX (Mbps)", 2), ("NetTX_Mbps", "Net TX (Mbps)", 2),
+    ("CPU_MHz", "CPU Freq (MHz)", 0),
+]
+
+def fmt_stat(value, digits):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+def trend_row(label, columns):
+    # columns: {kolom: ColumnSummary} untuk satu hari / satu minggu
+    def stat(name, fn, digits):
+        col = columns.get(name)
+        return fmt_stat(fn(col) if col and col.count else None, digits)
+    cpu = columns.get("CPU_%")
+    return [
+        label,
+        str(cpu.count if cpu else 0),
+        stat("CPU_%", lambda c: c.mean, 1),
+        stat("CPU_%", lambda c: c.quantile(0.95), 1),
+        stat("Suhu_C", lambda c: c.maximum, 1),
+        stat("RAM_GB", lambda c: c.mean, 2),
+        stat("Ping_ms", lambda c: c.quantile(0.95), 0),
+        stat("DL_Mbps", lambda c: c.mean, 1),
+        stat("UL_Mbps", lambda c: c.mean, 1),
+    ]
+
+def write_trend_table(pdf, title, rows):
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, title, ln=True, fill=True)
+    pdf.ln(2)
+
+    # Tanggal(28), Sampel(18), CPU(22+22), Suhu(22), RAM(22), Ping(18), DL(19), UL(19) = Total 190mm
+    widths = (28, 18, 22, 22, 22, 22, 18, 19, 19)
+    titles = ("Tanggal", "Sampel", "CPU avg", "CPU p95", "Suhu maks", "RAM avg", "Ping p95", "DL avg", "UL avg")
+    pdf.set_font("Arial", 'B', 9)
+    for width, text in zip(widths, titles):
+        pdf.cell(width, 8, text, 1, 0, 'C')
+    pdf.ln()
+
+    pdf.set_font("Arial", size=9)
+    for row in rows:
+        for idx, (width, text) in enumerate(zip(widths, row)):
+            # Suhu maks merah jika > 60°C, sama dengan laporan harian
+            if idx == 4 and text != "-" and float(text) > 60: pdf.set_text_color(255, 0, 0)
+            pdf.cell(width, 8, text, 1, 1 if idx == len(widths) - 1 else 0, 'C')
+            pdf.set_text_color(0, 0, 0)
+    pdf.ln(8)
+
+def generate_range_report(start_day, end_day, label):
+    print(f"1. Memuat ringkasan harian {start_day} s/d {end_day}...")
+    # O(hari): hanya ringkasan per hari yang dibaca, arsip & log tidak disentuh
+    summaries = load_summaries(start_day, end_day)
+    if not summaries:
+        print("Tidak ada data arsip untuk rentang ini.")
+        return
+    total = combine(summaries)
+
+    dynamic_filename = f"/tmp/Laporan_Server_{start_day}_{end_day}.pdf"
+
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', 16)
+    pdf.cell(0, 10, f"Laporan Server {label} (Raspi 4)", ln=True, align='C')
+    pdf.set_font("Arial", 'I', 10)
+    pdf.cell(0, 10, f"Periode: {start_day} s/d {end_day} ({len(summaries)} hari berisi data)", ln=True, align='C')
+    pdf.ln(5)
+
+    # BAGIAN 1: RANGKUMAN PERIODE
+    pdf.set_fill_color(230, 230, 230)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, "1. Rangkuman Periode", ln=True, fill=True)
+    pdf.ln(2)
+
+    # Metrik(40), Rata-rata(30), Min(30), P50(30), P95(30), Maks(30) = Total 190mm
+    pdf.set_font("Arial", 'B', 9)
+    for width, text in zip((40, 30, 30, 30, 30, 30), ("Metrik", "Rata-rata", "Min", "P50", "P95", "Maks")):
+        pdf.cell(width, 8, text, 1, 0, 'C')
+    pdf.ln()
+    pdf.set_font("Arial", size=9)
+    for name, title, digits in RANGE_METRICS:
+        col = total.get(name)
+        if not col or not col.count:
+            continue
+        pdf.cell(40, 8, title, 1, 0, 'L')
+        for value in (col.mean, col.minimum, col.quantile(0.5), col.quantile(0.95)):
+            pdf.cell(30, 8, fmt_stat(value, digits), 1, 0, 'C')
+        pdf.cell(30, 8, fmt_stat(col.maximum, digits), 1, 1, 'C')
+    pdf.ln(8)
+
+    # BAGIAN 2 & 3: TREN HARIAN / MINGGUAN
+    write_trend_table(pdf, "2. Tren Harian", [trend_row(s["day"], s["columns"]) for s in summaries])
+    weeks = group_by_week(summaries)
+    if len(weeks) > 1:
+        write_trend_table(pdf, "3. Tren Mingguan",
+                          [trend_row(week, combine(days)) for week, days in weeks])
+
+    pdf.output(dynamic_filename)
+    print(f"2. Mengirim ke Discord: {dynamic_filename}")
+
+    cpu, temp, dl = total.get("CPU_%"), total.get("Suhu_C"), total.get("DL_Mbps")
+    with open(dynamic_filename, "rb") as f:
+        caption = (f"📈 **Report {label} ({start_day} s/d {end_day})**\n"
+                   f"🖥️ CPU: {fmt_stat(cpu.mean if cpu else None, 1)}% | "
+                   f"🌡️ Suhu maks: {fmt_stat(temp.maximum if temp else None, 1)}°C | "
+                   f"🚀 DL: {fmt_stat(dl.mean if dl else None, 1)}Mbps")
+        files = {"file": (os.path.basename(dynamic_filename), f)}
+        requests.post(DISCORD_WEBHOOK_URL, data={"content": caption}, files=files)
+
+    if os.path.exists(dynamic_filename): os.remove(dynamic_filename)
     print("Selesai.")
 
 
@@ -220,7 +771,25 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('--log', action='store_true')
     parser.add_argument('--report', action='store_true')
+    parser.add_argument('--range', metavar='7d|30d|AWAL:AKHIR',
+                        help='Dengan --report: laporan tren multi-hari dari ringkasan harian (tanpa menghapus data)')
+    parser.add_argument('--adaptive', action='store_true', help='Daemon dengan interval sampling & speedtest adaptif')
+    parser.add_argument('--watch', nargs='*', metavar='PID_ATAU_NAMA',
+                        help='Pantau proses (default: WATCH_PROCESSES di .env)')
+    parser.add_argument('--serve', action='store_true', help='Jalankan exporter OpenMetrics (/metrics)')
+    parser.add_argument('--port', type=int, default=int(os.getenv("EXPORTER_PORT", "9105")))
     args = parser.parse_args()
 
     if args.log: log_data()
+    elif args.report and args.range:
+        try:
+            start_day, end_day = parse_range(args.range)
+        except ValueError as e:
+            parser.error(str(e))
+        generate_range_report(start_day, end_day, args.range if args.range.endswith("d") else "Custom")
     elif args.report: generate_report()
+    elif args.adaptive: run_adaptive()
+    elif args.watch is not None:
+        targets = args.watch or [t.strip() for t in os.getenv("WATCH_PROCESSES", "").split(",") if t.strip()]
+        run_process_watch(targets, float(os.getenv("WATCH_INTERVAL_SEC", "10")))
+    elif args.serve: serve(host=os.getenv("EXPORTER_HOST", "127.0.0.1"), port=args.port)
@@ -0,0 +1,191 @@
+import os
+import time
+
+# Kolom mengikuti nama metric di analysis-tools/parse_logs.py supaya hasilnya
+# bisa dibandingkan langsung dengan data /usr/bin/time -v
+PROCESS_COLUMNS = [
+    "timestamp", "pid", "name", "max_rss_kb", "rss_kb", "elapsed_sec",
+    "user_time_sec", "system_time_sec", "cpu_percent",
+    "minor_page_faults", "major_page_faults",
+    "voluntary_context_switches", "involuntary_context_switches",
+    "file_system_inputs", "file_system_outputs",
+    "read_bytes", "write_bytes", "open_fds", "threads",
+]
+
+PROC = "/proc"
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def boot_time(proc=PROC):
+    for line in _read(os.path.join(proc, "stat")).splitlines():
+        if line.startswith(b"btime "):
+            return int(line.split()[1])
+    return 0
+
+
+def parse_stat(data):
+    # comm bisa berisi spasi/kurung, jadi potong di ')' terakhir
+    fields = data[data.rindex(b")") + 2:].split()
+    # fields[0] = field ke-3 (state) di proc(5)
+    return {
+        "minor_page_faults": int(fields[7]),
+        "major_page_faults": int(fields[9]),
+        "utime": int(fields[11]),
+        "stime": int(fields[12]),
+        "threads": int(fields[17]),
+        "starttime": int(fields[19]),
+        "rss_pages": int(fields[21]),
+    }
+
+
+STATUS_FIELDS = {
+    b"VmHWM": "max_rss_kb",
+    b"VmRSS": "rss_kb",
+    b"voluntary_ctxt_switches": "voluntary_context_switches",
+    b"nonvoluntary_ctxt_switches": "involuntary_context_switches",
+}
+
+
+def parse_status(data):
+    out = {}
+    for line in data.splitlines():
+        key, _, value = line.partition(b":")
+        field = STATUS_FIELDS.get(key)
+        if field:
+            out[field] = int(value.split()[0])
+            if len(out) == len(STATUS_FIELDS):
+                break
+    return out
+
+
+def parse_io(data):
+    out = {}
+    for line in data.splitlines():
+        key, _, value = line.partition(b":")
+        if key in (b"read_bytes", b"write_bytes"):
+            out[key.decode()] = int(value)
+    return out
+
+
+class ProcessWatcher:
+    """Pantau sekumpulan PID / nama proses lewat /proc.
+
+    Target bisa PID ("1234") atau nama ("monitor-app", "monitor_server.py"),
+    dicocokkan dengan comm atau basename argumen di cmdline. Tabel proses
+    hanya di-scan ulang tiap rescan_every tick atau saat ada PID yang hilang;
+    comm/cmdline per PID di-cache sampai PID tersebut hilang.
+    """
+
+    def __init__(self, targets, rescan_every=10, proc=PROC):
+        self.proc = proc
+        self.pids = {int(t) for t in targets if str(t).isdigit()}
+        self.names = {t for t in targets if not str(t).isdigit()}
+        self.rescan_every = rescan_every
+        self.boot_time = boot_time(proc)
+        self._ticks = 0
+        self._identity = {}   # pid -> (nama, kandidat nama dari comm/cmdline)
+        self._matched = set()
+        self._prev = {}       # pid -> (waktu, total tick CPU) untuk cpu_percent
+
+    def _identify(self, pid):
+        cached = self._identity.get(pid)
+        if cached is not None:
+            return cached
+        base = os.path.join(self.proc, str(pid))
+        comm = _read(os.path.join(base, "comm")).strip().decode("utf-8", "replace")
+        argv = _read(os.path.join(base, "cmdline")).split(b"\0")
+        candidates = {comm} | {os.path.basename(a.decode("utf-8", "replace")) for a in argv[:3] if a}
+        self._identity[pid] = (comm, candidates)
+        return self._identity[pid]
+
+    def _rescan(self):
+        live = {int(name) for name in os.listdir(self.proc) if name.isdigit()}
+        # Buang cache PID yang sudah mati (PID bisa dipakai ulang)
+        for pid in list(self._identity):
+            if pid not in live:
+                del self._identity[pid]
+        matched = set()
+        if self.names:
+            for pid in live:
+                try:
+                    _, candidates = self._identify(pid)
+                except OSError:
+                    continue
+                if candidates & self.names and pid != os.getpid():
+                    matched.add(pid)
+        self._matched = matched
+
+    def targets(self):
+        if self._ticks % self.rescan_every == 0:
+            self._rescan()
+        self._ticks += 1
+        return sorted(self._matched | self.pids)
+
+    def sample(self, now=None):
+        """Satu pass batch: stat + status + io untuk semua target."""
+        if now is None:
+            now = time.time()
+        rows = []
+        lost = False
+        for pid in self.targets():
+            base = os.path.join(self.proc, str(pid))
+            try:
+                stat = parse_stat(_read(os.path.join(base, "stat")))
+                status = parse_status(_read(os.path.join(base, "status")))
+                name = self._identify(pid)[0]
+            except OSError:
+                lost = True
+                self._prev.pop(pid, None)
+                continue
+
+            try:
+                io = parse_io(_read(os.path.join(base, "io")))
+            except OSError:
+                io = {}  # /proc/<pid>/io butuh izin yang sama dengan ptrace
+            try:
+                open_fds = len(os.listdir(os.path.join(base, "fd")))
+            except OSError:
+                open_fds = ""
+
+            cpu_ticks = stat["utime"] + stat["stime"]
+            prev = self._prev.get(pid)
+            cpu_percent = ""
+            if prev and now > prev[0]:
+                cpu_percent = round((cpu_ticks - prev[1]) / CLK_TCK / (now - prev[0]) * 100, 1)
+            self._prev[pid] = (now, cpu_ticks)
+
+            read_bytes = io.get("read_bytes", "")
+            write_bytes = io.get("write_bytes", "")
+            rows.append({
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+                "pid": pid,
+                "name": name,
+                "max_rss_kb": status.get("max_rss_kb", stat["rss_pages"] * PAGE_KB),
+                "rss_kb": status.get("rss_kb", stat["rss_pages"] * PAGE_KB),
+                "elapsed_sec": round(now - (self.boot_time + stat["starttime"] / CLK_TCK), 2),
+                "user_time_sec": round(stat["utime"] / CLK_TCK, 2),
+                "system_time_sec": round(stat["stime"] / CLK_TCK, 2),
+                "cpu_percent": cpu_percent,
+                "minor_page_faults": stat["minor_page_faults"],
+                "major_page_faults": stat["major_page_faults"],
+                "voluntary_context_switches": status.get("voluntary_context_switches", ""),
+                "involuntary_context_switches": status.get("involuntary_context_switches", ""),
+                # Satuan sama dengan /usr/bin/time -v: blok 512 byte
+                "file_system_inputs": read_bytes // 512 if read_bytes != "" else "",
+                "file_system_outputs": write_bytes // 512 if write_bytes != "" else "",
+                "read_bytes": read_bytes,
+                "write_bytes": write_bytes,
+                "open_fds": open_fds,
+                "threads": stat["threads"],
+            })
+
+        if lost:
+            # Paksa rescan di tick berikutnya supaya proses yang restart ketemu lagi
+            self._ticks = 0
+        return rows
@@ -0,0 +1,87 @@
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Span instrumentasi untuk mode --log. Aktif hanya kalau MONITOR_SPAN_LOG
+# di-set (path file JSON Lines). Satu baris = satu fase, ditulis dengan satu
+# write() O_APPEND seperti metric_log.py. Span root ("log") membawa getrusage
+# proses, jadi analysis-tools/parse_logs.py bisa membacanya dengan skema yang
+# sama dengan /usr/bin/time -v.
+SPAN_LOG = os.getenv("MONITOR_SPAN_LOG", "")
+APP_NAME = "python"
+
+
+def rusage_fields():
+    r = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "max_rss_kb": r.ru_maxrss,
+        "user_time_sec": round(r.ru_utime, 3),
+        "system_time_sec": round(r.ru_stime, 3),
+        "minor_page_faults": r.ru_minflt,
+        "major_page_faults": r.ru_majflt,
+        "voluntary_context_switches": r.ru_nvcsw,
+        "involuntary_context_switches": r.ru_nivcsw,
+        "file_system_inputs": r.ru_inblock,
+        "file_system_outputs": r.ru_oublock,
+    }
+
+
+def write_span(record, path=None):
+    path = path or SPAN_LOG
+    data = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+class Tracer:
+    """Kumpulan span satu kali jalan; finish() menulis span root."""
+
+    def __init__(self, name, path=None):
+        self.name = name
+        self.path = path or SPAN_LOG
+        self.started = time.time()
+        self.clock = time.perf_counter()
+        self.trace = f"{os.getpid()}-{int(self.started * 1000)}"
+
+    def _record(self, name, started, clock, parent):
+        return {
+            "ts": datetime.fromtimestamp(started).strftime("%Y-%m-%d %H:%M:%S"),
+            "trace": self.trace,
+            "app": APP_NAME,
+            "cmd": " ".join(sys.argv),
+            "span": name,
+            "parent": parent,
+            "dur_ms": round((time.perf_counter() - clock) * 1000, 3),
+        }
+
+    def start(self, name):
+        """Mulai span tanpa blok with; panggil fungsi hasilnya untuk menutup."""
+        started, clock = time.time(), time.perf_counter()
+
+        def done():
+            if self.path:
+                write_span(self._record(name, started, clock, self.name), self.path)
+        return done
+
+    @contextmanager
+    def span(self, name):
+        done = self.start(name)
+        try:
+            yield
+        finally:
+            done()
+
+    def finish(self, exit_status=0):
+        if not self.path:
+            return
+        record = self._record(self.name, self.started, self.clock, None)
+        record["exit_status"] = exit_status
+        record["rusage"] = rusage_fields()
+        write_span(record, self.path)
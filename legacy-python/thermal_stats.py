@@ -0,0 +1,232 @@
+import glob
+import json
+import os
+import shutil
+import subprocess
+import time
+
+from io_stats import boot_time
+
+CPU_DIR = "/sys/devices/system/cpu"
+THERMAL_DIR = "/sys/class/thermal"
+# Raspberry Pi: bitmask firmware, sama dengan "vcgencmd get_throttled"
+RPI_THROTTLED = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+RPI_FLAGS = {0: "under_voltage", 1: "freq_capped", 2: "throttled", 3: "soft_temp_limit"}
+# Bit 16-19: kondisi yang sama pernah terjadi sejak boot
+RPI_SINCE_BOOT_SHIFT = 16
+
+# Format panjang, ditulis ke segment terpisah (lihat metric_log.append_record):
+#   zone     <type zona>   temp_c        suhu
+#   freq     <policy>      <MHz>         detik di frekuensi itu selama interval
+#   freq     <policy>      avg_mhz       rata-rata berbobot waktu
+#   freq     <policy>      max_mhz       cpuinfo_max_freq (frekuensi penuh)
+#   throttle rpi|x86|<policy> <flag>     1/0 atau jumlah kejadian selama interval
+THERMAL_COLUMNS = ["timestamp", "kind", "source", "key", "value"]
+
+# time_in_state dalam satuan 10 ms (USER_HZ)
+TIME_IN_STATE_HZ = 100
+
+# Di bawah 95% cpuinfo_max_freq dihitung "frekuensi turun" (ondemand sesekali turun satu step)
+FULL_FREQ_RATIO = 0.95
+
+
+def _read_text(path):
+    with open(path, "r") as f:
+        return f.read().strip()
+
+
+def _read_int(path):
+    try:
+        return int(_read_text(path))
+    except (OSError, ValueError):
+        return None
+
+
+def read_zones(thermal_dir=THERMAL_DIR):
+    """type zona -> °C untuk semua thermal_zone* yang bisa dibaca."""
+    zones = {}
+    for path in sorted(glob.glob(os.path.join(thermal_dir, "thermal_zone*"))):
+        millideg = _read_int(os.path.join(path, "temp"))
+        if millideg is None:
+            continue  # Zona tanpa sensor aktif (EIO/ENODATA)
+        try:
+            name = _read_text(os.path.join(path, "type"))
+        except OSError:
+            name = os.path.basename(path)
+        # Beberapa board punya dua zona dengan type sama
+        key = name if name not in zones else f"{name}-{os.path.basename(path)[len('thermal_zone'):]}"
+        zones[key] = round(millideg / 1000.0, 1)
+    return zones
+
+
+def parse_time_in_state(text):
+    """"600000 1234\\n1500000 99\\n" -> {kHz: tick}"""
+    out = {}
+    for line in text.splitlines():
+        f = line.split()
+        if len(f) == 2:
+            out[f[0]] = int(f[1])
+    return out
+
+
+def read_policies(cpu_dir=CPU_DIR):
+    """policy -> frekuensi sekarang/maks (kHz), core, dan time_in_state kalau ada.
+
+    Core dalam satu policy berbagi clock (Pi 4: cpu0-3 satu policy), jadi
+    frekuensi per core dibaca per policy, bukan diulang per cpuN.
+    """
+    policies = {}
+    for path in sorted(glob.glob(os.path.join(cpu_dir, "cpufreq", "policy*"))):
+        cur = _read_int(os.path.join(path, "scaling_cur_freq"))
+        if cur is None:
+            continue
+        try:
+            cpus = _read_text(os.path.join(path, "related_cpus")).split()
+        except OSError:
+            cpus = []
+        try:
+            states = parse_time_in_state(_read_text(os.path.join(path, "stats", "time_in_state")))
+        except OSError:
+            states = None  # Kernel tanpa CONFIG_CPU_FREQ_STAT
+        policies[os.path.basename(path)] = {
+            "cpus": len(cpus) or 1,
+            "cur": cur,
+            "max": _read_int(os.path.join(path, "cpuinfo_max_freq")),
+            "limit": _read_int(os.path.join(path, "scaling_max_freq")),
+            "states": states,
+        }
+    return policies
+
+
+def read_rpi_throttled(path=RPI_THROTTLED):
+    """Bitmask get_throttled dari sysfs, atau vcgencmd; None kalau bukan Pi."""
+    try:
+        return int(_read_text(path), 16)
+    except (OSError, ValueError):
+        pass
+    if not shutil.which("vcgencmd"):
+        return None
+    try:
+        out = subprocess.run(["vcgencmd", "get_throttled"], capture_output=True, text=True, timeout=2).stdout
+        return int(out.strip().split("=")[1], 16)
+    except (OSError, subprocess.SubprocessError, IndexError, ValueError):
+        return None
+
+
+def read_x86_throttle(cpu_dir=CPU_DIR):
+    """Jumlah kumulatif throttle termal (core & package) semua CPU; {} kalau tidak ada."""
+    totals = {}
+    for name in ("core_throttle_count", "package_throttle_count"):
+        values = [_read_int(p) for p in glob.glob(os.path.join(cpu_dir, "cpu[0-9]*", "thermal_throttle", name))]
+        values = [v for v in values if v is not None]
+        if values:
+            totals[name[:-len("_count")]] = sum(values)
+    return totals
+
+
+def mhz(khz):
+    return khz / 1000.0
+
+
+class ThermalSampler:
+    """Suhu semua zona, frekuensi CPU per policy dan indikator throttling per interval.
+
+    Histogram waktu-per-frekuensi diambil dari selisih time_in_state
+    (kumulatif), jadi run --log sekali per jam tetap melihat seluruh jam
+    itu, bukan hanya saat sampel diambil. Tanpa time_in_state, frekuensi
+    saat sampel dianggap berlaku untuk seluruh interval.
+
+    Counter sebelumnya disimpan di state file seperti IOCounters.
+    """
+
+    def __init__(self, cpu_dir=CPU_DIR, thermal_dir=THERMAL_DIR, rpi_path=RPI_THROTTLED):
+        self.cpu_dir = cpu_dir
+        self.thermal_dir = thermal_dir
+        self.rpi_path = rpi_path
+        self.prev = None
+
+    def read(self, now=None):
+        return {
+            "time": time.time() if now is None else now,
+            "btime": boot_time(),
+            "policies": read_policies(self.cpu_dir),
+            "x86": read_x86_throttle(self.cpu_dir),
+        }
+
+    def sample(self, now=None):
+        """([CPU_MHz, Throttled] untuk log utama, baris THERMAL_COLUMNS)
+
+        Kolom yang tidak bisa diukur di host ini dikosongkan.
+        """
+        cur = self.read(now)
+        prev, self.prev = self.prev, cur
+        valid = prev and prev["btime"] == cur["btime"] and cur["time"] > prev["time"]
+        dt = cur["time"] - prev["time"] if valid else 0
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cur["time"]))
+        rows = [[stamp, "zone", name, "temp_c", temp] for name, temp in read_zones(self.thermal_dir).items()]
+
+        weighted = cpus = 0
+        throttled = None
+        for name, policy in cur["policies"].items():
+            histogram = {}
+            old = prev["policies"].get(name) if valid else None
+            if old and policy["states"] is not None and old["states"] is not None:
+                for khz, ticks in policy["states"].items():
+                    delta = ticks - old["states"].get(khz, 0)
+                    if delta > 0:
+                        histogram[khz] = delta / TIME_IN_STATE_HZ
+            elif valid:
+                histogram = {str(policy["cur"]): dt}
+
+            for khz, seconds in sorted(histogram.items(), key=lambda item: int(item[0])):
+                rows.append([stamp, "freq", name, f"{mhz(int(khz)):.0f}", round(seconds, 2)])
+            total = sum(histogram.values())
+            if total:
+                avg = sum(mhz(int(khz)) * s for khz, s in histogram.items()) / total
+            else:
+                avg = mhz(policy["cur"])  # Sampel pertama: frekuensi saat ini
+            rows.append([stamp, "freq", name, "avg_mhz", round(avg, 1)])
+            if policy["max"]:
+                rows.append([stamp, "freq", name, "max_mhz", round(mhz(policy["max"]), 1)])
+                # Batas scaling diturunkan di bawah maks hardware (cooling device / thermal governor)
+                capped = int(policy["limit"] is not None and policy["limit"] < policy["max"])
+                rows.append([stamp, "throttle", name, "freq_limited", capped])
+                throttled = max(throttled or 0, capped)
+            weighted += avg * policy["cpus"]
+            cpus += policy["cpus"]
+
+        bits = read_rpi_throttled(self.rpi_path)
+        if bits is not None:
+            for bit, flag in RPI_FLAGS.items():
+                rows.append([stamp, "throttle", "rpi", flag, (bits >> bit) & 1])
+            rows.append([stamp, "throttle", "rpi", "since_boot", int(bool(bits >> RPI_SINCE_BOOT_SHIFT))])
+            # Under-voltage saja belum memperlambat CPU; kalau iya, firmware ikut set bit 1
+            throttled = max(throttled or 0, int(bool(bits & 0xE)))
+
+        if cur["x86"]:
+            for name, count in cur["x86"].items():
+                events = count - prev["x86"].get(name, count) if valid else 0
+                rows.append([stamp, "throttle", "x86", name, max(0, events)])
+                throttled = max(throttled or 0, int(events > 0))
+
+        totals = [round(weighted / cpus, 1) if cpus else "", "" if throttled is None else throttled]
+        return totals, rows
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        sampler = cls(**kwargs)
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+            sampler.prev = {key: state[key] for key in ("time", "btime", "policies", "x86")}
+        except (OSError, ValueError, KeyError):
+            pass
+        return sampler
+
+    def save(self, path):
+        if self.prev is None:
+            return
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.prev, f)
+        os.replace(tmp, path)
@@ -0,0 +1,301 @@
+package main
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"math"
+	"os"
+	"path"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"strings"
+	"syscall"
+	"time"
+)
+
+// Rate disk & network per interval dari counter kumulatif /proc/diskstats dan
+// /proc/net/dev, format sama dengan legacy-python/io_stats.py. Counter
+// sebelumnya disimpan di state file supaya mode --log (sekali jalan per jam)
+// tetap dapat rate rata-rata sejak run sebelumnya.
+const (
+	ioStateFile  = "io_counters_go.json"
+	ioSegmentDir = "io-segments-go"
+	sectorBytes  = 512 // /proc/diskstats selalu dalam sektor 512 byte
+	sysBlockDir  = "/sys/class/block"
+)
+
+// ioColumns: disk in = read, out = write; net in = rx, out = tx
+var ioColumns = []string{"timestamp", "kind", "device", "in_bytes_per_sec", "out_bytes_per_sec",
+	"in_ops_per_sec", "out_ops_per_sec", "busy_percent"}
+
+type ioSnapshot struct {
+	Time  float64             `json:"time"`
+	Btime int64               `json:"btime"`
+	Disk  map[string][]uint64 `json:"disk"` // reads, sectors_read, writes, sectors_written, io_ms
+	Net   map[string][]uint64 `json:"net"`  // rx_bytes, rx_packets, tx_bytes, tx_packets
+}
+
+type ioFilter struct {
+	include []string
+	exclude []string
+}
+
+// parseIOFilter: "sd*,mmcblk0p2,-loop*"; include kosong = semua
+func parseIOFilter(spec string) ioFilter {
+	var f ioFilter
+	for _, item := range strings.Split(spec, ",") {
+		item = strings.TrimSpace(item)
+		if strings.HasPrefix(item, "-") {
+			f.exclude = append(f.exclude, item[1:])
+		} else if item != "" {
+			f.include = append(f.include, item)
+		}
+	}
+	return f
+}
+
+func matchAny(name string, patterns []string) bool {
+	for _, p := range patterns {
+		if ok, _ := path.Match(p, name); ok {
+			return true
+		}
+	}
+	return false
+}
+
+func (f ioFilter) selected(name string) bool {
+	if matchAny(name, f.exclude) {
+		return false
+	}
+	return len(f.include) == 0 || matchAny(name, f.include)
+}
+
+// counterDelta menangani counter yang wrap (unsigned long 32-bit di kernel 32-bit)
+func counterDelta(prev, cur uint64) uint64 {
+	if cur >= prev {
+		return cur - prev
+	}
+	if prev < 1<<32 {
+		return cur + (1 << 32) - prev
+	}
+	return cur - prev // wrap 64-bit: aritmetika uint64 sudah modulo 2^64
+}
+
+func readBootTime() int64 {
+	data, err := os.ReadFile("/proc/stat")
+	if err != nil {
+		return 0
+	}
+	for _, line := range strings.Split(string(data), "\n") {
+		if strings.HasPrefix(line, "btime ") {
+			v, _ := strconv.ParseInt(strings.TrimSpace(line[6:]), 10, 64)
+			return v
+		}
+	}
+	return 0
+}
+
+func parseUints(fields []string, idx ...int) []uint64 {
+	out := make([]uint64, len(idx))
+	for i, j := range idx {
+		out[i], _ = strconv.ParseUint(fields[j], 10, 64)
+	}
+	return out
+}
+
+// mountedDevices: "major:minor" semua filesystem yang di-mount dari /dev
+// (lewat st_dev mount point, jadi /dev/root dan /dev/mapper/* ikut ketemu)
+func mountedDevices() map[string]bool {
+	numbers := map[string]bool{}
+	data, err := os.ReadFile("/proc/self/mounts")
+	if err != nil {
+		return numbers
+	}
+	for _, line := range strings.Split(string(data), "\n") {
+		f := strings.Fields(line)
+		if len(f) < 2 || !strings.HasPrefix(f[0], "/dev/") {
+			continue
+		}
+		var st syscall.Stat_t
+		if syscall.Stat(strings.ReplaceAll(f[1], "\\040", " "), &st) != nil {
+			continue
+		}
+		dev := uint64(st.Dev)
+		major := (dev>>8)&0xfff | (dev>>32)&^0xfff
+		minor := dev&0xff | (dev>>12)&^0xff
+		numbers[fmt.Sprintf("%d:%d", major, minor)] = true
+	}
+	return numbers
+}
+
+// partitionParent: disk induk sebuah partisi (sda1 -> sda, mmcblk0p2 -> mmcblk0);
+// "" kalau bukan partisi. Di sysfs "/" pada nama device (cciss/c0d0) ditulis "!".
+func partitionParent(name string) string {
+	dir := filepath.Join(sysBlockDir, strings.ReplaceAll(name, "/", "!"))
+	if _, err := os.Stat(filepath.Join(dir, "partition")); err != nil {
+		return ""
+	}
+	// /sys/class/block/sda1 -> .../block/sda/sda1
+	real, err := filepath.EvalSymlinks(dir)
+	if err != nil {
+		return ""
+	}
+	return strings.ReplaceAll(filepath.Base(filepath.Dir(real)), "!", "/")
+}
+
+func readIOSnapshot(disks, nets ioFilter) ioSnapshot {
+	snap := ioSnapshot{
+		Time:  float64(time.Now().UnixNano()) / 1e9,
+		Btime: readBootTime(),
+		Disk:  map[string][]uint64{},
+		Net:   map[string][]uint64{},
+	}
+
+	var mounted map[string]bool
+	if len(disks.include) == 0 {
+		mounted = mountedDevices()
+	}
+	if data, err := os.ReadFile("/proc/diskstats"); err == nil {
+		for _, line := range strings.Split(string(data), "\n") {
+			f := strings.Fields(line)
+			if len(f) < 14 {
+				continue
+			}
+			if mounted != nil && !mounted[f[0]+":"+f[1]] {
+				continue
+			}
+			if disks.selected(f[2]) {
+				snap.Disk[f[2]] = parseUints(f, 3, 5, 7, 9, 12)
+			}
+		}
+	}
+
+	if data, err := os.ReadFile("/proc/net/dev"); err == nil {
+		scanner := bufio.NewScanner(bytes.NewReader(data))
+		for scanner.Scan() {
+			name, rest, ok := strings.Cut(scanner.Text(), ":")
+			f := strings.Fields(rest)
+			if !ok || len(f) < 10 {
+				continue
+			}
+			name = strings.TrimSpace(name)
+			if nets.selected(name) {
+				snap.Net[name] = parseUints(f, 0, 1, 8, 9)
+			}
+		}
+	}
+	return snap
+}
+
+func loadIOSnapshot() *ioSnapshot {
+	data, err := os.ReadFile(ioStateFile)
+	if err != nil {
+		return nil
+	}
+	var snap ioSnapshot
+	if json.Unmarshal(data, &snap) != nil {
+		return nil
+	}
+	return &snap
+}
+
+func saveIOSnapshot(snap ioSnapshot) {
+	data, err := json.Marshal(snap)
+	if err != nil {
+		return
+	}
+	tmp := ioStateFile + ".tmp"
+	if os.WriteFile(tmp, data, 0644) == nil {
+		_ = os.Rename(tmp, ioStateFile)
+	}
+}
+
+func roundStr(v float64, digits int) string {
+	p := math.Pow(10, float64(digits))
+	return strconv.FormatFloat(math.Round(v*p)/p, 'f', -1, 64)
+}
+
+func sortedKeys(m map[string][]uint64) []string {
+	keys := make([]string, 0, len(m))
+	for k := range m {
+		keys = append(keys, k)
+	}
+	sort.Strings(keys)
+	return keys
+}
+
+// sampleIO mengembalikan total untuk kolom DiskR_MBps..NetTX_Mbps (kosong di
+// sampel pertama / setelah reboot) dan baris detail per device (ioColumns).
+func sampleIO() ([]string, [][]string) {
+	disks := parseIOFilter(os.Getenv("IO_DISKS"))
+	netSpec, ok := os.LookupEnv("IO_INTERFACES")
+	if !ok {
+		netSpec = "-lo" // default: semua interface kecuali loopback
+	}
+	cur := readIOSnapshot(disks, parseIOFilter(netSpec))
+	prev := loadIOSnapshot()
+	saveIOSnapshot(cur)
+
+	empty := []string{"", "", "", "", ""}
+	if prev == nil || prev.Btime != cur.Btime || cur.Time <= prev.Time {
+		return empty, nil
+	}
+	dt := cur.Time - prev.Time
+	stamp := time.Now().Format("2006-01-02 15:04:05")
+
+	var rows [][]string
+	var readB, writeB, ops float64
+	// Filter seperti "sd*" memilih sda dan sda1: I/O partisi sudah termasuk di disk induknya
+	nested := map[string]bool{}
+	for name := range cur.Disk {
+		if _, ok := cur.Disk[partitionParent(name)]; ok {
+			nested[name] = true
+		}
+	}
+	for _, name := range sortedKeys(cur.Disk) {
+		p, ok := prev.Disk[name]
+		if !ok || len(p) != 5 {
+			continue
+		}
+		c := cur.Disk[name]
+		reads, sectorsR := float64(counterDelta(p[0], c[0])), float64(counterDelta(p[1], c[1]))
+		writes, sectorsW := float64(counterDelta(p[2], c[2])), float64(counterDelta(p[3], c[3]))
+		busy := math.Min(100, float64(counterDelta(p[4], c[4]))/(dt*10))
+		rows = append(rows, []string{stamp, "disk", name,
+			roundStr(sectorsR*sectorBytes/dt, 1), roundStr(sectorsW*sectorBytes/dt, 1),
+			roundStr(reads/dt, 2), roundStr(writes/dt, 2), roundStr(busy, 1)})
+		if nested[name] {
+			continue // Tetap ada di baris detail, tidak dihitung dua kali di total
+		}
+		readB += sectorsR * sectorBytes
+		writeB += sectorsW * sectorBytes
+		ops += reads + writes
+	}
+
+	var rxB, txB float64
+	for _, name := range sortedKeys(cur.Net) {
+		p, ok := prev.Net[name]
+		if !ok || len(p) != 4 {
+			continue
+		}
+		c := cur.Net[name]
+		rx, rxPkt := float64(counterDelta(p[0], c[0])), float64(counterDelta(p[1], c[1]))
+		tx, txPkt := float64(counterDelta(p[2], c[2])), float64(counterDelta(p[3], c[3]))
+		rows = append(rows, []string{stamp, "net", name, roundStr(rx/dt, 1), roundStr(tx/dt, 1),
+			roundStr(rxPkt/dt, 2), roundStr(txPkt/dt, 2), ""})
+		rxB += rx
+		txB += tx
+	}
+
+	totals := []string{
+		roundStr(readB/dt/(1024*1024), 3),
+		roundStr(writeB/dt/(1024*1024), 3),
+		roundStr(ops/dt, 2),
+		roundStr(rxB*8/dt/1e6, 3),
+		roundStr(txB*8/dt/1e6, 3),
+	}
+	return totals, rows
+}
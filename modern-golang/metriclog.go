@@ -0,0 +1,164 @@
+package main
+
+import (
+	"bytes"
+	"encoding/csv"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+)
+
+// Log harian disimpan sebagai segment per jam. Writer hanya melakukan satu
+// write O_APPEND per record, report mengklaim segment yang sudah tertutup
+// lewat rename atomik, jadi tidak perlu lock dan tidak ada baris yang hilang.
+const (
+	segmentDir    = "segments-go"
+	legacyLogFile = "daily_log_go.csv"
+	segmentSpan   = time.Hour
+	segmentSettle = time.Minute
+	segmentPrefix = "segment-"
+	segmentLayout = "20060102-150405"
+)
+
+func segmentName(t time.Time) string {
+	return segmentPrefix + t.Truncate(segmentSpan).Format(segmentLayout) + ".csv"
+}
+
+func segmentStart(name string) (time.Time, bool) {
+	if len(name) <= len(segmentPrefix)+len(".csv") || filepath.Ext(name) != ".csv" || name[:len(segmentPrefix)] != segmentPrefix {
+		return time.Time{}, false
+	}
+	stamp := name[len(segmentPrefix) : len(name)-len(".csv")]
+	t, err := time.ParseInLocation(segmentLayout, stamp, time.Local)
+	if err != nil {
+		return time.Time{}, false
+	}
+	return t, true
+}
+
+func appendRecord(record []string) (string, error) {
+	return appendRecordTo(segmentDir, record)
+}
+
+// appendRecordTo sama dengan appendRecord, untuk segment di folder lain (mis. io-segments-go).
+func appendRecordTo(dir string, record []string) (string, error) {
+	var buf bytes.Buffer
+	w := csv.NewWriter(&buf)
+	if err := w.Write(record); err != nil {
+		return "", err
+	}
+	w.Flush()
+	if err := w.Error(); err != nil {
+		return "", err
+	}
+
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return "", err
+	}
+	path := filepath.Join(dir, segmentName(time.Now()))
+
+	file, err := os.OpenFile(path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	if err != nil {
+		return "", err
+	}
+	defer file.Close()
+
+	n, err := file.Write(buf.Bytes())
+	if err != nil {
+		return "", err
+	}
+	if n != buf.Len() {
+		return "", fmt.Errorf("penulisan record tidak lengkap (%d/%d byte)", n, buf.Len())
+	}
+	return path, nil
+}
+
+func listSegments(dir string) []string {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return nil
+	}
+	paths := []string{}
+	for _, e := range entries {
+		if _, ok := segmentStart(e.Name()); ok && !e.IsDir() {
+			paths = append(paths, filepath.Join(dir, e.Name()))
+		}
+	}
+	sort.Strings(paths)
+	return paths
+}
+
+// claimClosedSegments memindahkan segment yang jamnya sudah lewat ke closed/
+// dan mengembalikan semua segment di closed/ yang belum dilaporkan.
+func claimClosedSegments(now time.Time) ([]string, error) {
+	return claimClosedSegmentsIn(segmentDir, now)
+}
+
+func claimClosedSegmentsIn(dir string, now time.Time) ([]string, error) {
+	closedDir := filepath.Join(dir, "closed")
+	if err := os.MkdirAll(closedDir, 0755); err != nil {
+		return nil, err
+	}
+
+	// File log lama (sebelum ada segment) ikut diklaim sekali
+	if info, err := os.Stat(legacyLogFile); err == nil && dir == segmentDir {
+		name := segmentPrefix + info.ModTime().Format(segmentLayout) + ".csv"
+		_ = os.Rename(legacyLogFile, filepath.Join(closedDir, name))
+	}
+
+	for _, path := range listSegments(dir) {
+		start, _ := segmentStart(filepath.Base(path))
+		if start.Add(segmentSpan + segmentSettle).After(now) {
+			continue
+		}
+		// Error diabaikan: bisa jadi sudah diklaim proses report lain
+		_ = os.Rename(path, filepath.Join(closedDir, filepath.Base(path)))
+	}
+
+	return listSegments(closedDir), nil
+}
+
+func readSegmentRows(paths []string) ([][]string, error) {
+	rows := [][]string{}
+	for _, path := range paths {
+		file, err := os.Open(path)
+		if err != nil {
+			return nil, err
+		}
+		reader := csv.NewReader(file)
+		reader.FieldsPerRecord = -1 // File lama bisa punya 7 atau 8 kolom
+		records, err := reader.ReadAll()
+		file.Close()
+		if err != nil {
+			return nil, err
+		}
+
+		for _, record := range records {
+			// Header hanya ada di file log lama
+			if len(record) >= 7 && record[0] != "Jam" {
+				rows = append(rows, record)
+			}
+		}
+	}
+	return rows, nil
+}
+
+// markReported menyimpan segment yang sudah dilaporkan di reported/ (tidak dihapus).
+func markReported(paths []string) {
+	markReportedIn(segmentDir, paths)
+}
+
+func markReportedIn(dir string, paths []string) {
+	reportedDir := filepath.Join(dir, "reported")
+	if err := os.MkdirAll(reportedDir, 0755); err != nil {
+		fmt.Println("⚠️  Gagal membuat folder reported:", err)
+		return
+	}
+	for _, path := range paths {
+		if err := os.Rename(path, filepath.Join(reportedDir, filepath.Base(path))); err != nil {
+			fmt.Println("⚠️  Gagal memindahkan segment:", err)
+		}
+	}
+}
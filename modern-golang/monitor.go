@@ -1,7 +1,6 @@
 package main
 
 import (
-        "encoding/csv"
         "fmt"
         "log"
         "math"
@@ -32,14 +31,21 @@ func getCPUTemp() float64 {
 }
 
 func runMonitor() {
+        tr := newTracer("log")
+
+        done := tr.span("hardware")
         v, _ := mem.VirtualMemory()
         c, _ := cpu.Percent(time.Second, false)
         d, _ := disk.Usage("/")
         cpuTemp := getCPUTemp()
+        // Rate I/O pasif sejak run --log sebelumnya (lihat iostat.go)
+        ioTotals, ioRows := sampleIO()
+        done()
 
         var downloadSpeed, uploadSpeed float64
         var pingLatency int64
 
+        done = tr.span("speedtest")
         st := speedtest.New()
         serverList, err := st.FetchServers()
         if err == nil {
@@ -56,6 +62,7 @@ func runMonitor() {
                         }
                 }
         }
+        done()
 
         // Bersihkan layar terminal biar enak dilihat
         fmt.Print("\033[H\033[2J")
@@ -71,32 +78,16 @@ func runMonitor() {
         fmt.Printf("🌡️  CPU Temp     : %.1f°C\n", cpuTemp)
         fmt.Printf("🧠 RAM Usage    : %.2f / %.2f GB (%.1f%%)\n", ramUsed, ramTotal, v.UsedPercent)
         fmt.Printf("💾 Disk Usage   : %.2f / %.2f GB (%.1f%%)\n", diskUsed, diskTotal, d.UsedPercent)
+        if ioTotals[0] != "" {
+                fmt.Printf("📀 Disk I/O     : R %s / W %s MB/s, %s IOPS\n", ioTotals[0], ioTotals[1], ioTotals[2])
+                fmt.Printf("🔌 Network I/O  : RX %s / TX %s Mbps\n", ioTotals[3], ioTotals[4])
+        }
         fmt.Println("--------------------------------------------------")
         fmt.Printf("📡 Ping         : %d ms\n", pingLatency)
         fmt.Printf("⬇️  Download     : %.2f Mbps\n", downloadSpeed)
         fmt.Printf("⬆️  Upload       : %.2f Mbps\n", uploadSpeed)
         fmt.Println("==================================================")
 
-        // Nama file kita bedakan dulu biar tidak menimpa log Python
-        filename := "daily_log_go.csv"
-
-        // Buka file dengan mode: APPEND (tambah bawah), CREATE (bikin kalau belum ada), WRONLY (tulis saja)
-        file, err := os.OpenFile(filename, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
-        if err != nil {
-                log.Fatalf("Gagal membuka file CSV: %s", err)
-        }
-        defer file.Close()
-
-        writer := csv.NewWriter(file)
-        defer writer.Flush()
-
-        // Cek apakah file kosong? Kalau kosong, tulis Header dulu
-        fileInfo, _ := file.Stat()
-        if fileInfo.Size() == 0 {
-                header := []string{"Jam", "CPU_%", "Suhu_C", "RAM_GB", "Ping_ms", "DL_Mbps", "UL_Mbps"}
-                writer.Write(header)
-        }
-
         // Siapkan data baris baru (format sama dengan Python)
         jam := time.Now().Format("15:04")
         record := []string{
@@ -107,12 +98,24 @@ func runMonitor() {
                 fmt.Sprintf("%.1f", float64(pingLatency)),  // Ping_ms
                 fmt.Sprintf("%.2f", downloadSpeed),  // DL_Mbps
                 fmt.Sprintf("%.2f", uploadSpeed),  // UL_Mbps
+                fmt.Sprintf("%.1f", d.UsedPercent),  // Disk_%
         }
+        record = append(record, ioTotals...) // DiskR_MBps, DiskW_MBps, Disk_IOPS, NetRX_Mbps, NetTX_Mbps
 
-        // Tulis data
-        if err := writer.Write(record); err != nil {
+        // Tulis data: satu record = satu write O_APPEND ke segment per jam (lihat metriclog.go)
+        done = tr.span("write")
+        path, err := appendRecord(record)
+        if err != nil {
                 log.Fatalln("Gagal menulis record ke CSV:", err)
         }
+        for _, row := range ioRows {
+                if _, err := appendRecordTo(ioSegmentDir, row); err != nil {
+                        log.Println("Gagal menulis detail I/O:", err)
+                        break
+                }
+        }
+        done()
+        tr.finish(0)
 
-        fmt.Printf("✅ Data berhasil disimpan ke %s\n", filename)
+        fmt.Printf("✅ Data berhasil disimpan ke %s\n", path)
 }
\ No newline at end of file
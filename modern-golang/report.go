@@ -2,12 +2,12 @@ package main
 
 import (
 	"bytes"
-	"encoding/csv"
 	"fmt"
 	"io"
 	"mime/multipart"
 	"net/http"
 	"os"
+	"sort"
 	"strconv"
 	"time"
 
@@ -51,35 +51,33 @@ func getStorageInfo() (totalGB, usedGB, percent float64) {
 func runReport() {
 	fmt.Println("1. Membaca Data Log Harian...")
 
-	// 1. BACA DATA LOG HARIAN
-	filenameCSV := "daily_log_go.csv"
-	dataRows := [][]string{}
-
-	if _, err := os.Stat(filenameCSV); err == nil {
-		file, err := os.Open(filenameCSV)
-		if err != nil {
-			fmt.Println("❌ Error: Tidak bisa membuka file CSV")
-			return
-		}
-		defer file.Close()
+	// 1. BACA DATA LOG HARIAN (snapshot segment yang sudah tertutup, segment aktif tidak disentuh)
+	segments, err := claimClosedSegments(time.Now())
+	if err != nil {
+		fmt.Println("❌ Error: Gagal mengklaim segment log:", err)
+		return
+	}
 
-		reader := csv.NewReader(file)
-		records, err := reader.ReadAll()
-		if err != nil {
-			fmt.Println("❌ Error: Gagal membaca CSV:", err)
-			return
-		}
+	dataRows, err := readSegmentRows(segments)
+	if err != nil {
+		fmt.Println("❌ Error: Gagal membaca CSV:", err)
+		return
+	}
 
-		// Skip header
-		for i := 1; i < len(records); i++ {
-			if len(records[i]) >= 7 {
-				dataRows = append(dataRows, records[i])
-			}
-		}
+	// Detail I/O per device (segment terpisah, lihat iostat.go)
+	ioSegments, err := claimClosedSegmentsIn(ioSegmentDir, time.Now())
+	if err != nil {
+		fmt.Println("⚠️  Gagal mengklaim segment I/O:", err)
 	}
+	ioRows, _ := readSegmentRows(ioSegments)
 
 	// Hitung Rata-rata
 	var avgCPU, avgTemp, avgRAM, avgPing, avgDL, avgUL float64
+	// Kolom 8..12: DiskR_MBps, DiskW_MBps, Disk_IOPS, NetRX_Mbps, NetTX_Mbps (kosong di baris lama)
+	avgIO := make([]float64, 5)
+	for i := range avgIO {
+		avgIO[i] = meanColumn(dataRows, 8+i)
+	}
 	storageTotal, storageUsed, storagePercent := getStorageInfo()
 
 	if len(dataRows) > 0 {
@@ -159,6 +157,11 @@ func runReport() {
 	pdf.CellFormat(60, 8, tr(fmt.Sprintf("Download: %.1f Mbps", avgDL)), "1", 0, "L", false, 0, "")
 	pdf.CellFormat(60, 8, tr(fmt.Sprintf("Upload: %.1f Mbps", avgUL)), "1", 0, "L", false, 0, "")
 	pdf.CellFormat(70, 8, tr(fmt.Sprintf("Ping: %.0f ms", avgPing)), "1", 1, "L", false, 0, "")
+
+	// Baris 4: I/O pasif dari /proc (bukan speedtest)
+	pdf.CellFormat(60, 8, fmt.Sprintf("Disk R/W: %.2f/%.2f MB/s", avgIO[0], avgIO[1]), "1", 0, "L", false, 0, "")
+	pdf.CellFormat(60, 8, fmt.Sprintf("Disk IOPS: %.1f", avgIO[2]), "1", 0, "L", false, 0, "")
+	pdf.CellFormat(70, 8, fmt.Sprintf("Net RX/TX: %.2f/%.2f Mbps", avgIO[3], avgIO[4]), "1", 1, "L", false, 0, "")
 	pdf.Ln(8)
 
 	// --- BAGIAN 2: TABEL DETAIL ---
@@ -206,8 +209,13 @@ func runReport() {
 		pdf.CellFormat(w_ul, 8, row[6]+" Mbps", "1", 1, "C", false, 0, "")
 	}
 
+	// --- BAGIAN 3: I/O PER DEVICE ---
+	if len(ioRows) > 0 {
+		writeIOTable(pdf, ioRows)
+	}
+
 	// Output File
-	err := pdf.OutputFileAndClose(dynamicFilename)
+	err = pdf.OutputFileAndClose(dynamicFilename)
 	if err != nil {
 		fmt.Println("❌ Gagal membuat PDF:", err)
 		return
@@ -219,10 +227,86 @@ func runReport() {
 
 	// Bersih-bersih
 	os.Remove(dynamicFilename)
-	// os.Remove(filenameCSV) // Optional: Hapus CSV jika mau reset harian
+	markReported(segments)
+	markReportedIn(ioSegmentDir, ioSegments)
 	fmt.Println("Selesai.")
 }
 
+// meanColumn: rata-rata kolom idx, nilai kosong / baris yang lebih pendek dilewati
+func meanColumn(rows [][]string, idx int) float64 {
+	var total, count float64
+	for _, row := range rows {
+		if idx >= len(row) {
+			continue
+		}
+		if v, err := strconv.ParseFloat(row[idx], 64); err == nil {
+			total += v
+			count++
+		}
+	}
+	if count == 0 {
+		return 0
+	}
+	return total / count
+}
+
+// writeIOTable: rata-rata / puncak per device dari baris ioColumns
+func writeIOTable(pdf *fpdf.Fpdf, ioRows [][]string) {
+	grouped := map[string][][]string{}
+	keys := []string{}
+	for _, row := range ioRows {
+		if len(row) < len(ioColumns) {
+			continue
+		}
+		key := row[1] + "\x00" + row[2]
+		if _, ok := grouped[key]; !ok {
+			keys = append(keys, key)
+		}
+		grouped[key] = append(grouped[key], row)
+	}
+	sort.Strings(keys)
+
+	pdf.Ln(8)
+	pdf.SetFont("Arial", "B", 12)
+	pdf.SetFillColor(230, 230, 230)
+	pdf.CellFormat(0, 10, "3. I/O per Device (rata-rata / puncak)", "1", 1, "L", true, 0, "")
+	pdf.Ln(2)
+
+	widths := []float64{30, 15, 35, 35, 22, 22}
+	pdf.SetFont("Arial", "B", 9)
+	for i, title := range []string{"Device", "Jenis", "R/RX (KB/s)", "W/TX (KB/s)", "IOPS/pkt", "Busy%"} {
+		ln := 0
+		if i == len(widths)-1 {
+			ln = 1
+		}
+		pdf.CellFormat(widths[i], 8, title, "1", ln, "C", false, 0, "")
+	}
+
+	pdf.SetFont("Arial", "", 9)
+	for _, key := range keys {
+		rows := grouped[key]
+		var maxIn, maxOut float64
+		for _, row := range rows {
+			if v, err := strconv.ParseFloat(row[3], 64); err == nil && v > maxIn {
+				maxIn = v
+			}
+			if v, err := strconv.ParseFloat(row[4], 64); err == nil && v > maxOut {
+				maxOut = v
+			}
+		}
+		busy := "-"
+		if rows[0][1] == "disk" {
+			busy = fmt.Sprintf("%.1f", meanColumn(rows, 7))
+		}
+		pdf.CellFormat(widths[0], 8, rows[0][2], "1", 0, "C", false, 0, "")
+		pdf.CellFormat(widths[1], 8, rows[0][1], "1", 0, "C", false, 0, "")
+		pdf.CellFormat(widths[2], 8, fmt.Sprintf("%.1f / %.1f", meanColumn(rows, 3)/1024, maxIn/1024), "1", 0, "C", false, 0, "")
+		pdf.CellFormat(widths[3], 8, fmt.Sprintf("%.1f / %.1f", meanColumn(rows, 4)/1024, maxOut/1024), "1", 0, "C", false, 0, "")
+		pdf.CellFormat(widths[4], 8, fmt.Sprintf("%.1f", meanColumn(rows, 5)+meanColumn(rows, 6)), "1", 0, "C", false, 0, "")
+		pdf.CellFormat(widths[5], 8, busy, "1", 1, "C", false, 0, "")
+	}
+}
+
 func sendToDiscordGolang(filename, todayStr string, avgRAM, avgTemp, avgDL, storagePercent float64) {
 	fmt.Println("🚀 Mengirim laporan ke Discord...")
 
@@ -0,0 +1,92 @@
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"math"
+	"os"
+	"strings"
+	"syscall"
+	"time"
+)
+
+// Span instrumentasi untuk mode --log, format sama dengan legacy-python/span_log.py.
+// Aktif hanya kalau MONITOR_SPAN_LOG di-set. Satu baris JSON = satu write
+// O_APPEND; span root ("log") membawa getrusage proses supaya
+// analysis-tools/parse_logs.py bisa membacanya seperti output /usr/bin/time -v.
+const spanApp = "golang"
+
+type tracer struct {
+	path    string
+	name    string
+	trace   string
+	started time.Time
+}
+
+func newTracer(name string) *tracer {
+	now := time.Now()
+	return &tracer{
+		path:    os.Getenv("MONITOR_SPAN_LOG"),
+		name:    name,
+		trace:   fmt.Sprintf("%d-%d", os.Getpid(), now.UnixMilli()),
+		started: now,
+	}
+}
+
+func (t *tracer) record(name string, started time.Time, parent interface{}) map[string]interface{} {
+	return map[string]interface{}{
+		"ts":     started.Format("2006-01-02 15:04:05"),
+		"trace":  t.trace,
+		"app":    spanApp,
+		"cmd":    strings.Join(os.Args, " "),
+		"span":   name,
+		"parent": parent,
+		"dur_ms": math.Round(float64(time.Since(started).Microseconds())) / 1000,
+	}
+}
+
+func (t *tracer) write(record map[string]interface{}) {
+	data, err := json.Marshal(record)
+	if err != nil {
+		return
+	}
+	file, err := os.OpenFile(t.path, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	if err != nil {
+		return
+	}
+	defer file.Close()
+	file.Write(append(data, '\n'))
+}
+
+// span mencatat satu fase: done := tr.span("speedtest"); ...; done()
+func (t *tracer) span(name string) func() {
+	started := time.Now()
+	return func() {
+		if t.path != "" {
+			t.write(t.record(name, started, t.name))
+		}
+	}
+}
+
+func (t *tracer) finish(exitStatus int) {
+	if t.path == "" {
+		return
+	}
+	record := t.record(t.name, t.started, nil)
+	record["exit_status"] = exitStatus
+	var ru syscall.Rusage
+	if err := syscall.Getrusage(syscall.RUSAGE_SELF, &ru); err == nil {
+		record["rusage"] = map[string]interface{}{
+			"max_rss_kb":                   ru.Maxrss,
+			"user_time_sec":                float64(ru.Utime.Sec) + float64(ru.Utime.Usec)/1e6,
+			"system_time_sec":              float64(ru.Stime.Sec) + float64(ru.Stime.Usec)/1e6,
+			"minor_page_faults":            ru.Minflt,
+			"major_page_faults":            ru.Majflt,
+			"voluntary_context_switches":   ru.Nvcsw,
+			"involuntary_context_switches": ru.Nivcsw,
+			"file_system_inputs":           ru.Inblock,
+			"file_system_outputs":          ru.Oublock,
+		}
+	}
+	t.write(record)
+}